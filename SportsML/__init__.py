@@ -3,8 +3,9 @@
 from .core import *
 from .parser import *
 from .sports_content import *
+from .live import LiveSession
 
 __version__ = VERSION
-__all__ = ('SportsContent', 'SportsMLParser', '__version__')
+__all__ = ('SportsContent', 'SportsMLParser', 'SportsMLPushParser', 'LiveSession', '__version__')
 __author__ = 'International Press Telecommuications Council'
 __license__ = "MIT"
@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .core import NEWSMLG2_NS, MANY, BaseObject, GenericArray
 from .sports_metadata import SportsMetadata
 from .event_metadata import EventMetadata
 from .base_metadata import CommonAttributes
@@ -216,29 +215,34 @@ class Action(ActionAttributes):
     """
     Any number of action inside the actions holder. An action can have any number of sub-actions.
     """
-    dict = {}
     sub_actions = None
     participants = None
 
-    def __init__(self, **kwargs):
-        super(Action, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            # sub-actions in another array
-            self.sub_actions = Actions(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'action')
-            )
-            self.participants = Participants(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'participant')
-            )
+    children = {
+        # sub-actions in another array
+        NEWSMLG2_NS+'action': ('sub_actions', 'Actions', MANY),
+        NEWSMLG2_NS+'participant': ('participants', 'Participants', MANY),
+    }
+
+    def participants_resolved(self):
+        """
+        Return the objects the participants of this action point to,
+        in order, with None for any that aren't in the document.
+        """
+        if not self.participants:
+            return []
+        return [
+            participant.resolve()
+            for participant in self.participants.array_contents
+        ]
 
-    def as_dict(self):
-        dict = super(Action, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Action, self)._as_dict(memoize)
         if self.sub_actions:
-            dict.update({ 'actions': self.sub_actions.as_dict() })
+            dict.update({ 'actions': self.sub_actions.as_dict(memoize) })
         if self.participants:
-            self.dict.update({ 'participants': self.participants.as_dict() })
-        return self.dict
+            dict.update({ 'participants': self.participants.as_dict(memoize) })
+        return dict
 
 
 class Actions(GenericArray):
@@ -246,6 +250,7 @@ class Actions(GenericArray):
     Array of Action objects.
     """
     element_class = Action
+    element_tag = NEWSMLG2_NS+'action'
 
 
 class CommonParticipantAttributes(BaseObject):
@@ -289,6 +294,20 @@ class Participant(CommonAttributes, ParticipantAttributes):
         'score_credit': 'scoreCredit'
     }
 
+    def resolve(self):
+        """
+        Return the player (or other object) that idref points to,
+        or None if it isn't in the document.
+        """
+        return self._resolve_reference(self.attr_values.get('idref'))
+
+    def resolve_team(self):
+        """
+        Return the team that team-idref points to,
+        or None if it isn't in the document.
+        """
+        return self._resolve_reference(self.attr_values.get('team-idref'))
+
 
 class Participants(GenericArray):
     """
@@ -0,0 +1,308 @@
+#!/usr/bin/env python
+
+"""
+Aggregation of stats over many documents, such as a season of matches.
+
+    totals = aggregate(glob.glob('season/*.xml'), entity='player', by='id')
+    totals['keys']['id']             # one entry per player
+    totals['games']                  # events each player has stats in
+    totals['sum']['spstat:score']    # goals over the season
+    totals['mean']['spstat:score']   # goals per row of stats
+    totals['per_game']['spstat:score']
+
+It works map-reduce style on the columns of stats_table(): each
+document is reduced to a small partial result holding, for each group
+and event, the sum and count of every numeric stat, and the partial
+results are merged. Documents given as filenames are parsed and
+reduced in worker processes, a chunk of files at a time.
+
+Each event is counted once: when several documents hold the same event
+key, such as revisions of a match kept in an archive, only the stats of
+the last of them (in the order of `documents`) are used. Stats with no
+event key count as an event of their own document.
+
+Unless the groups are by 'period', only the rows covering the whole
+event are used, as the rows of each period would count the same stats
+again; the rows of the periods are only added up for a player or team
+that has no row for the whole event.
+"""
+
+import array
+import collections
+import concurrent.futures
+import os
+
+from .backends import get_backend
+from .core import NEWSMLG2_NS
+from .parser import SportsMLParser
+from .sports_content import SportsContent
+from .stats_table import KEY_COLUMNS, stats_table
+from .workers import map_in_order
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numeric columns of stats_table()
+NUMERIC_TYPECODES = frozenset(('q', 'd'))
+
+
+def aggregate(documents, entity='player', by='id', workers=None,
+        chunk_size=16, backend=None):
+    """
+    Aggregate the stats of every player, or team with entity='team', in
+    `documents`, grouped by the key column(s) `by`: 'id', 'team',
+    'event' or 'period', or a tuple of them.
+
+    `documents` is an iterable of SportsContent objects, tables returned
+    by stats_table() and filenames. Files are handled by `workers`
+    processes (default: one per CPU), `chunk_size` files at a time, and
+    parsed with the XML `backend`.
+
+    Returns a dict with 'keys' (a list per key column), 'games' (the
+    number of events each group has stats in) and, for each numeric
+    stat, its 'sum', 'count' (values present), 'mean' (sum / count) and
+    'per_game' (sum / games), all one entry per group.
+    """
+    if entity not in KEY_COLUMNS:
+        raise Exception(
+            "Unknown entity '" + str(entity) + "', use one of: " +
+            ', '.join(KEY_COLUMNS)
+        )
+    if isinstance(by, str):
+        by = (by,)
+    for name in by:
+        if name not in KEY_COLUMNS[entity]:
+            raise Exception(
+                "Can't group " + entity + " stats by '" + str(name) +
+                "', use one of: " + ', '.join(KEY_COLUMNS[entity])
+            )
+    by = tuple(by)
+
+    total = {}
+    # (position in `documents`, filename)
+    files = []
+    for document, value in enumerate(documents):
+        if isinstance(value, str):
+            files.append((document, value))
+        elif isinstance(value, dict):
+            _merge(total, partial_aggregate(value, by, document))
+        else:
+            _merge(total, partial_aggregate(stats_table(value, entity), by, document))
+    if files:
+        for partial in _map_files(files, entity, by, workers, chunk_size, backend):
+            _merge(total, partial)
+    return _finish(total, by)
+
+
+def partial_aggregate(table, by, document=0):
+    """
+    Reduce `table`, as returned by stats_table(), to a partial result:
+    maps each group key (a tuple of the `by` columns) to {event key:
+    [document, {stat: sum}, {stat: count}]}. `document` is the position
+    of the table's document, which decides between revisions of the
+    same event; rows with no event key get the key (None, document).
+    Unless 'period' is in `by`, the rows of each period are left out for
+    the players or teams that have a row for the whole event.
+    """
+    groups = {}
+    group_index = array.array('q')
+    if not len(table['event']):
+        return {}
+    if 'period' not in by:
+        table = _whole_event_rows(table)
+    events = [
+        (None, document) if event_key is None else event_key
+        for event_key in table['event']
+    ]
+    for row_key in zip(zip(*[table[name] for name in by]), events):
+        group_index.append(groups.setdefault(row_key, len(groups)))
+    partial = {}
+    for group_key, event_key in groups:
+        partial.setdefault(group_key, {})[event_key] = [document, {}, {}]
+    group_keys = list(groups)
+    key_columns = set(KEY_COLUMNS['player'])
+    for column, values in table.items():
+        if column in key_columns or not _is_numeric(values):
+            continue
+        sums, counts = _group_sums(group_index, values, len(groups))
+        for position, (group_key, event_key) in enumerate(group_keys):
+            if counts[position]:
+                partial[group_key][event_key][1][column] = sums[position]
+                partial[group_key][event_key][2][column] = counts[position]
+    return partial
+
+
+def _whole_event_rows(table):
+    """
+    Return `table` without the rows of periods of the players (or teams)
+    of an event that have a row with no period.
+    """
+    entity_columns = [
+        table[name] for name in KEY_COLUMNS['player']
+        if name != 'period' and name in table
+    ]
+    entity_keys = list(zip(*entity_columns))
+    whole_event = {
+        entity_key for entity_key, period in zip(entity_keys, table['period'])
+        if period is None
+    }
+    positions = [
+        position for position, (entity_key, period)
+        in enumerate(zip(entity_keys, table['period']))
+        if period is None or entity_key not in whole_event
+    ]
+    if len(positions) == len(entity_keys):
+        return table
+    return {column: _take(values, positions) for column, values in table.items()}
+
+
+def _take(values, positions):
+    if isinstance(values, array.array):
+        return array.array(values.typecode, [values[position] for position in positions])
+    if np is not None and isinstance(values, np.ndarray):
+        return values[positions]
+    return [values[position] for position in positions]
+
+
+def _is_numeric(values):
+    if isinstance(values, array.array):
+        return values.typecode in NUMERIC_TYPECODES
+    return np is not None and isinstance(values, np.ndarray) and values.dtype.kind in 'if'
+
+
+def _group_sums(group_index, values, size):
+    """
+    Return the sum and the count of the values that aren't NaN in each
+    group, one column at a time.
+    """
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        index = np.frombuffer(group_index, dtype=np.int64)
+        present = ~np.isnan(values)
+        sums = np.bincount(index[present], weights=values[present], minlength=size)
+        counts = np.bincount(index[present], minlength=size)
+        return sums.tolist(), counts.tolist()
+    sums = [0.0] * size
+    counts = [0] * size
+    for position, value in zip(group_index, values):
+        # NaN is the only value not equal to itself
+        if value == value:
+            sums[position] += value
+            counts[position] += 1
+    return sums, counts
+
+
+def _merge(total, partial):
+    for group_key, events in partial.items():
+        group = total.setdefault(group_key, {})
+        for event_key, event in events.items():
+            if event_key not in group:
+                group[event_key] = event
+                continue
+            merged = group[event_key]
+            if event[0] > merged[0]:
+                # a later revision of the event
+                group[event_key] = event
+            elif event[0] == merged[0]:
+                for column, value in event[1].items():
+                    merged[1][column] = merged[1].get(column, 0.0) + value
+                for column, count in event[2].items():
+                    merged[2][column] = merged[2].get(column, 0) + count
+
+
+def _aggregate_files(files, entity, by, backend):
+    """
+    Parse and reduce `files`, (position, filename) pairs, into one
+    partial result. Runs in a worker process.
+    """
+    total = {}
+    backend = get_backend(backend)
+    for document, filename in files:
+        sports_content_element = SportsMLParser._find_sports_content(
+            backend.parse(filename), filename
+        )
+        # actions hold no stats, and are most of a play-by-play document:
+        # they are dropped before any object is built
+        for sports_event in sports_content_element.iter(NEWSMLG2_NS+'sports-event'):
+            for actions in sports_event.findall(NEWSMLG2_NS+'actions'):
+                sports_event.remove(actions)
+        sports_content = SportsContent(xmlelement = sports_content_element)
+        _merge(total, partial_aggregate(stats_table(sports_content, entity), by, document))
+    return total
+
+
+def _map_files(files, entity, by, workers, chunk_size, backend):
+    chunks = (
+        files[start:start + chunk_size]
+        for start in range(0, len(files), chunk_size)
+    )
+    workers = min(workers or os.cpu_count() or 1, -(-len(files) // chunk_size))
+    if workers == 1:
+        for chunk in chunks:
+            yield _aggregate_files(chunk, entity, by, backend)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial in map_in_order(
+            executor, _aggregate_files, chunks, 2 * workers, entity, by, backend
+        ):
+            yield partial
+
+
+def _finish(total, by):
+    # only the last revision of each event is counted, even for groups
+    # that aren't in it
+    latest = {}
+    for events in total.values():
+        for event_key, (document, sums, counts) in events.items():
+            if latest.get(event_key, -1) < document:
+                latest[event_key] = document
+    totals = {}
+    for group_key, events in total.items():
+        games = 0
+        group_sums = collections.defaultdict(float)
+        group_counts = collections.defaultdict(int)
+        for event_key, (document, sums, counts) in events.items():
+            if document != latest[event_key]:
+                continue
+            games += 1
+            for column, value in sums.items():
+                group_sums[column] += value
+            for column, count in counts.items():
+                group_counts[column] += count
+        if games:
+            totals[group_key] = (games, group_sums, group_counts)
+    # groups in a stable order, whatever order the documents came in
+    group_keys = sorted(totals, key=lambda group_key: tuple(
+        (value is None, value or '') for value in group_key
+    ))
+    columns = {}
+    for games, sums, counts in totals.values():
+        for column in sums:
+            columns[column] = None
+    columns = sorted(columns)
+    result = {
+        'keys': {
+            name: [group_key[position] for group_key in group_keys]
+            for position, name in enumerate(by)
+        },
+        'games': array.array('q', [totals[group_key][0] for group_key in group_keys]),
+        'sum': {},
+        'count': {},
+        'mean': {},
+        'per_game': {},
+    }
+    nan = float('nan')
+    for column in columns:
+        sums = array.array('d', [totals[group_key][1].get(column, 0.0) for group_key in group_keys])
+        counts = array.array('q', [totals[group_key][2].get(column, 0) for group_key in group_keys])
+        result['sum'][column] = sums
+        result['count'][column] = counts
+        result['mean'][column] = array.array('d', [
+            value / count if count else nan for value, count in zip(sums, counts)
+        ])
+        result['per_game'][column] = array.array('d', [
+            value / games if games else nan for value, games in zip(sums, result['games'])
+        ])
+    return result
@@ -1,6 +1,5 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
 from .core import NEWSMLG2_NS, GenericArray
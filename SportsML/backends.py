@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+"""
+XML backends used to turn SportsML documents into element trees.
+
+The standard library's ElementTree (with its C accelerator) is used
+by default. lxml can be used instead when it is installed, either per
+call (backend='lxml') or for the whole process with set_backend('lxml')
+or the SPORTSML_XML_BACKEND environment variable. Both backends drop
+comments and processing instructions, so they produce the same objects.
+"""
+
+import os
+import xml.etree.ElementTree as etree
+from xml.parsers import expat
+
+try:
+    import lxml.etree
+except ImportError:
+    lxml = None
+
+
+# expat errors for documents that stop before their end
+PREMATURE_END_ERRORS = frozenset(expat.errors.codes[message] for message in (
+    expat.errors.XML_ERROR_NO_ELEMENTS, expat.errors.XML_ERROR_UNCLOSED_TOKEN,
+    expat.errors.XML_ERROR_PARTIAL_CHAR, expat.errors.XML_ERROR_UNCLOSED_CDATA_SECTION,
+))
+
+
+class EtreeBackend(object):
+    """
+    xml.etree.ElementTree from the standard library.
+    """
+    name = 'etree'
+    element_type = etree.Element
+
+    def parse(self, source):
+        return etree.parse(source).getroot()
+
+    def fromstring(self, text):
+        return etree.fromstring(text)
+
+    def iterparse(self, source, events):
+        return etree.iterparse(source, events=events)
+
+    def pullparser(self, events):
+        # fed with feed(), events come from read_events()
+        return etree.XMLPullParser(events=events)
+
+    def ended_early(self, error, end):
+        """
+        Whether the ParseError `error`, raised when closing a pull
+        parser, comes from the document stopping before its end.
+        `end` is the line and column where the data fed ends.
+        """
+        return error.code in PREMATURE_END_ERRORS
+
+    def signature(self, xmlelement):
+        # equal for elements that give the same objects: the tag,
+        # attributes, text and number of children of every element, which
+        # is much cheaper than serialising it with the pure Python
+        # etree.tostring()
+        return tuple(
+            (element.tag, tuple(element.attrib.items()), element.text, len(element))
+            for element in xmlelement.iter()
+        )
+
+
+class LxmlBackend(object):
+    """
+    lxml.etree, only available when lxml is installed.
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        if lxml is None:
+            raise Exception("The lxml backend needs lxml to be installed.")
+        self.element_type = lxml.etree._Element
+        # ElementTree leaves out comments and processing instructions,
+        # so we do too: GenericArray would make objects out of them
+        self.parser = lxml.etree.XMLParser(
+            remove_comments=True, remove_pis=True, huge_tree=True
+        )
+
+    def parse(self, source):
+        return lxml.etree.parse(source, self.parser).getroot()
+
+    def fromstring(self, text):
+        if isinstance(text, str):
+            # lxml refuses str input that has an encoding declaration
+            text = text.encode('utf-8')
+        return lxml.etree.fromstring(text, self.parser)
+
+    def iterparse(self, source, events):
+        return lxml.etree.iterparse(
+            source, events=events,
+            remove_comments=True, remove_pis=True, huge_tree=True
+        )
+
+    def pullparser(self, events):
+        return lxml.etree.XMLPullParser(
+            events=events,
+            remove_comments=True, remove_pis=True, huge_tree=True
+        )
+
+    def ended_early(self, error, end):
+        if error.code in (
+            lxml.etree.ErrorTypes.ERR_DOCUMENT_EMPTY, lxml.etree.ErrorTypes.ERR_TAG_NOT_FINISHED
+        ):
+            return True
+        # in the middle of a tag, libxml2 reports what it was expecting
+        # next, at the end of the data; an error found earlier is a real
+        # syntax error (columns are counted in characters)
+        line, column = error.position
+        return line == end[0] and column >= end[1]
+
+    def signature(self, xmlelement):
+        # lxml serialises in C, faster than reading each element from
+        # Python
+        return lxml.etree.tostring(xmlelement, with_tail=False)
+
+
+BACKENDS = {
+    'etree': EtreeBackend,
+    'lxml': LxmlBackend,
+}
+
+# element classes of every backend that can be loaded here
+ELEMENT_TYPES = (etree.Element,)
+if lxml is not None:
+    ELEMENT_TYPES += (lxml.etree._Element,)
+
+_backends = {}
+_default_backend_name = os.environ.get('SPORTSML_XML_BACKEND', 'etree')
+
+
+def get_backend(name=None):
+    """
+    Return the backend called `name`, or the default backend.
+    """
+    name = name or _default_backend_name
+    if name not in _backends:
+        if name not in BACKENDS:
+            raise Exception(
+                "Unknown XML backend '" + name + "', use one of: " +
+                ', '.join(BACKENDS)
+            )
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def set_backend(name):
+    """
+    Make `name` the default backend for this process.
+    """
+    global _default_backend_name
+    get_backend(name)
+    _default_backend_name = name
+
+
+def available_backends():
+    """
+    Names of the backends that can be used here.
+    """
+    return [name for name in BACKENDS if name != 'lxml' or lxml is not None]
+
+
+def is_element(xmlelement):
+    """
+    Whether `xmlelement` is an element from any backend.
+    """
+    return isinstance(xmlelement, ELEMENT_TYPES)
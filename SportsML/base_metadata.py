@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .core import NEWSMLG2_NS, MANY, WRAPPER, BaseObject, GenericArray
 
 
 class CommonAttributes(BaseObject):
@@ -90,24 +89,18 @@ class BaseMetadata(CommonAttributes, CoverageAttributes):
     sports_content_codes = None
     sports_properties = None
 
-    def __init__(self, **kwargs):
-        super(BaseMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.sports_content_codes = SportsContentCodes(
-                xmlarray = xmlelement.find(NEWSMLG2_NS+'sports-content-codes')
-            )
-            self.sports_properties = SportsProperties(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-property')
-            )
-
-    def as_dict(self):
-        super(BaseMetadata, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'sports-content-codes': ('sports_content_codes', 'SportsContentCodes', WRAPPER),
+        NEWSMLG2_NS+'sports-property': ('sports_properties', 'SportsProperties', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(BaseMetadata, self)._as_dict(memoize)
         if self.sports_content_codes:
-            self.dict.update({ 'sportsContentCodes': self.sports_content_codes.as_dict() })
+            dict.update({ 'sportsContentCodes': self.sports_content_codes.as_dict(memoize) })
         if self.sports_properties:
-            self.dict.update({ 'sportsProperties': self.sports_properties.as_dict() })
-        return self.dict
+            dict.update({ 'sportsProperties': self.sports_properties.as_dict(memoize) })
+        return dict
 
 
 class Base2Metadata(BaseMetadata):
@@ -121,32 +114,21 @@ class Base2Metadata(BaseMetadata):
         'key': 'key'
     }
 
-    def __init__(self, **kwargs):
-        super(Base2Metadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            from .newsmlg2 import Names
-            from .entities import Sites
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
-            self.sites = Sites(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'site')
-            )
-            from .sports_events import Awards
-            self.awards = Awards(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'award')
-            )
-
-    def as_dict(self):
-        super(Base2Metadata, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'name': ('names', '.newsmlg2.Names', MANY),
+        NEWSMLG2_NS+'site': ('sites', '.entities.Sites', MANY),
+        NEWSMLG2_NS+'award': ('awards', '.sports_events.Awards', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Base2Metadata, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({'names': self.names.as_dict() })
+            dict.update({'names': self.names.as_dict(memoize) })
         if self.sites:
-            self.dict.update({'sites': self.sites.as_dict() })
+            dict.update({'sites': self.sites.as_dict(memoize) })
         if self.awards:
-            self.dict.update({'awards': self.awards.as_dict() })
-        return self.dict
+            dict.update({'awards': self.awards.as_dict(memoize) })
+        return dict
 
 
 class SportsContentQualifier(CommonAttributes):
@@ -201,19 +183,15 @@ class SportsContentCode(CommonAttributes):
         'code-name': 'codeName'
     }
 
-    def __init__(self, **kwargs):
-        super(SportsContentCode, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.sports_content_qualifiers = SportsContentQualifiers(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-content-qualifier')
-            )
+    children = {
+        NEWSMLG2_NS+'sports-content-qualifier': ('sports_content_qualifiers', SportsContentQualifiers, MANY),
+    }
 
-    def as_dict(self):
-        super(SportsContentCode, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(SportsContentCode, self)._as_dict(memoize)
         if self.sports_content_qualifiers:
-            self.dict.update({ 'sportsContentQualifiers': self.sports_content_qualifiers.as_dict() })
-        return self.dict
+            dict.update({ 'sportsContentQualifiers': self.sports_content_qualifiers.as_dict(memoize) })
+        return dict
 
 
 class SportsContentCodes(GenericArray):
@@ -222,6 +200,7 @@ class SportsContentCodes(GenericArray):
     Can hold as many codes as needed to describe all contents at this level and below.
     """
     element_class = SportsContentCode
+    element_tag = NEWSMLG2_NS+'sports-content-code'
 
 
 class SportsProperties(GenericArray):
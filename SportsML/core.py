@@ -1,67 +1,777 @@
 #!/usr/bin/env python
 
 import importlib
-import xml.etree.ElementTree as etree
+import io
+import json
+import threading
+
+from . import interning
+from .backends import ELEMENT_TYPES
 
 NEWSMLG2_NS = '{http://iptc.org/std/nar/2006-10-01/}'
 NITF_NS = '{http://iptc.org/std/NITF/2006-10-18/}'
 
 VERSION = 0.1
 
+# The (ids, keys) index of the SportsContent being built in each thread,
+# filled by BaseObject.__init__. See SportsContent.get_by_id().
+_id_indexes = threading.local()
+
+# Whether the objects being built in each thread leave the children
+# named in their class's 'lazy_children' to be built on first access.
+# Set by SportsContent(lazy=True).
+_lazy_building = threading.local()
+
+# Functions called with each subclass of BaseObject once it is set up,
+# such as instrumentation's, to handle classes defined later on.
+_subclass_hooks = []
+
+# How a child element listed in a class's 'children' table is turned
+# into the value of its attribute:
+# ONE: the first matching element, passed to the class as xmlelement
+ONE = 'one'
+# MANY: a list of every matching element, passed to the class as xmlarray
+MANY = 'many'
+# WRAPPER: the first matching element, passed to the class as xmlarray,
+# so that the wrapper's own children become the array contents
+WRAPPER = 'wrapper'
+# TEXT: the text of the first matching element ('' if it has none),
+# no class is used
+TEXT = 'text'
+
+# Passed as as_dict's 'memoize' argument by write_json: every object then
+# stands for itself in its parent's dict instead of being serialised, so
+# only the dicts on the path being written exist at any time.
+SHALLOW = 'shallow'
+
 class BaseObject():
     attr_values = {}
     attribute_types = {}
-    dict = {}
+    # 'attributes' and 'attribute_types' merged across the MRO chain,
+    # compiled once per class in __init_subclass__.
+    # Tuple of (xml attribute, json property, property type) triples.
+    _attribute_table = ()
+    # Tuple of (xml attribute, property type) pairs.
+    _attribute_types = ()
+    # Maps each xml attribute to its position in _attribute_table.
+    _attribute_index = {}
+    # 'children' merged across the MRO chain, compiled once per class in
+    # __init_subclass__: maps each child tag to
+    # (attribute, class or class name, cardinality, module name).
+    _child_specs = {}
+    # _child_specs with class names resolved to classes, built on first use.
+    _child_table = None
+    # Maps each property of the SportsJS output to where it comes from,
+    # built on first use by _get_json_table().
+    _json_table = None
+    # Whether as_dict() would return an empty dict. Worked out while the
+    # object is built, so that truth tests don't have to serialise it.
+    _empty = True
+    # The object whose as_dict output includes this one, if any.
+    _parent = None
+    # Cached result of as_dict(memoize=True), cleared by _invalidate().
+    _dict_cache = None
+    # Cached result of _subtree_hash(), cleared by _invalidate().
+    _hash_cache = None
+    # Name of the attribute holding the text of the element, for classes
+    # that keep it, so that write_xml can write it back.
+    text_attribute = None
+    # Attributes of the 'children' table that are only built when first
+    # read, for objects built with SportsContent(lazy=True).
+    lazy_children = ()
+    # The children not built yet, by attribute: (child class,
+    # cardinality, matching element or elements).
+    _pending = None
 
-    # Load all 'attributes' from any class in the MRO inheritance chain
-    @classmethod
-    def get_attributes(cls):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
         all_attrs = {}
+        all_attr_types = {}
+        all_children = {}
         for otherclass in reversed(cls.__mro__):
-            attrs = vars(otherclass).get('attributes', {})
-            all_attrs.update(attrs)
-        return all_attrs
+            all_attrs.update(vars(otherclass).get('attributes', {}))
+            all_attr_types.update(vars(otherclass).get('attribute_types', {}))
+            for tag, (attribute, child_class, cardinality) in vars(otherclass).get('children', {}).items():
+                all_children[tag] = (
+                    attribute, child_class, cardinality, otherclass.__module__
+                )
+        cls._attribute_table = tuple(
+            (xml_attribute, json_property, all_attr_types.get(xml_attribute))
+            for xml_attribute, json_property in all_attrs.items()
+        )
+        cls._attribute_types = tuple(all_attr_types.items())
+        cls._attribute_index = {
+            xml_attribute: position
+            for position, (xml_attribute, json_property, property_type)
+            in enumerate(cls._attribute_table)
+        }
+        cls._child_specs = all_children
+        cls._child_table = None
+        cls._json_table = None
+        # lazy children are read through a _LazyChild, which builds them
+        for attribute in vars(cls).get('lazy_children', ()):
+            setattr(cls, attribute, _LazyChild(attribute))
+        for hook in _subclass_hooks:
+            hook(cls)
 
-    # Load all 'attribute_types' from any class in the MRO inheritance chain
+    @classmethod
+    def _get_child_table(cls):
+        """
+        Return the 'children' table of this class with every class
+        given by name resolved to the class. A plain name refers to a
+        class defined later in the declaring module, a relative name
+        such as '.entities.Sites' to a class in a module that can't be
+        imported yet by the declaring module.
+        """
+        if cls._child_table is None:
+            child_table = {}
+            for tag, (attribute, child_class, cardinality, module_name) in cls._child_specs.items():
+                if isinstance(child_class, str):
+                    class_module, _, class_name = child_class.rpartition('.')
+                    child_class = getattr(
+                        importlib.import_module(
+                            class_module or module_name,
+                            module_name.rpartition('.')[0]
+                        ),
+                        class_name
+                    )
+                child_table[tag] = (attribute, child_class, cardinality)
+            cls._child_table = child_table
+        return cls._child_table
+
+    @classmethod
+    def _get_json_table(cls):
+        """
+        Return the reverse of the SportsJS output of this class: maps
+        each JSON property to (xml attribute, None) or to (child tag,
+        cardinality). The properties of child objects are only known to
+        _as_dict, so it is run once with a marker in place of each child
+        to find them.
+        """
+        if cls._json_table is None:
+            json_table = {}
+            for xml_attribute, json_property, property_type in cls._attribute_table:
+                json_table.setdefault(json_property, (xml_attribute, None))
+            child_table = cls._get_child_table()
+            if child_table:
+                probe = cls.__new__(cls)
+                probe.attr_values = {}
+                for tag, (attribute, child_class, cardinality) in child_table.items():
+                    setattr(probe, attribute, _ChildMarker(tag))
+                for json_property, value in (probe._as_dict(False) or {}).items():
+                    if isinstance(value, _ChildMarker):
+                        json_table[json_property] = (str(value), child_table[value][2])
+            cls._json_table = json_table
+        return cls._json_table
+
+    # All 'attributes' from any class in the MRO inheritance chain
+    @classmethod
+    def get_attributes(cls):
+        return {
+            xml_attribute: json_property
+            for xml_attribute, json_property, property_type in cls._attribute_table
+        }
+
+    # All 'attribute_types' from any class in the MRO inheritance chain
     @classmethod
     def get_attribute_types(cls):
-        all_attr_types = {}
-        for otherclass in reversed(cls.__mro__):
-            attr_types = vars(otherclass).get('attribute_types', {})
-            all_attr_types.update(attr_types)
-        return all_attr_types
+        return dict(cls._attribute_types)
 
     def __init__(self, **kwargs):
         # this is our base object, we don't call super() from here
-        self.dict = {}
         self.attr_values = {}
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            attrs = self.get_attributes()
-            if attrs:
-                for xml_attribute, json_attribute in attrs.items():
-                    self.attr_values[xml_attribute] = xmlelement.get(xml_attribute)
+        # elements from any backend, see backends.py
+        if isinstance(xmlelement, ELEMENT_TYPES):
+            # only keep the declared attributes that are actually set
+            attribute_index = self._attribute_index
+            strings = interning.table
+            if strings is None:
+                self.attr_values = {
+                    xml_attribute: value
+                    for xml_attribute, value in xmlelement.attrib.items()
+                    if xml_attribute in attribute_index
+                }
+            else:
+                # same as strings.intern(), inlined as this runs for
+                # every object
+                intern = strings.setdefault
+                self.attr_values = {
+                    xml_attribute: intern(value, value)
+                    for xml_attribute, value in xmlelement.attrib.items()
+                    if xml_attribute in attribute_index
+                }
+                strings.lookups += len(self.attr_values)
+                if len(strings) > strings.max_size:
+                    strings.reset()
+            if any(self.attr_values.values()):
+                self._empty = False
+                if 'id' in self.attr_values or 'key' in self.attr_values:
+                    self._add_to_id_index()
+            if self._child_specs:
+                self._build_children(xmlelement)
+
+    def _add_to_id_index(self):
+        """
+        Record this object's id and metadata key in the index of the
+        SportsContent being built in this thread, if there is one.
+        """
+        id_index = getattr(_id_indexes, 'current', None)
+        if id_index is not None:
+            ids, keys = id_index
+            attr_values = self.attr_values
+            # the first object with an id or key wins, as in a tree walk
+            if attr_values.get('id'):
+                ids.setdefault(attr_values['id'], self)
+            if attr_values.get('key'):
+                keys.setdefault(attr_values['key'], self)
+
+    def _build_children(self, xmlelement):
+        """
+        Build the child objects listed in the 'children' table from
+        `xmlelement`, looking at each of its children only once.
+        Every attribute in the table is set, even when no matching
+        element exists, exactly as find()/findall() would do.
+        """
+        child_table = self._get_child_table()
+        found = {}
+        for child in xmlelement:
+            entry = child_table.get(child.tag)
+            if entry is None:
+                continue
+            if entry[2] == MANY:
+                found.setdefault(child.tag, []).append(child)
+            elif child.tag not in found:
+                found[child.tag] = child
+        lazy_children = self.lazy_children
+        if lazy_children and getattr(_lazy_building, 'enabled', False):
+            pending = {}
+        else:
+            lazy_children = pending = None
+        # same as _track_content, inlined as this runs for every object
+        empty = self._empty
+        for tag, (attribute, child_class, cardinality) in child_table.items():
+            match = found.get(tag)
+            if pending is not None and attribute in lazy_children:
+                pending[attribute] = (child_class, cardinality, match)
+                continue
+            value = self._build_child(child_class, cardinality, match)
+            setattr(self, attribute, value)
+            if empty and value:
+                empty = False
+        if pending:
+            self._pending = pending
+            if empty:
+                # only building the children found tells whether the
+                # object is empty
+                for attribute, (child_class, cardinality, match) in list(pending.items()):
+                    if match is not None and getattr(self, attribute):
+                        empty = False
+                        break
+        self._empty = empty
 
-    def as_dict(self):
+    def _build_child(self, child_class, cardinality, match):
+        """
+        Return the value of a child attribute of kind `cardinality`,
+        built from `match`: the element found for it, the list of them
+        for MANY, or None.
+        """
+        if cardinality == TEXT:
+            return None if match is None else interning.intern(match.text or '')
+        if cardinality == MANY:
+            value = child_class(xmlarray = match or [])
+        elif cardinality == ONE:
+            value = child_class(xmlelement = match)
+        else:
+            value = child_class(xmlarray = match)
+        value._parent = self
+        return value
+
+    def _build_pending(self, attribute):
+        """
+        Build the lazy child `attribute` from the element kept for it, as
+        _build_children would have, and store it.
+        """
+        child_class, cardinality, match = self._pending.pop(attribute)
+        outer_id_index = getattr(_id_indexes, 'current', None)
+        outer_lazy = getattr(_lazy_building, 'enabled', False)
+        # the document's id index is built by a walk once lazy children
+        # exist, and children of lazy children are lazy too
+        _id_indexes.current = None
+        _lazy_building.enabled = True
+        try:
+            value = self._build_child(child_class, cardinality, match)
+        finally:
+            _id_indexes.current = outer_id_index
+            _lazy_building.enabled = outer_lazy
+        self.__dict__[attribute] = value
+        return value
+
+    def _build_all_pending(self):
+        """
+        Build every lazy child not built yet, before walking the object.
+        """
+        if self._pending:
+            for attribute in list(self._pending):
+                self._build_pending(attribute)
+
+    @classmethod
+    def from_dict(cls, value):
+        """
+        Build an object of this class from `value`, its SportsJS
+        representation as given by as_dict().
+        """
+        new_object = cls()
+        new_object._load_dict(value, False)
+        return new_object
+
+    def _load_dict(self, value, consume):
+        """
+        Set this object up from its SportsJS representation `value`, as
+        __init__ does from an element: the same attributes are set to the
+        same kind of objects. With `consume`, `value` is emptied once it
+        has been used so that its memory can be freed early.
+        """
+        json_table = self._get_json_table()
+        attr_values = {}
+        found = {}
+        for json_property, item in (value or {}).items():
+            entry = json_table.get(json_property)
+            if entry is None:
+                continue
+            if entry[1] is None:
+                attr_values[entry[0]] = interning.intern(
+                    item if isinstance(item, str) else str(item)
+                )
+            else:
+                found[entry[0]] = item
+        self.attr_values = attr_values
+        if any(attr_values.values()):
+            self._empty = False
+            if 'id' in attr_values or 'key' in attr_values:
+                self._add_to_id_index()
+        empty = self._empty
+        for tag, (attribute, child_class, cardinality) in self._get_child_table().items():
+            item = found.get(tag)
+            if cardinality == TEXT:
+                child = item
+            else:
+                child = child_class()
+                # a child that isn't in the output stays empty, as for a
+                # missing element
+                if item is None:
+                    pass
+                elif isinstance(child, GenericArray):
+                    child._load_list(item, consume)
+                elif cardinality == ONE:
+                    child._load_dict(item, consume)
+                child._parent = self
+            setattr(self, attribute, child)
+            if empty and child:
+                empty = False
+        self._empty = empty
+        if consume and value:
+            value.clear()
+
+    def _track_content(self, *values):
+        """
+        Record the content this object outputs from `values` (child
+        objects or text). Child objects are linked back to this object,
+        and the object stops being empty if any value is truthy.
+        Child objects are already complete, so their truth test is O(1).
+        """
+        for value in values:
+            if isinstance(value, BaseObject):
+                value._parent = self
+            if value:
+                self._empty = False
+
+    def _set_child(self, name, value):
+        """
+        Replace the child object stored in attribute `name`, keeping
+        emptiness and cached dicts up to date. Used by the set_* methods.
+        """
+        if self._pending:
+            self._pending.pop(name, None)
+        setattr(self, name, value)
+        self._track_content(value)
+        self._invalidate()
+        # the id index of the document no longer matches its tree
+        self._root().__dict__.pop('_id_index', None)
+
+    def _invalidate(self):
+        """
+        Drop the cached dict and hash of this object and of every object
+        whose output includes it.
+        """
+        node = self
+        while node is not None:
+            node._dict_cache = None
+            node._hash_cache = None
+            node = node._parent
+
+    def _subtree_hash(self):
+        """
+        Return a hash of this object and everything inside it, worked
+        out from the hashes of its children and cached, so that diff()
+        can skip unchanged subtrees. Objects of the same class built
+        from the same XML hash equally.
+        """
+        if self._hash_cache is None:
+            self._build_all_pending()
+            state = [type(self)]
+            # by name, as lazy children are stored in the order they are read
+            for name, value in sorted(vars(self).items()):
+                if name.startswith('_'):
+                    continue
+                if isinstance(value, BaseObject):
+                    state.append(value._subtree_hash())
+                elif isinstance(value, dict):
+                    state.append(tuple(value.items()))
+                elif isinstance(value, list):
+                    state.append(tuple(item._subtree_hash() for item in value))
+                else:
+                    state.append(value)
+            self._hash_cache = hash(tuple(state))
+        return self._hash_cache
+
+    def _root(self):
+        """
+        Return the outermost object that this object is part of.
+        """
+        node = self
+        while node._parent is not None:
+            node = node._parent
+        return node
+
+    def _children(self):
+        """
+        Yield the child objects of this object: those in the 'children'
+        table first, in its order, which is the order they are built in
+        whether or not they were built lazily, then any others.
+        """
+        self._build_all_pending()
+        values = vars(self)
+        table_attributes = set()
+        for attribute, child_class, cardinality in self._get_child_table().values():
+            value = values.get(attribute)
+            if isinstance(value, BaseObject) and attribute not in table_attributes:
+                table_attributes.add(attribute)
+                yield value
+        for name, value in values.items():
+            if (isinstance(value, BaseObject) and not name.startswith('_')
+                    and name not in table_attributes):
+                yield value
+
+    def _resolve_reference(self, reference):
+        """
+        Look up `reference` (an id or a metadata key) in the index of
+        the document this object is part of. Returns None when nothing
+        matches, or when the object isn't part of a SportsContent.
+        """
+        if not reference:
+            return None
+        get_by_id = getattr(self._root(), 'get_by_id', None)
+        if get_by_id is None:
+            return None
+        return get_by_id(reference)
+
+    def as_dict(self, memoize=False):
+        """
+        Return the SportsJS representation of this object.
+
+        By default a fresh structure is built and nothing is kept.
+        With memoize=True the result for this object and every object
+        inside it is cached, so later calls only rebuild the parts that
+        a set_* method has changed since. Cached results are shared and
+        must not be modified by the caller.
+        """
+        if memoize is SHALLOW:
+            return self
+        if not memoize:
+            return self._as_dict(False)
+        if self._dict_cache is None:
+            self._dict_cache = self._as_dict(True)
+        return self._dict_cache
+
+    def _as_dict(self, memoize):
         # this is our base object, we don't call super() from here
-        attrs = self.get_attributes()
-        attr_types = self.get_attribute_types()
-        if attrs:
-            for xml_attribute, json_property in attrs.items():
-                if xml_attribute in self.attr_values and self.attr_values[xml_attribute]:
-                    property_value =  self.attr_values[xml_attribute]
-                    property_type = attr_types.get(xml_attribute, None)
-                    if property_type == "integer":
-                        property_value = int(property_value)
-                    self.dict.update({ json_property: property_value })
-        return self.dict
+        dict = {}
+        attribute_index = self._attribute_index
+        # output follows the declaration order, not the document order
+        positions = [
+            attribute_index[xml_attribute] for xml_attribute in self.attr_values
+            if xml_attribute in attribute_index
+        ]
+        positions.sort()
+        for position in positions:
+            xml_attribute, json_property, property_type = self._attribute_table[position]
+            property_value = self.attr_values[xml_attribute]
+            if property_value:
+                if property_type == "integer":
+                    property_value = int(property_value)
+                dict[json_property] = property_value
+        return dict
+
+    def write_json(self, fp, compact=True):
+        """
+        Write the SportsJS representation of this object to `fp`, a
+        text or binary file object or a socket, while walking the
+        object tree. The full as_dict() structure is never built.
+        Output is compact unless compact=False, which gives the same
+        text as to_json().
+        """
+        _JSONWriter(fp, compact).write(self)
 
     def __bool__(self):
-        dict = self.as_dict()
-        if dict != {}:
-            return True
+        return not self._empty
+
+
+class _LazyChild(object):
+    """
+    Stands for a child named in 'lazy_children' on the class: reading it
+    builds the child from the element kept by _build_children, and
+    stores it on the object, where later reads find it directly.
+    Objects that have no element kept for it read None.
+    """
+
+    def __init__(self, attribute):
+        self.attribute = attribute
+
+    def __get__(self, instance, owner):
+        if instance is None or not instance._pending or self.attribute not in instance._pending:
+            return None
+        return instance._build_pending(self.attribute)
+
+
+class _ChildMarker(str):
+    """
+    Stands in for a child object, or text, while _get_json_table() finds
+    out where it goes in the output: it is the tag of the child and it
+    serialises to itself.
+    """
+    def as_dict(self, memoize=False):
+        return self
+
+
+class _BufferedWriter(object):
+    """
+    Collects text in chunks and writes it to a text or binary file
+    object, or a socket (as UTF-8), once enough has been collected.
+    """
+    # characters to collect before writing them out
+    buffer_size = 65536
+
+    def __init__(self, fp):
+        if isinstance(fp, io.TextIOBase):
+            self.encoding = None
         else:
-            return False
+            # binary files and sockets
+            self.encoding = 'utf-8'
+        self.output = getattr(fp, 'write', None) or fp.sendall
+        self.chunks = []
+        self.size = 0
+
+    def _emit(self, chunk):
+        self.chunks.append(chunk)
+        self.size += len(chunk)
+        if self.size >= self.buffer_size:
+            self._flush()
+
+    def _flush(self):
+        data = ''.join(self.chunks)
+        self.chunks = []
+        self.size = 0
+        if data:
+            if self.encoding:
+                data = data.encode(self.encoding)
+            self.output(data)
+
+
+class _JSONWriter(_BufferedWriter):
+    """
+    Writes the SportsJS representation of an object tree in chunks.
+    Values are formatted as json.dumps() would, with indent=4 or with
+    the most compact separators.
+    """
+
+    def __init__(self, fp, compact):
+        super(_JSONWriter, self).__init__(fp)
+        self.compact = compact
+
+    def write(self, value):
+        self._write_value(value, '\n')
+        self._flush()
+
+    def _write_value(self, value, newline):
+        # `newline` is what goes before a line at the current depth
+        # when pretty-printing
+        if isinstance(value, BaseObject):
+            value = value._as_dict(SHALLOW)
+        if isinstance(value, dict):
+            self._write_container('{', '}', value.items(), newline)
+        elif isinstance(value, list):
+            self._write_container('[', ']', value, newline)
+        elif isinstance(value, str):
+            self._emit(json.encoder.encode_basestring_ascii(value))
+        else:
+            self._emit(json.dumps(value))
+
+    def _write_container(self, opening, closing, items, newline):
+        if not items:
+            self._emit(opening + closing)
+            return
+        is_dict = opening == '{'
+        if self.compact:
+            item_newline = newline
+            separator = ','
+            key_separator = ':'
+        else:
+            item_newline = newline + '    '
+            separator = ',' + item_newline
+            key_separator = ': '
+        self._emit(opening if self.compact else opening + item_newline)
+        first = True
+        for item in items:
+            if not first:
+                self._emit(separator)
+            first = False
+            if is_dict:
+                key, item = item
+                self._emit(
+                    json.encoder.encode_basestring_ascii(key) + key_separator
+                )
+            self._write_value(item, item_newline)
+        self._emit(closing if self.compact else newline + closing)
+
+
+class _XMLWriter(_BufferedWriter):
+    """
+    Writes an object tree back to SportsML-G2 XML in chunks, driven by
+    the same 'attributes' and 'children' tables the objects were built
+    from. Only what the objects hold is written: elements that end up
+    with no attributes, text or children are left out, as parsing them
+    gives the same objects as leaving them out.
+    """
+    # prefixes for the namespaces other than SportsML-G2's
+    prefixes = {
+        NITF_NS: 'nitf',
+    }
+
+    def __init__(self, fp):
+        super(_XMLWriter, self).__init__(fp)
+        # (start tag without its closing '>', name, whether it has to be
+        # written even if nothing goes in it) of the open elements
+        self.stack = []
+        # how many elements of the stack have been written out: they
+        # always come first, the others may still turn out to be empty
+        self.opened = 0
+        self.names = {}
+
+    def write(self, value, tag):
+        if self.encoding:
+            self._emit('<?xml version="1.0" encoding="UTF-8"?>\n')
+        else:
+            self._emit('<?xml version="1.0"?>\n')
+        self._start(tag, value.attr_values, ' xmlns="' + NEWSMLG2_NS[1:-1] + '"')
+        self._write_content(value)
+        self._end(force=True)
+        self._emit('\n')
+        self._flush()
+
+    def _name(self, tag):
+        """
+        Return the name to write for `tag` and the namespace declaration
+        it needs, if any.
+        """
+        if tag not in self.names:
+            namespace, _, local_name = tag[1:].rpartition('}')
+            if tag.startswith(NEWSMLG2_NS):
+                self.names[tag] = (local_name, '')
+            elif not tag.startswith('{'):
+                self.names[tag] = (tag, ' xmlns=""')
+            else:
+                prefix = self.prefixes.get('{' + namespace + '}', 'ns0')
+                self.names[tag] = (
+                    prefix + ':' + local_name,
+                    ' xmlns:' + prefix + '=' + _escape_attribute(namespace)
+                )
+        return self.names[tag]
+
+    def _start(self, tag, attr_values, declarations=''):
+        name, declaration = self._name(tag)
+        start = '<' + name + declarations + declaration + ''.join([
+            ' ' + xml_attribute + '=' + _escape_attribute(str(value))
+            for xml_attribute, value in attr_values.items()
+            if value is not None
+        ])
+        # elements with attributes are always written
+        self.stack.append((start, name, bool(attr_values)))
+
+    def _open(self):
+        # write out the start tags still pending
+        stack = self.stack
+        for position in range(self.opened, len(stack)):
+            self._emit(stack[position][0] + '>')
+        self.opened = len(stack)
+
+    def _end(self, force=False):
+        start, name, keep = self.stack.pop()
+        if self.opened > len(self.stack):
+            self.opened -= 1
+            self._emit('</' + name + '>')
+        elif force or keep:
+            self._open()
+            self._emit(start + '/>')
+
+    def _text(self, text):
+        if text:
+            self._open()
+            self._emit(_escape_text(text))
+
+    def _write_object(self, value, tag, force=False):
+        self._start(tag, value.attr_values)
+        self._write_content(value)
+        self._end(force)
+
+    def _write_content(self, value):
+        if value.text_attribute:
+            self._text(getattr(value, value.text_attribute))
+        for tag, (attribute, child_class, cardinality) in value._get_child_table().items():
+            child = getattr(value, attribute, None)
+            if child is None:
+                continue
+            if cardinality == TEXT:
+                # the element itself tells '' from None
+                self._start(tag, {})
+                self._text(child)
+                self._end(force=True)
+            elif not isinstance(child, GenericArray):
+                if cardinality == ONE:
+                    # some objects are output whenever their element is
+                    # there, even with nothing in it
+                    self._write_object(child, tag, force=bool(child))
+            elif cardinality == MANY:
+                # each element of the array stands for an element, so it
+                # is written even when it holds nothing
+                for item in child.array_contents:
+                    self._write_object(item, tag, force=True)
+            elif cardinality == WRAPPER:
+                self._start(tag, {})
+                for item in child.array_contents:
+                    self._write_object(item, child.element_tag, force=True)
+                self._end()
+
+
+def _escape_text(text):
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace(
+        '>', '&gt;').replace('\r', '&#13;')
+
+
+def _escape_attribute(value):
+    # whitespace characters are escaped so that parsers don't normalise them
+    return '"' + _escape_text(value).replace('"', '&quot;').replace(
+        '\n', '&#10;').replace('\r', '&#13;').replace('\t', '&#9;') + '"'
 
 
 class GenericArray(BaseObject):
@@ -76,11 +786,14 @@ class GenericArray(BaseObject):
     element_module_name = None
     element_class_name = None
     element_class = None
+    # Tag of the elements inside the wrapper element, for arrays used as
+    # WRAPPER children, so that write_xml can write them back.
+    element_tag = None
 
     def __init__(self, **kwargs):
         self.array_contents = []
         xmlarray = kwargs.get('xmlarray')
-        if type(xmlarray) == list or type(xmlarray) == etree.Element:
+        if isinstance(xmlarray, list) or isinstance(xmlarray, ELEMENT_TYPES):
             if not self.element_class:
                 self.element_class = getattr(
                     importlib.import_module(self.element_module_name),
@@ -88,8 +801,30 @@ class GenericArray(BaseObject):
                 )
             for xmlelement in xmlarray:
                 array_elem = self.element_class(xmlelement = xmlelement)
+                array_elem._parent = self
                 self.array_contents.append(array_elem)
 
+    def _load_list(self, items, consume):
+        """
+        Fill the array from `items`, the SportsJS representations of its
+        elements. With `consume`, each item is dropped once it has been
+        used.
+        """
+        if not items:
+            return
+        if not self.element_class:
+            self.element_class = getattr(
+                importlib.import_module(self.element_module_name),
+                self.element_class_name
+            )
+        for position, item in enumerate(items):
+            array_elem = self.element_class()
+            array_elem._load_dict(item, consume)
+            array_elem._parent = self
+            self.array_contents.append(array_elem)
+            if consume:
+                items[position] = None
+
     def __str__(self):
         return (
             '<GenericArray of ' +
@@ -100,8 +835,11 @@ class GenericArray(BaseObject):
     def __bool__(self):
         return len(self.array_contents) != 0
 
-    def as_dict(self):
-        return [ elem.as_dict() for elem in self.array_contents ]
+    def _children(self):
+        return iter(self.array_contents)
+
+    def _as_dict(self, memoize):
+        return [ elem.as_dict(memoize) for elem in self.array_contents ]
 
     def to_json(self):
         return json.dumps(self.as_dict(), indent=4)
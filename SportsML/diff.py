@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+"""
+Structural diff between two versions of the same document.
+
+Changes are JSON Patch-like dicts:
+
+    {'op': 'add', 'path': '/sportsEvents/@key=e.1/actions/@id=p.12', 'value': {...}}
+    {'op': 'replace', 'path': '/sportsEvents/@key=e.1/eventMetadata/eventStatus', 'value': 'speventstatus:post-event'}
+    {'op': 'remove', 'path': '/sportsEvents/@key=e.1/actions/@id=p.3'}
+
+Paths follow the SportsJS output. Items of an array are addressed by a
+stable identifier where they have one: '@id=' followed by their id, or
+'@key=' followed by the key of their metadata (a sports-event by its
+event-metadata key). Items without one are addressed by position.
+Path segments are escaped as in JSON Pointer ('~' as '~0', '/' as '~1').
+
+Unchanged subtrees are skipped by comparing their cached subtree
+hashes, so once both documents are hashed, the work done depends on
+the size of the change rather than on the size of the documents.
+"""
+
+from .core import SHALLOW, BaseObject
+
+
+def diff(old, new):
+    """
+    Return the list of changes that turn the output of `old` into the
+    output of `new`, two objects such as SportsContent.
+    """
+    changes = []
+    _diff_values(old, new, '', changes)
+    return changes
+
+
+def _escape(segment):
+    return str(segment).replace('~', '~0').replace('/', '~1')
+
+
+def _output(value):
+    if isinstance(value, BaseObject):
+        return value.as_dict()
+    return value
+
+
+def _item_key(item):
+    """
+    Return the path segment identifying `item` in an array, or None.
+    """
+    if not isinstance(item, BaseObject):
+        return None
+    item_id = item.attr_values.get('id')
+    if item_id:
+        return '@id=' + item_id
+    for child in item._children():
+        # only metadata objects have a key
+        key = child.attr_values.get('key')
+        if key:
+            return '@key=' + key
+    return None
+
+
+def _diff_values(old, new, path, changes):
+    if isinstance(old, BaseObject) and isinstance(new, BaseObject):
+        if old._subtree_hash() == new._subtree_hash():
+            return
+        old_value = old._as_dict(SHALLOW)
+        new_value = new._as_dict(SHALLOW)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _diff_dicts(old_value, new_value, path, changes)
+            return
+        if isinstance(old_value, list) and isinstance(new_value, list):
+            _diff_lists(old_value, new_value, path, changes)
+            return
+    elif old == new:
+        return
+    changes.append({'op': 'replace', 'path': path, 'value': _output(new)})
+
+
+def _diff_dicts(old, new, path, changes):
+    for key in old:
+        if key not in new:
+            changes.append({'op': 'remove', 'path': path + '/' + _escape(key)})
+    for key, value in new.items():
+        key_path = path + '/' + _escape(key)
+        if key in old:
+            _diff_values(old[key], value, key_path, changes)
+        else:
+            changes.append({'op': 'add', 'path': key_path, 'value': _output(value)})
+
+
+def _diff_lists(old, new, path, changes):
+    old_keys = [_item_key(item) for item in old]
+    new_keys = [_item_key(item) for item in new]
+    keyed = (
+        None not in old_keys and None not in new_keys and
+        len(set(old_keys)) == len(old_keys) and
+        len(set(new_keys)) == len(new_keys)
+    )
+    if keyed:
+        old_items = dict(zip(old_keys, old))
+        new_key_set = set(new_keys)
+        for key in old_keys:
+            if key not in new_key_set:
+                changes.append({'op': 'remove', 'path': path + '/' + _escape(key)})
+        for key, item in zip(new_keys, new):
+            item_path = path + '/' + _escape(key)
+            if key in old_items:
+                _diff_values(old_items[key], item, item_path, changes)
+            else:
+                changes.append({'op': 'add', 'path': item_path, 'value': _output(item)})
+        return
+    # by position
+    common = min(len(old), len(new))
+    for position in range(common):
+        _diff_values(old[position], new[position], path + '/' + str(position), changes)
+    for position in range(common, len(new)):
+        changes.append({
+            'op': 'add', 'path': path + '/' + str(position), 'value': _output(new[position])
+        })
+    # from the end, so that each path is still right when applied in order
+    for position in reversed(range(common, len(old))):
+        changes.append({'op': 'remove', 'path': path + '/' + str(position)})
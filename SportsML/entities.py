@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .backends import is_element
+from .core import NEWSMLG2_NS, ONE, MANY, TEXT, BaseObject, GenericArray
 from .sports_metadata import SportsMetadata
 from .base_metadata import (
     CommonAttributes, CoverageAttributes,
@@ -19,7 +19,6 @@ class Team(CommonAttributes):
     A team participating in a sporting event. 
     Holds metadata and statistical data for team.
     """
-    dict = {}
 
     team_metadata = None
     team_stats_set = None
@@ -28,56 +27,44 @@ class Team(CommonAttributes):
     associates = None
     affiliations = None
 
-    def __init__(self, **kwargs):
-        super(Team, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.team_metadata = TeamMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'team-metadata')
-            )
-            self.team_stats_set = TeamStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'team-stats')
-            )
-            self.players = Players(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'player')
-            )
-            self.wagering_stats_set = WageringStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'wagering-stats')
-            )
-            self.associates = Associates(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'associate')
-            )
-            self.affiliations = Affiliations(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'affiliation')
-            )
+    children = {
+        NEWSMLG2_NS+'team-metadata': ('team_metadata', 'TeamMetadata', ONE),
+        NEWSMLG2_NS+'team-stats': ('team_stats_set', TeamStatsSet, MANY),
+        NEWSMLG2_NS+'player': ('players', 'Players', MANY),
+        NEWSMLG2_NS+'wagering-stats': ('wagering_stats_set', WageringStatsSet, MANY),
+        NEWSMLG2_NS+'associate': ('associates', 'Associates', MANY),
+        NEWSMLG2_NS+'affiliation': ('affiliations', 'Affiliations', MANY),
+    }
+    # built on first use by SportsContent(lazy=True)
+    lazy_children = ('players', 'wagering_stats_set', 'associates', 'affiliations')
 
-    def as_dict(self):
-        super(Team, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Team, self)._as_dict(memoize)
         if self.team_metadata:
-            self.dict.update({
-                'teamMetadata': self.team_metadata.as_dict()
+            dict.update({
+                'teamMetadata': self.team_metadata.as_dict(memoize)
             })
         if self.team_stats_set:
-            self.dict.update({
-                'teamStats': self.team_stats_set.as_dict()
+            dict.update({
+                'teamStats': self.team_stats_set.as_dict(memoize)
             })
         if self.players:
-            self.dict.update({
-                'players': self.players.as_dict()
+            dict.update({
+                'players': self.players.as_dict(memoize)
             })
         if self.wagering_stats_set:
-            self.dict.update({
-                'wageringStatsSet': self.wagering_stats_set.as_dict()
+            dict.update({
+                'wageringStatsSet': self.wagering_stats_set.as_dict(memoize)
             })
         if self.associates:
-            self.dict.update({
-                'associates': self.associates.as_dict()
+            dict.update({
+                'associates': self.associates.as_dict(memoize)
             })
         if self.affiliations:
-            self.dict.update({
-                'affiliations': self.affiliations.as_dict()
+            dict.update({
+                'affiliations': self.affiliations.as_dict(memoize)
             })
-        return self.dict
+        return dict
 
 
 class Teams(GenericArray):
@@ -102,35 +89,27 @@ class BaseEntityMetadata(CommonAttributes):
         'nationality': 'nationality'
     }
     
-    def __init__(self, **kwargs):
-        super(BaseEntityMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
-            self.home_location = FlexLocationPropType(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'home-location')
-            )
-            self.sports_properties = SportsProperties(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-property')
-            )
+    children = {
+        NEWSMLG2_NS+'name': ('names', Names, MANY),
+        NEWSMLG2_NS+'home-location': ('home_location', FlexLocationPropType, ONE),
+        NEWSMLG2_NS+'sports-property': ('sports_properties', SportsProperties, MANY),
+    }
 
-    def as_dict(self):
-        super(BaseEntityMetadata, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(BaseEntityMetadata, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({
-                'names': self.names.as_dict()
+            dict.update({
+                'names': self.names.as_dict(memoize)
             })
         if self.home_location:
-            self.dict.update({
-                'homeLocation': self.home_location.as_dict()
+            dict.update({
+                'homeLocation': self.home_location.as_dict(memoize)
             })
         if self.sports_properties:
-            self.dict.update({
-                'sportsProperties': self.sports_properties.as_dict()
+            dict.update({
+                'sportsProperties': self.sports_properties.as_dict(memoize)
             })
-        return self.dict
+        return dict
 
 
 class BaseTeamMetadata(BaseEntityMetadata):
@@ -159,28 +138,22 @@ class BaseTeamMetadata(BaseEntityMetadata):
         'round-position': 'roundPosition'
     }
 
-    def __init__(self, **kwargs):
-        super(BaseTeamMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.sites = Sites(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'site')
-            )
-            self.sports_content_codes = SportsContentCodes(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-content-code')
-            )
+    children = {
+        NEWSMLG2_NS+'site': ('sites', 'Sites', MANY),
+        NEWSMLG2_NS+'sports-content-code': ('sports_content_codes', SportsContentCodes, MANY),
+    }
 
-    def as_dict(self):
-        super(BaseTeamMetadata, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(BaseTeamMetadata, self)._as_dict(memoize)
         if self.sites:
-            self.dict.update({
-                'sites': self.sites.as_dict()
+            dict.update({
+                'sites': self.sites.as_dict(memoize)
             })
         if self.sports_content_codes:
-            self.dict.update({
-                'sportsContentCodes': self.sports_content_codes.as_dict()
+            dict.update({
+                'sportsContentCodes': self.sports_content_codes.as_dict(memoize)
             })
-        return self.dict
+        return dict
 
 
 class TeamMetadata(BaseTeamMetadata):
@@ -190,29 +163,21 @@ class TeamMetadata(BaseTeamMetadata):
     team_metadata_golf = None
     team_metadata_motor_racing = None
 
-    def __init__(self, **kwargs):
-        super(TeamMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.team_metadata_baseball = TeamMetadataBaseball(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'team-metadata-baseball')
-            )
-            self.team_metadata_golf = TeamMetadataGolf(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'team-metadata-golf')
-            )
-            self.team_metadata_motor_racing = TeamMetadataMotorRacing(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'team-metadata-motor-racing')
-            )
+    children = {
+        NEWSMLG2_NS+'team-metadata-baseball': ('team_metadata_baseball', 'TeamMetadataBaseball', ONE),
+        NEWSMLG2_NS+'team-metadata-golf': ('team_metadata_golf', 'TeamMetadataGolf', ONE),
+        NEWSMLG2_NS+'team-metadata-motor-racing': ('team_metadata_motor_racing', 'TeamMetadataMotorRacing', ONE),
+    }
 
-    def as_dict(self):
-        super(TeamMetadata, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(TeamMetadata, self)._as_dict(memoize)
         if self.team_metadata_baseball:
-            self.dict.update({ 'teamMetadataBaseball': self.team_metadata_baseball.as_dict() })
+            dict.update({ 'teamMetadataBaseball': self.team_metadata_baseball.as_dict(memoize) })
         if self.team_metadata_golf:
-            self.dict.update({ 'teamMetadataGolf': self.team_metadata_golf.as_dict() })
+            dict.update({ 'teamMetadataGolf': self.team_metadata_golf.as_dict(memoize) })
         if self.team_metadata_motor_racing:
-            self.dict.update({ 'teamMetadataMotorRacing': self.team_metadata_motor_racing.as_dict() })
-        return self.dict
+            dict.update({ 'teamMetadataMotorRacing': self.team_metadata_motor_racing.as_dict(memoize) })
+        return dict
 
 
 class TeamMetadataBaseball(CommonAttributes):
@@ -259,7 +224,7 @@ class TeamMetadataMotorRacing(CommonAttributes):
     def __init__(self, **kwargs):
         super(TeamMetadataMotorRacing, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             motor_racing_vehicles = MotorRacingVehicles(
                 xmlelement.findall(NEWSMLG2_NS+'metadata-motor-racing-vehicle')
             )
@@ -271,9 +236,10 @@ class MotorRacingVehicle(BaseObject):
     """
     (from sportsml-specific-motor-racing.xsd)
     """
-    pass
+    # TODO
+    _empty = False
 
-    def as_dict(self):
+    def _as_dict(self, memoize):
         # TODO
         return None
 
@@ -292,39 +258,27 @@ class Player(CommonAttributes):
     Their athletic talents help them decide who wins a sports-event.
     """
 
-    def __init__(self, **kwargs):
-        super(Player, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.player_metadata = PlayerMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata')
-            )
-            self.player_stats_set = PlayerStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'player-stats')
-            )
-            self.wagering_stats_set = WageringStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'wagering-stats')
-            )
-            self.associates = Associates(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'associate')
-            )
-            self.affiliations = Affiliations(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'affiliation')
-            )
+    children = {
+        NEWSMLG2_NS+'player-metadata': ('player_metadata', 'PlayerMetadata', ONE),
+        NEWSMLG2_NS+'player-stats': ('player_stats_set', PlayerStatsSet, MANY),
+        NEWSMLG2_NS+'wagering-stats': ('wagering_stats_set', WageringStatsSet, MANY),
+        NEWSMLG2_NS+'associate': ('associates', 'Associates', MANY),
+        NEWSMLG2_NS+'affiliation': ('affiliations', 'Affiliations', MANY),
+    }
 
-    def as_dict(self):
-        super(Player, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Player, self)._as_dict(memoize)
         if self.player_metadata:
-            self.dict.update({ 'playerMetadata': self.player_metadata.as_dict() })
+            dict.update({ 'playerMetadata': self.player_metadata.as_dict(memoize) })
         if self.player_stats_set:
-            self.dict.update({ 'playerStats': self.player_stats_set.as_dict() })
+            dict.update({ 'playerStats': self.player_stats_set.as_dict(memoize) })
         if self.wagering_stats_set:
-            self.dict.update({ 'wageringStats': self.wagering_stats_set.as_dict()})
+            dict.update({ 'wageringStats': self.wagering_stats_set.as_dict(memoize)})
         if self.associates:
-            self.dict.update({ 'associates': self.associates.as_dict() })
+            dict.update({ 'associates': self.associates.as_dict(memoize) })
         if self.affiliations:
-            self.dict.update({'affiliations': self.affiliations.as_dict() })
-        return self.dict
+            dict.update({'affiliations': self.affiliations.as_dict(memoize) })
+        return dict
 
 
 class Players(GenericArray):
@@ -394,59 +348,36 @@ class BasePlayerMetadata(BasePersonMetadata):
         'round_position': 'roundPosition',
     }
 
-    def __init__(self, **kwargs):
-        super(BasePlayerMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.career_phase_metadata = CareerPhaseMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'career-phase')
-            )
-            self.injury_phase_metadata = InjuryPhaseMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'injury-phase')
-            )
+    children = {
+        NEWSMLG2_NS+'career-phase': ('career_phase_metadata', 'CareerPhaseMetadata', ONE),
+        NEWSMLG2_NS+'injury-phase': ('injury_phase_metadata', 'InjuryPhaseMetadata', ONE),
+    }
 
-    def as_dict(self):
-        super(BasePlayerMetadata, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(BasePlayerMetadata, self)._as_dict(memoize)
         if self.career_phase_metadata:
-            self.dict.update({ 'careerPhase': self.career_phase_metadata.as_dict() })
+            dict.update({ 'careerPhase': self.career_phase_metadata.as_dict(memoize) })
         if self.injury_phase_metadata:
-            self.dict.update({ 'injuryPhase': self.injury_phase_metadata.as_dict() })
-        return self.dict
+            dict.update({ 'injuryPhase': self.injury_phase_metadata.as_dict(memoize) })
+        return dict
 
 
 class PlayerMetadata(BasePlayerMetadata):
 
-    def __init__(self, **kwargs):
-        super(PlayerMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            pass
-            """
-            TODO
-            self.player_metadata_baseball = PlayerMetadataBaseball(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-baseball')
-            )
-            self.player_metadata_golf = PlayerMetadataGolf(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-golf')
-            )
-            self.player_metadata_ice_hockey = PlayerMetadataIceHockey(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-ice-hockey')
-            )
-            self.player_metadata_soccer = PlayerMetadataSoccer(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-soccer')
-            )
-            self.player_metadata_motor_racing = PlayerMetadataMotorRacing(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-motor-racing')
-            )
-            self.player_metadata_curling = PlayerMetadataCurling(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'player-metadata-curling')
-            )
-            """
-
-    def as_dict(self):
-        super(PlayerMetadata, self).as_dict()
+    # TODO
+    # children = {
+    #     NEWSMLG2_NS+'player-metadata-baseball': ('player_metadata_baseball', PlayerMetadataBaseball, ONE),
+    #     NEWSMLG2_NS+'player-metadata-golf': ('player_metadata_golf', PlayerMetadataGolf, ONE),
+    #     NEWSMLG2_NS+'player-metadata-ice-hockey': ('player_metadata_ice_hockey', PlayerMetadataIceHockey, ONE),
+    #     NEWSMLG2_NS+'player-metadata-soccer': ('player_metadata_soccer', PlayerMetadataSoccer, ONE),
+    #     NEWSMLG2_NS+'player-metadata-motor-racing': ('player_metadata_motor_racing', PlayerMetadataMotorRacing, ONE),
+    #     NEWSMLG2_NS+'player-metadata-curling': ('player_metadata_curling', PlayerMetadataCurling, ONE),
+    # }
+
+    def _as_dict(self, memoize):
+        dict = super(PlayerMetadata, self)._as_dict(memoize)
         # TODO
-        return self.dict
+        return dict
 
 
 class CareerPhaseMetadata(BasePlayerMetadata):
@@ -548,29 +479,21 @@ class Associate(CommonAttributes):
     Manager or coach or jockey, etc.
     An individual or a group that assists a team or player, and functions in a supporting capacity.
     """
-    def __init__(self,  **kwargs):
-        super(Associate, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.associate_metadata = AssociateMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'associate-metadata')
-            )
-            self.associate_stats = AssociateStats(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'associate-stats')
-            )
-            self.affiliations = Affiliations(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'affiliation')
-            )
+    children = {
+        NEWSMLG2_NS+'associate-metadata': ('associate_metadata', AssociateMetadata, ONE),
+        NEWSMLG2_NS+'associate-stats': ('associate_stats', AssociateStats, ONE),
+        NEWSMLG2_NS+'affiliation': ('affiliations', 'Affiliations', ONE),
+    }
 
-    def as_dict(self):
-        super(Associate, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Associate, self)._as_dict(memoize)
         if self.associate_metadata:
-            self.dict.update({ 'associateMetadata': self.associate_metadata.as_dict() })
+            dict.update({ 'associateMetadata': self.associate_metadata.as_dict(memoize) })
         if self.associate_stats:
-            self.dict.update({ 'associateStats': self.associate_stats.as_dict() })
+            dict.update({ 'associateStats': self.associate_stats.as_dict(memoize) })
         if self.affiliations:
-            self.dict.update({ 'affiliations': self.affiliations.as_dict() })
-        return self.dict
+            dict.update({ 'affiliations': self.affiliations.as_dict(memoize) })
+        return dict
 
 
 class Associates(GenericArray):
@@ -582,9 +505,9 @@ class Associates(GenericArray):
 
 class Affiliation(BaseObject):
     # TODO
-    pass
+    _empty = False
 
-    def as_dict(self):
+    def _as_dict(self, memoize):
         # TODO
         return None
 
@@ -601,20 +524,18 @@ class BaseOfficialMetadata(BasePersonMetadata):
     Metadata about the official.
     Generally does not change over the course of a sports-events.
     """
-    dict = {}
     uniform_number = None
 
-    def __init__(self,  **kwargs):
-        super(BaseOfficialMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.uniform_number = xmlelement.findtext('uniform-number')
+    children = {
+        # TODO: no namespace, so this never matches in a SportsML-G2 document
+        'uniform-number': ('uniform_number', None, TEXT),
+    }
 
-    def as_dict(self):
-        super(BaseOfficialMetadata, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(BaseOfficialMetadata, self)._as_dict(memoize)
         if self.uniform_number:
-            self.dict.update({ 'uniform_number': self.uniform_number })
-        return self.dict
+            dict.update({ 'uniform_number': self.uniform_number })
+        return dict
 
 
 class OfficialMetadata(BaseOfficialMetadata):
@@ -627,34 +548,25 @@ class Official(CommonAttributes):
     Also referred to as umpire or referree. 
     Ensures that the sports-event is played according to its rules.
     """
-    dict = {}
     official_metadata = None
     official_stats = None
     affiliations = None
 
-    def __init__(self, **kwargs):
-        super(Official, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.official_metadata = OfficialMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'official-metadata')
-            )
-            self.official_stats = OfficialStats(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'official-stats')
-            )
-            self.affiliations = Affiliations(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'affiliation')
-            )
+    children = {
+        NEWSMLG2_NS+'official-metadata': ('official_metadata', OfficialMetadata, ONE),
+        NEWSMLG2_NS+'official-stats': ('official_stats', OfficialStats, ONE),
+        NEWSMLG2_NS+'affiliation': ('affiliations', Affiliations, MANY),
+    }
 
-    def as_dict(self):
-        super(Official, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Official, self)._as_dict(memoize)
         if self.official_metadata:
-            self.dict.update({'officialMetadata': self.official_metadata.as_dict()})
+            dict.update({'officialMetadata': self.official_metadata.as_dict(memoize)})
         if self.official_stats:
-            self.dict.update({'officialStats': self.official_stats.as_dict()})
+            dict.update({'officialStats': self.official_stats.as_dict(memoize)})
         if self.affiliations:
-            self.dict.update({'affiliations': self.affiliations.as_dict()})
-        return self.dict
+            dict.update({'affiliations': self.affiliations.as_dict(memoize)})
+        return dict
 
 
 class Officials(GenericArray):
@@ -662,6 +574,7 @@ class Officials(GenericArray):
     Array of Official objects.
     """
     element_class= Official
+    element_tag = NEWSMLG2_NS+'official'
 
 
 class Affiliation(CommonAttributes, CoverageAttributes):
@@ -671,7 +584,6 @@ class Affiliation(CommonAttributes, CoverageAttributes):
     Also, to indicate an official's affiliation with a team, club or
     federation, for example.
     """
-    dict = {}
     # A pointer to the ID for the larger organizational structure.
     membership_idref = None
     # The type of organizational structure in which this item is a member.
@@ -681,26 +593,24 @@ class Affiliation(CommonAttributes, CoverageAttributes):
     # The name associated with the organizational structure in which this item is a member.
     membership_name = None
  
-    def __init__(self, **kwargs):
-        super(Affiliation, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.membership_idref = xmlelement.findtext(NEWSMLG2_NS+'membership-idref')
-            self.membership_type = xmlelement.findtext(NEWSMLG2_NS+'membership-type')
-            self.membership_key = xmlelement.findtext(NEWSMLG2_NS+'membership-key')
-            self.membership_name = xmlelement.findtext(NEWSMLG2_NS+'membership-name')
-
-    def as_dict(self):
-        super(Affiliation, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'membership-idref': ('membership_idref', None, TEXT),
+        NEWSMLG2_NS+'membership-type': ('membership_type', None, TEXT),
+        NEWSMLG2_NS+'membership-key': ('membership_key', None, TEXT),
+        NEWSMLG2_NS+'membership-name': ('membership_name', None, TEXT),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Affiliation, self)._as_dict(memoize)
         if self.membership_idref:
-            self.dict.update({'membership_idref': self.membership_idref})
+            dict.update({'membership_idref': self.membership_idref})
         if self.membership_type:
-            self.dict.update({'membership_type': self.membership_type})
+            dict.update({'membership_type': self.membership_type})
         if self.membership_key:
-            self.dict.update({'membership_key': self.membership_key})
+            dict.update({'membership_key': self.membership_key})
         if self.membership_name:
-            self.dict.update({'membership_name': self.membership_name})
-        return self.dict
+            dict.update({'membership_name': self.membership_name})
+        return dict
 
 
 class GroupMetadata(Base2Metadata):
@@ -722,40 +632,27 @@ class Group(CommonAttributes):
     Holds metadata and stats. Also appropriate for expressing
     general organization/league membership and structure.
     """
-    def __init__(self, **kwargs):
-        self.dict = {}
-        super(Group, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.group_metadata = GroupMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'group-metadata')
-            )
-            self.groups = Groups(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'group')
-            )
-            self.teams = Teams(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'team')
-            )
-            self.players = Players(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'player')
-            )
-            self.affiliations = Affiliations(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'affiliation')
-            )
+    children = {
+        NEWSMLG2_NS+'group-metadata': ('group_metadata', GroupMetadata, ONE),
+        NEWSMLG2_NS+'group': ('groups', 'Groups', MANY),
+        NEWSMLG2_NS+'team': ('teams', Teams, MANY),
+        NEWSMLG2_NS+'player': ('players', Players, MANY),
+        NEWSMLG2_NS+'affiliation': ('affiliations', Affiliations, MANY),
+    }
 
-    def as_dict(self):
-        super(Group, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Group, self)._as_dict(memoize)
         if self.group_metadata:
-            self.dict.update({'groupMetadata': self.group_metadata.as_dict() })
+            dict.update({'groupMetadata': self.group_metadata.as_dict(memoize) })
         if self.groups:
-            self.dict.update({'groups': self.groups.as_dict() })
+            dict.update({'groups': self.groups.as_dict(memoize) })
         if self.teams:
-            self.dict.update({'teams': self.teams.as_dict() })
+            dict.update({'teams': self.teams.as_dict(memoize) })
         if self.players:
-            self.dict.update({'players': self.players.as_dict() })
+            dict.update({'players': self.players.as_dict(memoize) })
         if self.affiliations:
-            self.dict.update({'affiliations': self.affiliations.as_dict() })
-        return self.dict
+            dict.update({'affiliations': self.affiliations.as_dict(memoize) })
+        return dict
 
 
 class Groups(GenericArray):
@@ -840,29 +737,21 @@ class Site(CommonAttributes):
     """
     An element housing data having to do with a venue, stadium, arena, field, etc.
     """
-    dict = {}
     site_metadata = None
     site_stats_set = None
 
-    def __init__(self, **kwargs):
-        self.dict = {}
-        super(Site, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.site_metadata = SiteMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'site-metadata')
-            )
-            self.site_stats_set = SiteStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'site-stats')
-            )
+    children = {
+        NEWSMLG2_NS+'site-metadata': ('site_metadata', SiteMetadata, ONE),
+        NEWSMLG2_NS+'site-stats': ('site_stats_set', SiteStatsSet, MANY),
+    }
 
-    def as_dict(self):
-        super(Site, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Site, self)._as_dict(memoize)
         if self.site_metadata:
-            self.dict.update({'siteMetadata': self.site_metadata.as_dict() })
+            dict.update({'siteMetadata': self.site_metadata.as_dict(memoize) })
         if self.site_stats_set:
-            self.dict.update({'siteStats': self.site_stats_set.as_dict() })
-        return self.dict
+            dict.update({'siteStats': self.site_stats_set.as_dict(memoize) })
+        return dict
 
 
 class Sites(GenericArray):
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .core import NEWSMLG2_NS, MANY, BaseObject, GenericArray
 from .base_metadata import Base2Metadata
 
 
@@ -78,24 +77,18 @@ class BaseEventMetadata(Base2Metadata, BaseEventStateAttributes):
         'event-number': 'integer',
     }
 
-    def __init__(self, **kwargs):
-        super(BaseEventMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.event_sponsors = EventSponsors(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'event-sponsor')
-            )
-            self.event_recurring_names = EventRecurringNames(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'event-recurring-name')
-            )
-
-    def as_dict(self):
-        super(BaseEventMetadata, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'event-sponsor': ('event_sponsors', 'EventSponsors', MANY),
+        NEWSMLG2_NS+'event-recurring-name': ('event_recurring_names', 'EventRecurringNames', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(BaseEventMetadata, self)._as_dict(memoize)
         if self.event_sponsors:
-            self.dict.update({ 'eventSponsors': self.event_sponsors.as_dict() })
+            dict.update({ 'eventSponsors': self.event_sponsors.as_dict(memoize) })
         if self.event_recurring_names:
-            self.dict.update({ 'eventRecurringNames': self.event_recurring_names.as_dict() })
-        return self.dict
+            dict.update({ 'eventRecurringNames': self.event_recurring_names.as_dict(memoize) })
+        return dict
 
 
 class EventMetadata(BaseEventMetadata):
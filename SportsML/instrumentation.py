@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+"""
+Opt-in counters of the objects built and the time spent in each class.
+
+    from SportsML import instrumentation
+
+    instrumentation.enable()
+    sports_content = SportsMLParser(filename).getSportsContent()
+    sports_content.as_dict()
+    counters = instrumentation.snapshot()
+    counters['SportsML.actions.Action']['init_self_time']
+    instrumentation.disable()
+
+While enabled, the __init__ and _as_dict methods of every SportsML
+class are wrapped to count and time each call, including classes
+defined after enable(), such as subclasses in application code.
+disable() puts the original methods back, so nothing is left behind to
+slow down the objects once it's off.
+
+For each class, snapshot() gives:
+    built: objects of that class built
+    init_time: seconds spent building them, objects built inside
+        them included
+    init_self_time: the same, without the objects built inside them
+    as_dict_calls: objects of that class serialised (results reused by
+        as_dict(memoize=True) aren't counted)
+    as_dict_time, as_dict_self_time: as init_time and init_self_time
+
+Calls made through super() are part of the call to the object's own
+class. Counters are global to the process and updated from every
+thread.
+"""
+
+import threading
+import time
+
+from . import core
+from .core import BaseObject
+
+FIELDS = (
+    'built', 'init_time', 'init_self_time',
+    'as_dict_calls', 'as_dict_time', 'as_dict_self_time',
+)
+# wrapped method: (count field, time field, self time field)
+METHODS = {
+    '__init__': ('built', 'init_time', 'init_self_time'),
+    '_as_dict': ('as_dict_calls', 'as_dict_time', 'as_dict_self_time'),
+}
+
+_lock = threading.Lock()
+# counters by class, {class: {field: value}}
+_counters = {}
+# original methods by (class, method name), None for inherited ones
+_originals = {}
+# the time spent in the calls nested in each call being timed, per thread
+_local = threading.local()
+
+
+def _all_classes():
+    # classes in modules not imported yet are wrapped by _wrap_new_class
+    # when they are defined
+    classes = [BaseObject]
+    for cls in classes:
+        classes.extend(cls.__subclasses__())
+    return set(classes)
+
+
+def _wrap(cls, function, fields):
+    count_field, time_field, self_time_field = fields
+
+    def wrapper(self, *args, **kwargs):
+        if type(self) is not cls:
+            # a call made through super()
+            return function(self, *args, **kwargs)
+        stack = getattr(_local, 'stack', None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return function(self, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with _lock:
+                counters = _counters.get(cls)
+                if counters is None:
+                    counters = _counters[cls] = dict.fromkeys(FIELDS, 0)
+                counters[count_field] += 1
+                counters[time_field] += elapsed
+                counters[self_time_field] += elapsed - nested
+
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    wrapper.__wrapped__ = function
+    return wrapper
+
+
+def enable():
+    """
+    Start counting. Counters already collected are kept, see reset().
+    """
+    with _lock:
+        if _originals:
+            return
+        classes = _all_classes()
+        # every wrapper must call the original method, so all of them are
+        # looked up before any is replaced
+        methods = {
+            (cls, name): (vars(cls).get(name), getattr(cls, name))
+            for cls in classes for name in METHODS
+        }
+        for (cls, name), (original, function) in methods.items():
+            _originals[(cls, name)] = original
+            setattr(cls, name, _wrap(cls, function, METHODS[name]))
+        core._subclass_hooks.append(_wrap_new_class)
+
+
+def _wrap_new_class(cls):
+    # an inherited method is already wrapped for the parent class: the
+    # parent's wrapper lets calls for this class through uncounted
+    with _lock:
+        for name in METHODS:
+            _originals[(cls, name)] = vars(cls).get(name)
+            setattr(cls, name, _wrap(cls, getattr(cls, name), METHODS[name]))
+
+
+def disable():
+    """
+    Stop counting and put the original methods back. Counters are kept
+    until reset().
+    """
+    with _lock:
+        if _wrap_new_class in core._subclass_hooks:
+            core._subclass_hooks.remove(_wrap_new_class)
+        for (cls, name), original in _originals.items():
+            if original is None:
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+        _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def reset():
+    """
+    Set every counter back to zero.
+    """
+    with _lock:
+        _counters.clear()
+
+
+def snapshot():
+    """
+    Return a copy of the counters, by the dotted name of each class
+    that has been built or serialised since the last reset().
+    """
+    with _lock:
+        return {
+            cls.__module__ + '.' + cls.__qualname__: dict(counters)
+            for cls, counters in _counters.items()
+        }
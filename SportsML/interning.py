@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+
+"""
+Sharing of the strings that repeat across documents.
+
+The same vocabulary values ('speventstatus:post-event', 'spct:offense',
+stat-types, team ids...) occur thousands of times in a season of
+documents, and the XML parser makes a new string for each occurrence.
+While building objects, attribute values and the text of elements
+are looked up in a table of strings already seen, and the
+string found there is kept instead, so each distinct value is stored
+once however many objects and as_dict() outputs hold it.
+
+Interning is off by default, as looking up every value makes
+building objects about 10-15% slower: it pays off when many documents
+are kept in memory at the same time.
+
+The table is bounded: when it grows past its maximum size it is
+emptied and starts again, so that values seen only once (such as
+action ids) can't make it grow without limit. Strings shared before
+that stay shared.
+
+    from SportsML import interning
+    interning.enable(max_size=100000)
+    ...
+    interning.stats()          # {'lookups': ..., 'hits': ..., 'hit_rate': ...}
+    interning.disable()
+"""
+
+DEFAULT_MAX_SIZE = 65536
+
+
+class InternTable(dict):
+    """
+    Maps each string to the copy of it that is shared. A dict itself,
+    so that looking up and adding strings is a single setdefault().
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        super(InternTable, self).__init__()
+        self.max_size = max_size
+        # Every string looked up was either found or added, so only the
+        # lookups are counted: the misses are the strings added, the ones
+        # in the table plus the ones dropped by reset().
+        self.lookups = 0
+        self.dropped = 0
+        self.resets = 0
+
+    def intern(self, value):
+        """
+        Return the shared copy of `value`, a string or None.
+        """
+        if value is None:
+            return None
+        value = self.setdefault(value, value)
+        self.lookups += 1
+        if len(self) > self.max_size:
+            self.reset()
+        return value
+
+    def reset(self):
+        """
+        Empty the table, once it has reached its maximum size.
+        """
+        self.dropped += len(self)
+        self.clear()
+        self.resets += 1
+
+    def stats(self):
+        hits = self.lookups - self.dropped - len(self)
+        return {
+            'lookups': self.lookups,
+            'hits': hits,
+            'hit_rate': hits / self.lookups if self.lookups else 0.0,
+            'size': len(self),
+            'max_size': self.max_size,
+            'resets': self.resets,
+        }
+
+
+# The table used while building objects, None when interning is off.
+table = None
+
+
+def enable(max_size=DEFAULT_MAX_SIZE):
+    """
+    Share strings through a new, empty table of at most `max_size`
+    strings, for the objects built from now on.
+    """
+    global table
+    table = InternTable(max_size)
+
+
+def disable():
+    """
+    Stop sharing strings: objects built from now on keep the strings
+    made by the XML parser.
+    """
+    global table
+    table = None
+
+
+def intern(value):
+    """
+    Return the shared copy of `value`, or `value` itself when interning
+    is off.
+    """
+    if table is None:
+        return value
+    return table.intern(value)
+
+
+def stats():
+    """
+    Return the lookups and hits of the current table, its hit rate and
+    size, and how many times it was emptied for reaching its maximum
+    size. None when interning is off.
+    """
+    if table is None:
+        return None
+    return table.stats()
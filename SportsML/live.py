@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+
+"""
+Incremental parsing of live documents.
+
+A live play-by-play feed sends the whole document again on every
+update, although only the end of its actions is new. LiveSession keeps
+the objects built from the previous revision and only builds what
+changed:
+
+    session = LiveSession()
+    for data in revisions:
+        sports_content = session.update(data)
+
+update() takes ownership of the objects it reuses: they are moved into
+the new revision's SportsContent, and their parent links now lead to it.
+The SportsContent returned by the previous update() must not be used
+any more, as walking up from its objects, resolving references,
+looking up ids or calling setters on it would reach the new revision
+instead. Keep the as_dict() or to_json() output of a revision if it is
+needed later.
+"""
+
+from .backends import get_backend
+from .core import NEWSMLG2_NS
+from .parser import SportsMLParser
+from .sports_content import SportsContent
+from .entities import Team, Teams, Player, Players
+from .actions import Action, Actions
+
+
+class LiveSession(object):
+    """
+    Keeps the SportsContent of a live document about one sports-event,
+    and updates it from each new revision of the document.
+
+    Actions are matched on their id, or sequence number, and an action
+    that has already been seen is assumed not to change, as in an
+    append-only feed: only new actions are built. Teams and players are
+    reused when their XML is unchanged, and rebuilt otherwise.
+
+    Each update() moves the objects it reuses into the new SportsContent,
+    so only the latest one can be used (see above).
+    """
+
+    def __init__(self, event_key=None, backend=None):
+        """
+        Follow the sports-event whose event-metadata key is `event_key`,
+        or the first sports-event of the first revision. `backend` names
+        the XML backend to use (see backends.py).
+        """
+        self.event_key = event_key
+        self.backend = get_backend(backend)
+        self.sports_content = None
+        # How many objects the last update() built and reused.
+        self.stats = {}
+        # Action objects of the current revision by id or sequence number.
+        self._actions = {}
+        # (Team, signatures of its players) and Player objects of the
+        # current revision by the signature of their XML (see _signature).
+        self._teams = {}
+        self._players = {}
+
+    def update(self, source):
+        """
+        Parse `source`, the next revision of the document as bytes, a
+        filename or a binary file object, and return its SportsContent.
+        The SportsContent returned by the previous call must not be used
+        afterwards: the objects reused from it now belong to this one.
+        """
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            root_element = self.backend.fromstring(source)
+        else:
+            root_element = self.backend.parse(source)
+        sports_content_element = SportsMLParser._find_sports_content(root_element)
+        self.stats = dict.fromkeys((
+            'actions_built', 'actions_reused', 'teams_built', 'teams_reused',
+            'players_built', 'players_reused'
+        ), 0)
+
+        position, event_element = self._find_event(sports_content_element)
+        if event_element is None:
+            self._actions, self._teams, self._players = {}, {}, {}
+            self.sports_content = SportsContent(xmlelement = sports_content_element)
+            return self.sports_content
+
+        # teams and actions are taken out of the XML and handled below,
+        # everything else is built as usual
+        team_elements = event_element.findall(NEWSMLG2_NS+'team')
+        actions_element = event_element.find(NEWSMLG2_NS+'actions')
+        for team_element in team_elements:
+            event_element.remove(team_element)
+        if actions_element is not None:
+            event_element.remove(actions_element)
+        sports_content = SportsContent(xmlelement = sports_content_element)
+        sports_event = sports_content.sports_events.array_contents[position]
+
+        teams_by_signature = {}
+        players_by_signature = {}
+        if team_elements:
+            teams = Teams()
+            for team_element in team_elements:
+                team = self._get_team(team_element, teams_by_signature, players_by_signature)
+                team._parent = teams
+                teams.array_contents.append(team)
+            sports_event.set_teams(teams)
+
+        actions_by_key = {}
+        if actions_element is not None:
+            actions = Actions()
+            for action_element in actions_element:
+                key = action_element.get('id') or action_element.get('sequence-number')
+                action = self._actions.pop(key, None) if key else None
+                if action is None:
+                    action = Action(xmlelement = action_element)
+                    self.stats['actions_built'] += 1
+                else:
+                    self.stats['actions_reused'] += 1
+                if key:
+                    actions_by_key[key] = action
+                action._parent = actions
+                actions.array_contents.append(action)
+            sports_event.set_actions(actions)
+
+        self._actions = actions_by_key
+        self._teams = teams_by_signature
+        self._players = players_by_signature
+        self.sports_content = sports_content
+        return sports_content
+
+    def _find_event(self, sports_content_element):
+        """
+        Return the position among the sports-events of the document and
+        the element of the sports-event we follow, or (None, None).
+        """
+        event_elements = sports_content_element.findall(NEWSMLG2_NS+'sports-event')
+        for position, event_element in enumerate(event_elements):
+            event_metadata = event_element.find(NEWSMLG2_NS+'event-metadata')
+            key = None if event_metadata is None else event_metadata.get('key')
+            if self.event_key is None:
+                self.event_key = key
+            if key == self.event_key:
+                return position, event_element
+        return None, None
+
+    def _get_team(self, team_element, teams_by_signature, players_by_signature):
+        """
+        Return the Team for `team_element`, reused from the previous
+        revision if its XML is unchanged. Otherwise the team is built
+        again, reusing the players whose XML is unchanged.
+        """
+        player_elements = team_element.findall(NEWSMLG2_NS+'player')
+        player_signatures = [
+            self._signature(player_element) for player_element in player_elements
+        ]
+        # each element is looked at once: the team's signature is made
+        # of its own elements and of its players' signatures
+        team_signature = (
+            self._signature(team_element, NEWSMLG2_NS+'player'), tuple(player_signatures)
+        )
+        # popped, so that an object is never used twice in a revision
+        cached = self._teams.pop(team_signature, None)
+        if cached is not None:
+            team, player_signatures = cached
+            for player_signature, player in zip(player_signatures, team.players.array_contents):
+                self._players.pop(player_signature, None)
+                players_by_signature[player_signature] = player
+            self.stats['teams_reused'] += 1
+            self.stats['players_reused'] += len(player_signatures)
+            teams_by_signature[team_signature] = cached
+            return team
+
+        for player_element in player_elements:
+            team_element.remove(player_element)
+        team = Team(xmlelement = team_element)
+        if player_elements:
+            players = Players()
+            for player_element, player_signature in zip(player_elements, player_signatures):
+                player = self._players.pop(player_signature, None)
+                if player is None:
+                    player = Player(xmlelement = player_element)
+                    self.stats['players_built'] += 1
+                else:
+                    self.stats['players_reused'] += 1
+                players_by_signature[player_signature] = player
+                player._parent = players
+                players.array_contents.append(player)
+            team._set_child('players', players)
+        self.stats['teams_built'] += 1
+        teams_by_signature[team_signature] = (team, player_signatures)
+        return team
+
+    def _signature(self, xmlelement, skip=None):
+        """
+        Return a signature of the XML of `xmlelement`, leaving out its
+        children tagged `skip`: equal signatures give equal objects, and
+        are much cheaper to compute and compare than the whole XML
+        serialised.
+        """
+        signature = [
+            (xmlelement.tag, tuple(xmlelement.attrib.items()), xmlelement.text, len(xmlelement))
+        ]
+        for child in xmlelement:
+            if child.tag != skip:
+                signature.append(self.backend.signature(child))
+        return tuple(signature)
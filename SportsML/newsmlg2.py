@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from . import interning
+from .backends import is_element
+from .core import NEWSMLG2_NS, ONE, MANY, TEXT, BaseObject, GenericArray
 from .base_metadata import CommonAttributes
 
 
@@ -13,10 +14,10 @@ class TimeValidityAttributes(BaseObject):
         # TODO
         pass
 
-    def as_dict(self):
-        super(TimeValidityAttributes, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(TimeValidityAttributes, self)._as_dict(memoize)
         # TODO
-        return self.dict
+        return dict
 
 
 class IntlStringType(BaseObject):
@@ -29,6 +30,7 @@ class ConceptNameType(TimeValidityAttributes, IntlStringType):
     The type of a natural language name for the concept (Type defined in this XML Schema only)
     """
     name = None
+    text_attribute = 'name'
     attributes = {
         # A refinement of the semantics of the name - expressed by a QCode
         'role': 'role',
@@ -43,8 +45,9 @@ class ConceptNameType(TimeValidityAttributes, IntlStringType):
     def __init__(self, **kwargs):
         super(ConceptNameType, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.name = xmlelement.text
+        if is_element(xmlelement):
+            self.name = interning.intern(xmlelement.text)
+            self._track_content(self.name)
 
     name_role_mappings = {
         'nrol:full': 'full',
@@ -55,24 +58,43 @@ class ConceptNameType(TimeValidityAttributes, IntlStringType):
         'nprt:nickname': 'nickname',
     }
 
-    def as_dict(self):
-        super(ConceptNameType, self).as_dict()
+    def _load_dict(self, value, consume):
+        value = value or {}
+        name = value.get('name')
+        name_role = None
+        for role, key in self.name_role_mappings.items():
+            if key in value:
+                name = value[key]
+                name_role = role
+                break
+        super(ConceptNameType, self)._load_dict(value, consume)
+        if name_role:
+            # see _as_dict: roles and parts are both mapped
+            if name_role.startswith('nprt:'):
+                self.attr_values['part'] = name_role
+            else:
+                self.attr_values['role'] = name_role
+        self.name = interning.intern(name)
+        self._track_content(self.name)
+
+    def _as_dict(self, memoize):
+        dict = super(ConceptNameType, self)._as_dict(memoize)
         # the only place where we diverge from a direct match with the SportsML
         role = self.attr_values.get('role', None)
         part = self.attr_values.get('part', None)
         if role and role in self.name_role_mappings.keys():
-            self.dict.update({
+            dict.update({
                 self.name_role_mappings[role]: self.name
             })
-            del self.dict['role']
+            del dict['role']
         elif part and part in self.name_role_mappings.keys():
-            self.dict.update({
+            dict.update({
                 self.name_role_mappings[part]: self.name
             })
-            del self.dict['part']
+            del dict['part']
         elif self.name:
-            self.dict.update({'name': self.name})
-        return self.dict
+            dict.update({'name': self.name})
+        return dict
 
 
 class Names(GenericArray):
@@ -158,19 +180,22 @@ class TruncatedDateTimeType(CommonPowerAttributes):
     element_name = None
     # value of the date-time
     date_time = None
+    text_attribute = 'date_time'
+    # as_dict always outputs the date-time
+    _empty = False
 
     def __init__(self, **kwargs):
         super(TruncatedDateTimeType, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             self.element_name = xmlelement.tag
             self.date_time = xmlelement.text
 
-    def as_dict(self):
-        super(TruncatedDateTimeType, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(TruncatedDateTimeType, self)._as_dict(memoize)
         # TODO maybe: convert tag name/element name into camelCase?
-        self.dict.update({self.element_name: self.date_time })
-        return self.dict
+        dict.update({self.element_name: self.date_time })
+        return dict
 
 
 class TruncatedDateTimePropType(CommonPowerAttributes):
@@ -198,34 +223,30 @@ class ConceptDefinitionGroup(BaseObject):
     remote_info = None
     hierarchy_info = None
 
-    def __init__(self, **kwargs):
-        super(ConceptDefinitionGroup, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
-            self.definition = xmlelement.findtext(NEWSMLG2_NS+'definition')
-            self.note = xmlelement.findtext(NEWSMLG2_NS+'note')
-            self.facet = xmlelement.findtext(NEWSMLG2_NS+'facet')
-            self.remote_info= xmlelement.findtext(NEWSMLG2_NS+'remoteInfo')
-            self.hierarchy_info = xmlelement.findtext(NEWSMLG2_NS+'hierarchyInfo')
-
-    def as_dict(self):
-        super(ConceptDefinitionGroup, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'name': ('names', Names, MANY),
+        NEWSMLG2_NS+'definition': ('definition', None, TEXT),
+        NEWSMLG2_NS+'note': ('note', None, TEXT),
+        NEWSMLG2_NS+'facet': ('facet', None, TEXT),
+        NEWSMLG2_NS+'remoteInfo': ('remote_info', None, TEXT),
+        NEWSMLG2_NS+'hierarchyInfo': ('hierarchy_info', None, TEXT),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(ConceptDefinitionGroup, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({'names': self.names.as_dict() })
+            dict.update({'names': self.names.as_dict(memoize) })
         if self.definition:
-            self.dict.update({'definition': self.definition })
+            dict.update({'definition': self.definition })
         if self.note:
-            self.dict.update({'note': self.note })
+            dict.update({'note': self.note })
         if self.facet:
-            self.dict.update({'facet': self.facet })
+            dict.update({'facet': self.facet })
         if self.remote_info:
-            self.dict.update({'remoteInfo': self.remote_info })
+            dict.update({'remoteInfo': self.remote_info })
         if self.hierarchy_info:
-            self.dict.update({'hierarchyInfo': self.hierarchy_info })
-        return self.dict
+            dict.update({'hierarchyInfo': self.hierarchy_info })
+        return dict
 
 
 class ConceptRelationshipsGroup(BaseObject):
@@ -249,20 +270,15 @@ class FlexPropType(CommonAttributes, FlexAttributes, I18NAttributes):
     """
     Flexible generic type for both controlled and uncontrolled values
     """
-    def __init__(self, **kwargs):
-        super(FlexPropType, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
-            # TODO hierarchyInfo
-
-    def as_dict(self, **kwargs):
-        super(FlexPropType, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'name': ('names', Names, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(FlexPropType, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({'names': self.names.as_dict() })
-        return self.dict
+            dict.update({'names': self.names.as_dict(memoize) })
+        return dict
 
 
 class FlexLocationPropType(ConceptDefinitionGroup, FlexAttributes, CommonPowerAttributes, I18NAttributes):
@@ -274,29 +290,21 @@ class FlexLocationPropType(ConceptDefinitionGroup, FlexAttributes, CommonPowerAt
     geo_area_details = None
     poi_details = None
 
-    def __init__(self, **kwargs):
-        super(FlexLocationPropType, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.geo_area_details = GeoAreaDetails(
-                # note camelCase element name, this is correct
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'geoAreaDetails')
-            )
-            self.poi_details = POIDetails(
-                # note case of element name, this is correct
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'POIDetails')
-            )
-            """
-            # TODO <xs:group ref="ConceptRelationshipsGroup" minOccurs="0" />
-            """
-
-    def as_dict(self):
-        super(FlexLocationPropType, self).as_dict()
+    children = {
+        # note camelCase element name, this is correct
+        NEWSMLG2_NS+'geoAreaDetails': ('geo_area_details', 'GeoAreaDetails', ONE),
+        # note case of element name, this is correct
+        NEWSMLG2_NS+'POIDetails': ('poi_details', 'POIDetails', ONE),
+        # TODO <xs:group ref="ConceptRelationshipsGroup" minOccurs="0" />
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(FlexLocationPropType, self)._as_dict(memoize)
         if self.geo_area_details:
-            self.dict.update({'geoAreaDetails': self.geo_area_details.as_dict() })
+            dict.update({'geoAreaDetails': self.geo_area_details.as_dict(memoize) })
         if self.poi_details:
-            self.dict.update({'POIDetails': self.poi_details.as_dict() })
-        return self.dict
+            dict.update({'POIDetails': self.poi_details.as_dict(memoize) })
+        return dict
 
     def __bool__(self):
         # TODO
@@ -414,8 +422,12 @@ class GeoAreaDetails(CommonPowerAttributes):
             </xs:sequence>
     """
 
-    def as_dict(self):
-        return self.dict
+    def _as_dict(self, memoize):
+        return {}
+
+    def __bool__(self):
+        # TODO: as_dict doesn't output anything yet
+        return False
 
 class Lines(BaseObject):
     """
@@ -476,39 +488,27 @@ class Address(CommonPowerAttributes):
     # A postal code part of the address.
     postal_code = None
 
-    def __init__(self, **kwargs):
-        super(Address, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.lines = Lines(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'line')
-            )
-            self.localities = Localities(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'locality')
-            )
-            self.areas = Areas(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'area')
-            )
-            self.country = Country(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'country')
-            )
-            self.postal_code = PostalCode(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'postal-code')
-            )
-
-    def as_dict(self):
-        super(Address, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'line': ('lines', Lines, MANY),
+        NEWSMLG2_NS+'locality': ('localities', 'Localities', MANY),
+        NEWSMLG2_NS+'area': ('areas', Areas, MANY),
+        NEWSMLG2_NS+'country': ('country', Country, ONE),
+        NEWSMLG2_NS+'postal-code': ('postal_code', PostalCode, ONE),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Address, self)._as_dict(memoize)
         if self.lines:
-            self.dict.update({'lines': self.lines.as_dict() })
+            dict.update({'lines': self.lines.as_dict(memoize) })
         if self.localities:
-            self.dict.update({'localities': self.localities.as_dict() })
+            dict.update({'localities': self.localities.as_dict(memoize) })
         if self.areas:
-            self.dict.update({'areas': self.areas.as_dict() })
+            dict.update({'areas': self.areas.as_dict(memoize) })
         if self.country:
-            self.dict.update({'country': self.country.as_dict() })
+            dict.update({'country': self.country.as_dict(memoize) })
         if self.postal_code:
-            self.dict.update({'postalCode': self.postal_code.as_dict() })
-        return self.dict
+            dict.update({'postalCode': self.postal_code.as_dict(memoize) })
+        return dict
 
 
 class POIDetails(CommonPowerAttributes):
@@ -534,21 +534,17 @@ class POIDetails(CommonPowerAttributes):
     # The date (and optionally the time) on which this Point of Interest ceased to exist
     ceased_to_exist = None
 
-    def __init__(self, **kwargs):
-        super(POIDetails, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.address = Address(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'address')
-            )
+    children = {
+        NEWSMLG2_NS+'address': ('address', Address, ONE),
+    }
         # TODO finish this
 
-    def as_dict(self):
-        super(POIDetails, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(POIDetails, self)._as_dict(memoize)
         if self.address:
-            self.dict.update({'address': self.address.as_dict() })
+            dict.update({'address': self.address.as_dict(memoize) })
         # TODO finish this
-        return self.dict
+        return dict
 
     """
         <xs:complexType>
@@ -1,43 +1,495 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
+import io
+import mmap
 
+from .backends import get_backend
 from .core import NEWSMLG2_NS, NITF_NS
+from .projection import EXCLUDED, OUTSIDE, Projection
 from .sports_content import SportsContent
+from .sports_events import SportsEvent
+from .sports_metadata import SportsMetadata
+from .event_metadata import EventMetadata
+from .actions import Action
+from .standings import Standing
+
+# The elements leading from a NewsML-G2 newsItem to its sports-content,
+# by parent: the rest of the envelope is skipped while streaming.
+ENVELOPE_PATH = {
+    NEWSMLG2_NS+'newsItem': NEWSMLG2_NS+'contentSet',
+    NEWSMLG2_NS+'contentSet': NEWSMLG2_NS+'inlineXML',
+    NEWSMLG2_NS+'inlineXML': NEWSMLG2_NS+'sports-content',
+}
+
+# Bytes read at a time by peek(): the header of a document is usually
+# in the first few kilobytes.
+PEEK_CHUNK_SIZE = 16 * 1024
+
+
+class SportsMLHeader(object):
+    """
+    What a document is about, as returned by SportsMLParser.peek(): its
+    first sports-metadata and the event-metadata of its first
+    sports-event, as objects, and their main attributes, and the guid
+    and version of the NewsML-G2 item around it.
+    """
+
+    def __init__(self, sports_metadata=None, event_metadata=None, guid=None, version=None):
+        self.sports_metadata = sports_metadata
+        self.event_metadata = event_metadata
+        # guid and version of the NewsML-G2 item, if the document is one
+        self.guid = guid
+        self.version = version
+        attr_values = sports_metadata.attr_values if sports_metadata else {}
+        self.doc_id = attr_values.get('doc-id')
+        self.date_time = attr_values.get('date-time')
+        self.fixture_key = attr_values.get('fixture-key')
+        self.document_class = attr_values.get('document-class')
+        self.event_key = event_metadata.attr_values.get('key') if event_metadata else None
+
+    def as_dict(self):
+        dict = {}
+        if self.sports_metadata:
+            dict.update({ 'sportsMetadata': self.sports_metadata.as_dict() })
+        if self.event_metadata:
+            dict.update({ 'eventMetadata': self.event_metadata.as_dict() })
+        return dict
+
 
 class SportsMLParser(object):
     _root_element = None
     header = None
     order = None
+    # guid and version of the NewsML-G2 item around sports-content, if any
+    guid = None
+    version = None
+
+    def __init__(self, param, backend=None, lazy=False, include=None):
+        """
+        Parse `param`, a filename or a string of XML. `backend` names
+        the XML backend to use (see backends.py), the default is the
+        standard library's ElementTree. With lazy=True, actions, players
+        and the other bulky children of sports-events, teams and
+        statistics are only built when first read (see SportsContent).
+        With `include`, a list of paths such as
+        'sports-event/team/team-stats' (see projection.py), only the
+        elements on those paths are built, and the rest is left out.
 
-    def __init__(self, param):
+        Guessing between a filename and XML text costs a failed file
+        lookup for every in-memory document; from_path(), from_bytes(),
+        from_file() and from_mmap() don't have to guess.
+        """
         if type(param) == str:
-            tree = None
+            backend = get_backend(backend)
             try:
-                tree = etree.parse(param)
-                self._root_element = tree.getroot()
+                root_element = backend.parse(param)
+                filename = param
             except IOError:
-                self._root_element = etree.fromstring(param)
-            if self._root_element.tag == NEWSMLG2_NS+'newsItem':
-                # it's a NewsML-G2 item, look for SportsContent inside of it
-                sportsml_top_element = self._root_element.find(
-                    ".//"+NEWSMLG2_NS+"sports-content"
-                )
-            elif self._root_element.tag == NEWSMLG2_NS+'sports-content':
-                sportsml_top_element = self._root_element
-            else:
-                raise Exception(
-                    filename +
-                    " doesn't seem to be a valid NewsML-G2 or SportsML-G2 document."
-                )
-            self.sports_content = SportsContent(
-                xmlelement = sportsml_top_element
-            )
+                root_element = backend.fromstring(param)
+                filename = None
+            self._set_root_element(root_element, filename, lazy, include)
         else:
             raise Exception("filename should be a string")
 
+    @classmethod
+    def from_path(cls, path, backend=None, lazy=False, include=None):
+        """
+        Parse the file at `path`.
+        """
+        return cls._from_root_element(get_backend(backend).parse(path), path, lazy, include)
+
+    @classmethod
+    def from_bytes(cls, data, backend=None, lazy=False, include=None):
+        """
+        Parse `data`, the XML document as bytes or any other bytes-like
+        object (bytearray, memoryview...). The encoding comes from the
+        document itself: nothing is decoded or copied beforehand.
+        """
+        return cls._from_root_element(get_backend(backend).fromstring(data), None, lazy, include)
+
+    @classmethod
+    def from_file(cls, fp, backend=None, lazy=False, include=None):
+        """
+        Parse the document read from `fp`, a binary file object, in
+        chunks as the XML parser asks for them.
+        """
+        return cls._from_root_element(get_backend(backend).parse(fp), None, lazy, include)
+
+    @classmethod
+    def from_mmap(cls, path, backend=None, lazy=False, include=None):
+        """
+        Parse the file at `path` through a read-only memory map, so the
+        XML parser reads the file's pages directly instead of a copy of
+        its contents. Suited to large archive files.
+        """
+        with open(path, 'rb') as fp:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                root_element = get_backend(backend).fromstring(data)
+        return cls._from_root_element(root_element, path, lazy, include)
+
+    @classmethod
+    def _from_root_element(cls, root_element, name=None, lazy=False, include=None):
+        parser = cls.__new__(cls)
+        parser._set_root_element(root_element, name, lazy, include)
+        return parser
+
+    def _set_root_element(self, root_element, name=None, lazy=False, include=None):
+        self._root_element = root_element
+        if root_element.tag == NEWSMLG2_NS+'newsItem':
+            self.guid = root_element.get('guid')
+            self.version = root_element.get('version')
+        sports_content_element = self._find_sports_content(root_element, name)
+        projection = Projection.get(include)
+        if projection is not None:
+            projection.prune(sports_content_element)
+        self.sports_content = SportsContent(
+            xmlelement = sports_content_element,
+            lazy = lazy
+        )
+
+    @staticmethod
+    def _find_sports_content(root_element, name=None):
+        if root_element.tag == NEWSMLG2_NS+'newsItem':
+            # it's a NewsML-G2 item, look for SportsContent inside of it
+            return root_element.find(".//"+NEWSMLG2_NS+"sports-content")
+        elif root_element.tag == NEWSMLG2_NS+'sports-content':
+            return root_element
+        raise Exception(
+            (name or "Document") +
+            " doesn't seem to be a valid NewsML-G2 or SportsML-G2 document."
+        )
+
     def getSportsContent(self):
         return self.sports_content
 
+    @classmethod
+    def peek(cls, source, backend=None):
+        """
+        Return the SportsMLHeader of the document in `source` (a
+        filename, bytes or a binary file object), reading no further
+        than the end of its first event-metadata. Reading stops earlier
+        when the document shows it has none: when sports-content goes on
+        with something other than a sports-event, or its first
+        sports-event with something other than event-metadata. The time
+        taken doesn't depend on the size of the document.
+        """
+        if isinstance(source, str):
+            with open(source, 'rb') as fp:
+                return cls._peek(fp, backend)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            return cls._peek(io.BytesIO(source), backend)
+        return cls._peek(source, backend)
+
+    @staticmethod
+    def _peek(fp, backend):
+        pullparser = get_backend(backend).pullparser(('start', 'end'))
+        path = []
+        # depth inside the envelope element being skipped, if any
+        skipping = 0
+        guid = version = None
+        sports_metadata = None
+        # the first sports-event, until its first child has been seen
+        first_event = None
+        while True:
+            data = fp.read(PEEK_CHUNK_SIZE)
+            if data:
+                pullparser.feed(data)
+            else:
+                pullparser.close()
+            for event, xmlelement in pullparser.read_events():
+                if skipping:
+                    skipping += 1 if event == 'start' else -1
+                    continue
+                tag = xmlelement.tag
+                if event == 'end':
+                    path.pop()
+                parent = path[-1] if path else None
+                if event == 'start':
+                    if parent is None:
+                        if tag == NEWSMLG2_NS+'newsItem':
+                            guid = xmlelement.get('guid')
+                            version = xmlelement.get('version')
+                        elif tag != NEWSMLG2_NS+'sports-content':
+                            raise Exception(
+                                "Document doesn't seem to be a valid NewsML-G2 or SportsML-G2 document."
+                            )
+                    elif tag != ENVELOPE_PATH.get(parent, tag):
+                        skipping = 1
+                        continue
+                    if parent == NEWSMLG2_NS+'sports-content' and tag != NEWSMLG2_NS+'sports-metadata':
+                        if tag != NEWSMLG2_NS+'sports-event' or first_event is not None:
+                            return SportsMLHeader(sports_metadata, None, guid, version)
+                        first_event = xmlelement
+                    elif first_event is not None and parent == NEWSMLG2_NS+'sports-event' \
+                            and tag != NEWSMLG2_NS+'event-metadata':
+                        return SportsMLHeader(sports_metadata, None, guid, version)
+                    path.append(tag)
+                    continue
+                if tag == NEWSMLG2_NS+'sports-metadata' and sports_metadata is None \
+                        and parent == NEWSMLG2_NS+'sports-content':
+                    sports_metadata = SportsMetadata(xmlelement = xmlelement)
+                elif tag == NEWSMLG2_NS+'event-metadata' and first_event is not None \
+                        and parent == NEWSMLG2_NS+'sports-event':
+                    return SportsMLHeader(
+                        sports_metadata, EventMetadata(xmlelement = xmlelement), guid, version
+                    )
+                elif tag == NEWSMLG2_NS+'sports-content':
+                    return SportsMLHeader(sports_metadata, None, guid, version)
+            if not data:
+                raise Exception(
+                    "Document doesn't seem to be a valid NewsML-G2 or SportsML-G2 document."
+                )
+
     def get_order(self):
         return self.order
+
+    @classmethod
+    def iter_events(cls, source, backend=None, include=None):
+        """
+        Stream the document in `source` (a filename or file object),
+        yielding each outermost SportsEvent as soon as its closing tag
+        has been read. Nested sports-events stay inside their parent.
+        With `include` (see __init__), elements outside the paths are
+        dropped as soon as they have been read.
+        """
+        return cls._iter_objects(
+            source, NEWSMLG2_NS+'sports-event', SportsEvent, backend, include
+        )
+
+    @classmethod
+    def iter_actions(cls, source, backend=None, include=None):
+        """
+        Stream the document in `source` (a filename or file object),
+        yielding each top-level Action as soon as its closing tag
+        has been read. Sub-actions stay inside their parent Action.
+        With `include`, as for iter_events(): an action is at
+        'sports-event/actions/action'.
+        """
+        return cls._iter_objects(
+            source, NEWSMLG2_NS+'action', Action, backend, include
+        )
+
+    @staticmethod
+    def _iter_objects(source, tag, object_class, backend=None, include=None):
+        stream = _ObjectStream({tag: object_class}, include)
+        events = get_backend(backend).iterparse(source, ('start', 'end'))
+        for obj in stream.read(events):
+            yield obj
+
+
+class _ObjectStream(object):
+    """
+    Turns the 'start' and 'end' events of a document into objects, for
+    iter_events(), iter_actions() and SportsMLPushParser: each element
+    whose tag is in `object_classes` is built, as soon as its closing
+    tag has been read, unless it is inside an element of the same tag.
+
+    Only the path from the root to the current element is kept: every
+    completed element outside a wanted subtree is detached from its
+    parent, and every wanted subtree is detached as soon as it has been
+    turned into an object, unless it is inside another wanted one.
+
+    In a NewsML-G2 item, only the elements leading to sports-content
+    (see ENVELOPE_PATH) are looked at: the rest of the envelope is
+    skipped and dropped as it is read. The guid and version of the item
+    are kept.
+    """
+
+    def __init__(self, object_classes, include=None):
+        self.object_classes = object_classes
+        self.path = []
+        # depth inside the envelope element being skipped, if any
+        self.skipping = 0
+        self.guid = None
+        self.version = None
+        # the wanted elements open on the path, and how many of each tag
+        self.targets = []
+        self.depths = dict.fromkeys(object_classes, 0)
+        # with a projection, the plan of each element of the path;
+        # excluded elements are detached too, even in a wanted subtree
+        self.projection = Projection.get(include)
+        self.plans = []
+
+    def read(self, events):
+        object_classes = self.object_classes
+        path = self.path
+        targets = self.targets
+        depths = self.depths
+        projection = self.projection
+        plans = self.plans
+        skipping = self.skipping
+        for event, xmlelement in events:
+            if skipping:
+                if event == 'start':
+                    skipping += 1
+                    continue
+                skipping -= 1
+                if not skipping:
+                    path[-1].remove(xmlelement)
+                    xmlelement.clear()
+                continue
+            tag = xmlelement.tag
+            if event == 'start':
+                if len(path) < 4:
+                    if not path:
+                        if tag == NEWSMLG2_NS+'newsItem':
+                            self.guid = xmlelement.get('guid')
+                            self.version = xmlelement.get('version')
+                        elif tag != NEWSMLG2_NS+'sports-content':
+                            raise Exception(
+                                "Document doesn't seem to be a valid NewsML-G2 or SportsML-G2 document."
+                            )
+                    elif tag != ENVELOPE_PATH.get(path[-1].tag, tag):
+                        # the rest of the envelope, such as itemMeta
+                        skipping = 1
+                        continue
+                path.append(xmlelement)
+                if tag in object_classes:
+                    targets.append(xmlelement)
+                    depths[tag] += 1
+                if projection is not None:
+                    if tag == NEWSMLG2_NS+'sports-content':
+                        plans.append(projection.plan)
+                    elif not plans or plans[-1] is OUTSIDE:
+                        plans.append(OUTSIDE)
+                    else:
+                        plans.append(Projection.child_plan(plans[-1], tag))
+                continue
+            path.pop()
+            excluded = projection is not None and plans.pop() is EXCLUDED
+            if tag in object_classes:
+                targets.pop()
+                depths[tag] -= 1
+                if depths[tag] == 0 and not excluded:
+                    yield object_classes[tag](xmlelement = xmlelement)
+            if (not targets or excluded) and path:
+                path[-1].remove(xmlelement)
+                xmlelement.clear()
+        # kept for the next chunk, when fed by SportsMLPushParser
+        self.skipping = skipping
+
+    def describe_incomplete(self):
+        """
+        Name the innermost wanted element still open, or else the
+        innermost element, followed by the path to where the document
+        stopped, for truncated documents.
+        """
+        xmlelement = self.targets[-1] if self.targets else self.path[-1]
+        labels = []
+        for element in self.path:
+            label = element.tag.split('}')[-1]
+            key = element.get('id') or element.get('key')
+            if key is None and element.tag == NEWSMLG2_NS+'sports-event':
+                event_metadata = element.find(NEWSMLG2_NS+'event-metadata')
+                if event_metadata is not None:
+                    key = event_metadata.get('key')
+            if key is not None:
+                label += "[" + key + "]"
+            labels.append(label)
+            if element is xmlelement:
+                name = label
+        return name + " (stopped in /" + "/".join(labels) + ")"
+
+
+class SportsMLPushParser(object):
+    """
+    Parses a document pushed to it in chunks of any size, such as from
+    a socket, without waiting for the whole of it:
+
+        parser = SportsMLPushParser()
+        for data in chunks:
+            for obj in parser.feed(data):
+                ...
+        for obj in parser.close():
+            ...
+
+    Each SportsEvent, Action and Standing is returned by the feed()
+    whose data holds its closing tag. An action is returned on its
+    own, and then again inside its sports-event; sub-actions and nested
+    sports-events stay inside their parent. Pass `objects` to only get
+    some of them, such as objects=('action',) for play-by-play.
+    `backend` and `include` are as for SportsMLParser. Like
+    iter_events(), only the XML of the objects not yet returned is
+    kept.
+    """
+
+    # The objects that can be returned, by element name.
+    object_classes = {
+        'sports-event': SportsEvent,
+        'action': Action,
+        'standing': Standing,
+    }
+
+    def __init__(self, backend=None, include=None, objects=('sports-event', 'action', 'standing')):
+        for name in objects:
+            if name not in self.object_classes:
+                raise Exception("SportsMLPushParser can't return '" + str(name) + "' objects")
+        self._backend = get_backend(backend)
+        self._pullparser = self._backend.pullparser(('start', 'end'))
+        self._end_line = 1
+        self._end_column = 0
+        self._stream = _ObjectStream(
+            dict((NEWSMLG2_NS+name, self.object_classes[name]) for name in objects),
+            include
+        )
+        self._started = False
+
+    @property
+    def guid(self):
+        """
+        The guid of the NewsML-G2 item, once its start tag has been fed,
+        None for a sports-content document.
+        """
+        return self._stream.guid
+
+    @property
+    def version(self):
+        """
+        The version of the NewsML-G2 item, as for guid.
+        """
+        return self._stream.version
+
+    def feed(self, data):
+        """
+        Parse `data`, the next chunk of the document as bytes, and
+        return the list of objects completed by it.
+        """
+        if data:
+            self._started = True
+            # where the data fed so far ends, in lines and characters
+            newline = data.rfind(b'\n')
+            if newline < 0:
+                self._end_column += len(data.decode('utf-8', 'ignore'))
+            else:
+                self._end_line += data.count(b'\n')
+                self._end_column = len(data[newline + 1:].decode('utf-8', 'ignore'))
+        self._pullparser.feed(data)
+        return list(self._stream.read(self._pullparser.read_events()))
+
+    def close(self):
+        """
+        Finish the document, returning the objects completed by the end
+        of it. Raises an exception naming the element left incomplete
+        if the document was cut short, and the XML parser's error if it
+        isn't well-formed.
+        """
+        error = None
+        try:
+            self._pullparser.close()
+        except SyntaxError as e:
+            # ElementTree's and lxml's ParseError
+            error = e
+        objects = list(self._stream.read(self._pullparser.read_events()))
+        if not self._started:
+            raise Exception("Document ended before it started: no data was fed.")
+        if error is not None:
+            if not self._backend.ended_early(error, (self._end_line, self._end_column)):
+                raise error
+            if not self._stream.path:
+                raise Exception("Document ended before its first element was complete.") from error
+        if self._stream.path:
+            raise Exception(
+                "Document ended before the end of the " +
+                self._stream.describe_incomplete()
+            ) from error
+        return objects
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Field projection: building only the parts of a document that are asked
+for.
+
+    SportsMLParser(filename, include=['sports-event/team/team-stats'])
+
+Each path is a list of element names separated by '/', starting from
+the children of sports-content. The elements on a path are built with
+their attributes, and only the children on the path; the element at
+the end of a path is built with everything inside it. Every other
+element is left out before any object is built, as if it wasn't in the
+document: the attributes for it hold empty objects.
+
+Names without a namespace are SportsML-G2 ones. Paths follow the XML,
+so an action is at 'sports-event/actions/action'.
+"""
+
+from .core import NEWSMLG2_NS
+
+# Plan of an element whose whole content is wanted.
+ALL = None
+# Plan of an element outside every path.
+EXCLUDED = 'excluded'
+# Plan of the elements around sports-content, such as a NewsML-G2
+# envelope, while streaming.
+OUTSIDE = 'outside'
+
+
+class Projection(object):
+    """
+    The paths given to `include`, compiled into a plan: a tree of
+    dicts mapping each element name to the plan of its children, or to
+    ALL at the end of a path. Compile once and pass the Projection as
+    `include` to parse many documents with the same paths.
+    """
+
+    def __init__(self, paths):
+        if isinstance(paths, str):
+            paths = [paths]
+        self.paths = tuple(paths)
+        self.plan = {}
+        for path in self.paths:
+            tags = [
+                name if name.startswith('{') else NEWSMLG2_NS + name
+                for name in path.strip('/').split('/') if name
+            ]
+            if not tags:
+                raise Exception("Empty path in include: '" + str(path) + "'")
+            plan = self.plan
+            for tag in tags[:-1]:
+                if tag in plan and plan[tag] is ALL:
+                    # a shorter path already takes everything
+                    break
+                plan = plan.setdefault(tag, {})
+            else:
+                plan[tags[-1]] = ALL
+
+    @classmethod
+    def get(cls, include):
+        """
+        Return `include` as a Projection: None, a Projection or paths.
+        """
+        if include is None or isinstance(include, Projection):
+            return include
+        return cls(include)
+
+    @staticmethod
+    def child_plan(plan, tag):
+        """
+        Return the plan of a child element `tag` of an element whose plan
+        is `plan`.
+        """
+        if plan is ALL:
+            return ALL
+        if plan is EXCLUDED:
+            return EXCLUDED
+        return plan.get(tag, EXCLUDED)
+
+    def prune(self, sports_content_element):
+        """
+        Remove every element outside the paths from the tree of
+        `sports_content_element`. Only the elements on the paths are
+        looked at, not the whole tree.
+        """
+        stack = [(sports_content_element, self.plan)]
+        while stack:
+            xmlelement, plan = stack.pop()
+            for child in list(xmlelement):
+                child_plan = plan.get(child.tag, EXCLUDED)
+                if child_plan is EXCLUDED:
+                    xmlelement.remove(child)
+                elif child_plan is not ALL:
+                    stack.append((child, child_plan))
@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, GenericArray
+from .core import NEWSMLG2_NS, ONE, MANY, GenericArray
 from .base_metadata import BaseMetadata, CommonAttributes
+from .sports_events import SportsEvents
 
 
 class ScheduleMetadata(BaseMetadata):
@@ -25,23 +25,19 @@ class Schedule(CommonAttributes):
         # Displayable label that describes what events this schedule includes.
         'content-label': 'contentLabel'
     }
+    # as_dict always outputs metadata and events
+    _empty = False
 
-    def __init__(self, **kwargs):
-        super(Schedule, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.schedule_metadata = ScheduleMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'schedule-metadata')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-
-    def as_dict(self):
-        super(Schedule, self).as_dict()
-        self.dict.update({'scheduleMetadata': self.schedule_metadata.as_dict() })
-        self.dict.update({'sportsEvents': self.sports_events.as_dict() })
-        return self.dict
+    children = {
+        NEWSMLG2_NS+'schedule-metadata': ('schedule_metadata', ScheduleMetadata, ONE),
+        NEWSMLG2_NS+'sports-event': ('sports_events', SportsEvents, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Schedule, self)._as_dict(memoize)
+        dict.update({'scheduleMetadata': self.schedule_metadata.as_dict(memoize) })
+        dict.update({'sportsEvents': self.sports_events.as_dict(memoize) })
+        return dict
 
 
 class Schedules(GenericArray):
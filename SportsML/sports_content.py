@@ -1,14 +1,16 @@
 #!/usr/bin/env python
 
 import json
-import xml.etree.ElementTree as etree
 
-from .core import NEWSMLG2_NS, BaseObject
+from .backends import is_element
+from .core import NEWSMLG2_NS, MANY, BaseObject, _XMLWriter, _id_indexes, _lazy_building
 from .articles import Articles
+from .diff import diff
 from .sports_metadata import SportsMetadataSet
 from .sports_events import SportsEvents
 from .schedules import Schedules
 from .standings import Standings
+from .stats_table import stats_table
 from .statistics import Statistics
 from .tournaments import Tournaments
 
@@ -23,32 +25,45 @@ class SportsContent(BaseObject):
     standings = None
     statistics = None
     articles = None
+    # see get_by_id()
+    _id_index = None
+
+    children = {
+        NEWSMLG2_NS+'sports-metadata': ('sports_metadatas', SportsMetadataSet, MANY),
+        NEWSMLG2_NS+'sports-event': ('sports_events', SportsEvents, MANY),
+        NEWSMLG2_NS+'tournament': ('tournaments', Tournaments, MANY),
+        NEWSMLG2_NS+'schedule': ('schedules', Schedules, MANY),
+        NEWSMLG2_NS+'standing': ('standings', Standings, MANY),
+        NEWSMLG2_NS+'statistic': ('statistics', Statistics, MANY),
+        NEWSMLG2_NS+'article': ('articles', Articles, MANY),
+    }
 
     def __init__(self,  **kwargs):
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.sports_metadatas = SportsMetadataSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-metadata')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-            self.tournaments = Tournaments(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'tournament')
-            )
-            self.schedules = Schedules(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'schedule')
-            )
-            self.standings = Standings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'standing')
-            )
-            self.statistics = Statistics(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'statistic')
-            )
-            self.articles = Articles(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'article')
-            )
-        elif kwargs:
+        """
+        With lazy=True, the children named in 'lazy_children' by
+        SportsEvent, Team and Statistic (actions, players, officials...)
+        are only built from the XML when first read, so that reading
+        metadata doesn't pay for the rest of the document. The XML tree
+        is kept until then.
+        """
+        lazy = kwargs.get('lazy', False)
+        # ids and metadata keys are indexed while the tree is built
+        id_index = ({}, {})
+        outer_id_index = getattr(_id_indexes, 'current', None)
+        outer_lazy = getattr(_lazy_building, 'enabled', False)
+        _id_indexes.current = id_index
+        _lazy_building.enabled = lazy
+        try:
+            # with an xmlelement, BaseObject builds the children listed above
+            super(SportsContent, self).__init__(**kwargs)
+        finally:
+            _id_indexes.current = outer_id_index
+            _lazy_building.enabled = outer_lazy
+        if is_element(kwargs.get('xmlelement')):
+            # the ids of lazy children aren't known until they are built:
+            # get_by_id() then builds the index with a walk
+            self._id_index = None if lazy else id_index
+        else:
             if 'sports_metadata' in kwargs:
                 self.set_sports_metadata(kwargs['sports_metadata'])
             if 'sports_events' in kwargs:
@@ -64,49 +79,149 @@ class SportsContent(BaseObject):
             if 'articles' in kwargs:
                 self.set_articles(kwargs['articles'])
 
+    @classmethod
+    def from_json(cls, source):
+        """
+        Build a SportsContent from SportsJS: JSON text (str or bytes) or
+        a text or binary file object. The decoded JSON is released piece
+        by piece while the objects are built from it, so the document
+        isn't held twice in memory.
+        """
+        if isinstance(source, (str, bytes, bytearray)):
+            value = json.loads(source)
+        else:
+            value = json.load(source)
+        sports_content = cls()
+        sports_content._load_dict(value, True)
+        return sports_content
+
+    def _load_dict(self, value, consume):
+        # ids and metadata keys are indexed while the tree is built, as
+        # in __init__
+        id_index = ({}, {})
+        outer_id_index = getattr(_id_indexes, 'current', None)
+        _id_indexes.current = id_index
+        try:
+            super(SportsContent, self)._load_dict(value, consume)
+        finally:
+            _id_indexes.current = outer_id_index
+        self._id_index = id_index
+
     def set_sports_metadata(self, sports_metadata):
-        self.sports_metadata = sports_metadata
+        self._set_child('sports_metadatas', sports_metadata)
 
     def set_sports_events(self, sports_events):
-        self.sports_events = sports_events
+        self._set_child('sports_events', sports_events)
 
     def set_tournaments(self, tournaments):
-        self.tournaments = tournaments
+        self._set_child('tournaments', tournaments)
 
     def set_schedules(self, schedules):
-        self.schedules = schedules
+        self._set_child('schedules', schedules)
 
     def set_standings(self, standings):
-        self.standings = standings
+        self._set_child('standings', standings)
 
     def set_statistics(self, statistics):
-        self.statistics = statistics
+        self._set_child('statistics', statistics)
 
     def set_articles(self, articles):
-        self.articles = articles
+        self._set_child('articles', articles)
+
+    def get_by_id(self, reference, default=None):
+        """
+        Return the object in this document with the id `reference`, or
+        else the object (Team, Player, SportsEvent...) whose metadata
+        has the key `reference`. If the same id or key appears more than
+        once, the first object met in a walk of the tree is returned:
+        each object before its children, the children in the order of
+        their class's 'children' table and the items of an array in
+        document order. That isn't always document order: the teams of
+        a sports-event come before its players wherever they are in the
+        XML. Lazily built documents return the same object.
+
+        The index is filled while the document is parsed. After a set_*
+        method has changed the tree, it is rebuilt by one walk over the
+        tree on the next lookup.
+        """
+        if self._id_index is None:
+            self._id_index = self._build_id_index()
+        ids, keys = self._id_index
+        if reference in ids:
+            return ids[reference]
+        if reference in keys:
+            # only metadata objects have a key: return their owner
+            metadata = keys[reference]
+            return metadata._parent or metadata
+        return default
+
+    def diff(self, other):
+        """
+        Return the changes between this document and `other`, a newer
+        version of it, as a list of JSON Patch-like dicts keyed on ids
+        and metadata keys. See diff.py for the format.
+        """
+        return diff(self, other)
+
+    def stats_table(self, entity='player', numpy=False):
+        """
+        Return the stats of every player, or team with entity='team',
+        as columns: a dict of one array per stat, with one row per
+        player or team and period. See stats_table.py for the details.
+        """
+        return stats_table(self, entity, numpy)
+
+    def _build_id_index(self):
+        ids = {}
+        keys = {}
+        # depth-first, in the order _children() gives, which is the
+        # order objects are built in and added to the index while parsing
+        stack = [self]
+        while stack:
+            obj = stack.pop()
+            attr_values = obj.attr_values
+            if attr_values.get('id'):
+                ids.setdefault(attr_values['id'], obj)
+            if attr_values.get('key'):
+                keys.setdefault(attr_values['key'], obj)
+            children = list(obj._children())
+            children.reverse()
+            stack.extend(children)
+        return ids, keys
 
     def __str__(self):
         return (
             '<SportsContent>'
         )
 
-    def as_dict(self):
+    def _as_dict(self, memoize):
         dict = {}
         if self.sports_metadatas:
-            dict.update({ 'sportsMetadata': self.sports_metadatas.as_dict() })
+            dict.update({ 'sportsMetadata': self.sports_metadatas.as_dict(memoize) })
         if self.sports_events:
-            dict.update({ 'sportsEvents': self.sports_events.as_dict() })
+            dict.update({ 'sportsEvents': self.sports_events.as_dict(memoize) })
         if self.tournaments:
-            dict.update({ 'tournaments': self.tournaments.as_dict() })
+            dict.update({ 'tournaments': self.tournaments.as_dict(memoize) })
         if self.schedules:
-            dict.update({ 'schedules': self.schedules.as_dict() })
+            dict.update({ 'schedules': self.schedules.as_dict(memoize) })
         if self.standings:
-            dict.update({ 'standings': self.standings.as_dict() })
+            dict.update({ 'standings': self.standings.as_dict(memoize) })
         if self.statistics:
-            dict.update({ 'statistics': self.statistics.as_dict() })
+            dict.update({ 'statistics': self.statistics.as_dict(memoize) })
         if self.articles:
-            dict.update({ 'articles': self.articles.as_dict() })
+            dict.update({ 'articles': self.articles.as_dict(memoize) })
         return dict
 
     def to_json(self):
         return json.dumps(self.as_dict(), indent=4)
+
+    def write_xml(self, fp):
+        """
+        Write this document as SportsML-G2 XML to `fp`, a text or binary
+        file object or a socket, while walking the object tree: neither
+        the whole text nor an element tree is built. Only what the
+        objects hold is written, so parsing the output gives the same
+        objects, but elements and attributes this library doesn't read
+        are lost.
+        """
+        _XMLWriter(fp).write(self, NEWSMLG2_NS+'sports-content')
@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import importlib
 import json
 
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .backends import is_element
+from .core import NEWSMLG2_NS, ONE, MANY, WRAPPER, BaseObject, GenericArray
 from .sports_metadata import SportsMetadata
 from .event_metadata import EventMetadata
 from .base_metadata import CommonAttributes, CoverageAttributes
@@ -19,52 +19,40 @@ class SportsEvent(BaseObject):
     event_stats_set = None
     teams = None
     players = None
-    wagering_stats = None
+    wagering_stats_set = None
     officials = None
+    actions = None
     highlights = None
     awards = None
     sports_events = None
 
+    children = {
+        NEWSMLG2_NS+'event-metadata': ('event_metadata', EventMetadata, ONE),
+        NEWSMLG2_NS+'event-stats': ('event_stats', 'EventStatsSet', MANY),
+        NEWSMLG2_NS+'team': ('teams', Teams, MANY),
+        NEWSMLG2_NS+'player': ('players', Players, MANY),
+        # wagering-stats, maxOccurs unbounded
+        NEWSMLG2_NS+'wagering-stats': ('wagering_stats_set', WageringStatsSet, MANY),
+        # officials, maxOccurs 1
+        NEWSMLG2_NS+'officials': ('officials', Officials, WRAPPER),
+        # actions, maxOccurs 1
+        NEWSMLG2_NS+'actions': ('actions', Actions, WRAPPER),
+        # highlights, maxOccurs unbounded
+        NEWSMLG2_NS+'highlight': ('highlights', 'Highlights', MANY),
+        # award, maxOccurs unbounded
+        NEWSMLG2_NS+'award': ('awards', 'Awards', MANY),
+        NEWSMLG2_NS+'sports-event': ('sports_events', 'SportsEvents', MANY),
+    }
+    # built on first use by SportsContent(lazy=True)
+    lazy_children = (
+        'players', 'wagering_stats_set', 'officials', 'actions', 'highlights',
+        'awards', 'sports_events',
+    )
+
     def __init__(self,  **kwargs):
+        # with an xmlelement, BaseObject builds the children listed above
         super(SportsEvent, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.event_metadata = EventMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'event-metadata')
-            )
-            self.event_stats = EventStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'event-stats')
-            )
-            self.teams = Teams(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'team')
-            )
-            self.players = Players(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'player')
-            )
-            # wagering-stats, maxOccurs unbounded
-            self.wagering_stats_set = WageringStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'wagering-stats')
-            )
-            # officials, maxOccurs 1
-            self.officials = Officials(
-                xmlarray = xmlelement.find(NEWSMLG2_NS+'officials')
-            )
-            # actions, maxOccurs 1
-            self.actions = Actions(
-                xmlarray = xmlelement.find(NEWSMLG2_NS+'actions')
-            )
-            # highlights, maxOccurs unbounded
-            self.highlights = Highlights(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'highlight')
-            )
-            # award, maxOccurs unbounded
-            self.awards = Awards(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'award')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-        elif kwargs:
+        if not is_element(kwargs.get('xmlelement')):
             if 'event_metadata' in kwargs:
                 self.set_event_metadata(kwargs['event_metadata'])
             if 'event_stats' in kwargs:
@@ -74,7 +62,7 @@ class SportsEvent(BaseObject):
             if 'players' in kwargs:
                 self.set_players(kwargs['players'])
             if 'wagering_stats_set' in kwargs:
-                self.set_wagering_stats(kwargs['wagering_stats'])
+                self.set_wagering_stats(kwargs['wagering_stats_set'])
             if 'officials' in kwargs:
                 self.set_officials(kwargs['officials'])
             if 'actions' in kwargs:
@@ -84,56 +72,86 @@ class SportsEvent(BaseObject):
             if 'awards' in kwargs:
                 self.set_awards(kwargs['awards'])
             if 'sports_events' in kwargs:
-                self.set_awards(kwargs['sports_events'])
+                self.set_sports_events(kwargs['sports_events'])
+
+    def set_event_metadata(self, event_metadata):
+        self._set_child('event_metadata', event_metadata)
+
+    def set_event_stats(self, event_stats):
+        self._set_child('event_stats_set', event_stats)
+
+    def set_teams(self, teams):
+        self._set_child('teams', teams)
+
+    def set_players(self, players):
+        self._set_child('players', players)
+
+    def set_wagering_stats(self, wagering_stats):
+        self._set_child('wagering_stats_set', wagering_stats)
+
+    def set_officials(self, officials):
+        self._set_child('officials', officials)
+
+    def set_actions(self, actions):
+        self._set_child('actions', actions)
+
+    def set_highlights(self, highlights):
+        self._set_child('highlights', highlights)
+
+    def set_awards(self, awards):
+        self._set_child('awards', awards)
+
+    def set_sports_events(self, sports_events):
+        self._set_child('sports_events', sports_events)
 
     def __str__(self):
         return (
             '<SportsEvent>'
         )
 
-    def as_dict(self):
-        super(SportsEvent, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(SportsEvent, self)._as_dict(memoize)
         if self.event_metadata:
-            self.dict.update({
-                'eventMetadata': self.event_metadata.as_dict()
+            dict.update({
+                'eventMetadata': self.event_metadata.as_dict(memoize)
             })
         if self.event_stats_set:
-            self.dict.update({
-                'eventStats': self.event_stats_set.as_dict(),
+            dict.update({
+                'eventStats': self.event_stats_set.as_dict(memoize),
             })
         if self.teams:
-            self.dict.update({
-                'teams': self.teams.as_dict(),
+            dict.update({
+                'teams': self.teams.as_dict(memoize),
             })
         if self.players:
-            self.dict.update({
-                'players': self.players.as_dict(),
+            dict.update({
+                'players': self.players.as_dict(memoize),
             })
         if self.wagering_stats_set:
-            self.dict.update({
-                'wageringStats': self.wagering_stats_set.as_dict(),
+            dict.update({
+                'wageringStats': self.wagering_stats_set.as_dict(memoize),
             })
         if self.officials:
-            self.dict.update({
-                'officials': self.officials.as_dict(),
+            dict.update({
+                'officials': self.officials.as_dict(memoize),
             })
         if self.actions:
-            self.dict.update({
-                'actions': self.actions.as_dict(),
+            dict.update({
+                'actions': self.actions.as_dict(memoize),
             })
         if self.highlights:
-            self.dict.update({
-                'highlights': self.highlights.as_dict(),
+            dict.update({
+                'highlights': self.highlights.as_dict(memoize),
             })
         if self.awards:
-            self.dict.update({
-                'awards': self.awards.as_dict(),
+            dict.update({
+                'awards': self.awards.as_dict(memoize),
             })
         if self.sports_events:
-            self.dict.update({
-                'sportsEvents': self.sports_events.as_dict(),
+            dict.update({
+                'sportsEvents': self.sports_events.as_dict(memoize),
             })
-        return self.dict
+        return dict
 
 
 class SportsEvents(GenericArray):
@@ -152,7 +170,7 @@ class EventStats(CommonAttributes, CoverageAttributes):
     def __init__(self, **kwargs):
         super(SportsEvent, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             self.sports_properties = SportsProperties(
                 xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-property')
             )
@@ -170,9 +188,9 @@ class EventStatsSet(GenericArray):
 
 class Highlight(BaseObject):
     # TODO
-    pass
+    _empty = False
 
-    def as_dict(self):
+    def _as_dict(self, memoize):
         # TODO
         return None
 
@@ -209,21 +227,17 @@ class Award(CommonAttributes):
         'total': 'integer'
     }
 
-    def __init__(self,  **kwargs):
-        super(Award, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
- 
-    def as_dict(self):
-        super(Award, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'name': ('names', Names, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Award, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({
-                'names': self.names.as_dict()
+            dict.update({
+                'names': self.names.as_dict(memoize)
             })
-        return self.dict
+        return dict
 
 
 class Awards(GenericArray):
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .backends import is_element
+from .core import NEWSMLG2_NS, MANY, BaseObject, GenericArray
 from .base_metadata import BaseMetadata, CommonAttributes
 from .newsmlg2 import CatalogRefs, CatalogRef, ConceptNameType
 
@@ -16,17 +16,25 @@ class SportsTitles(GenericArray):
 
 class Advisory(CommonAttributes):
     advisory_text = None
+    text_attribute = 'advisory_text'
+    # as_dict always outputs the advisory text
+    _empty = False
 
     def __init__(self, **kwargs):
         super(Advisory, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             self.advisory_text = xmlelement.text
 
-    def as_dict(self):
-        super(Advisory, self).as_dict()
-        self.dict.update({'advisory': self.advisory_text })
-        return self.dict
+    def _load_dict(self, value, consume):
+        advisory_text = (value or {}).get('advisory')
+        super(Advisory, self)._load_dict(value, consume)
+        self.advisory_text = advisory_text
+
+    def _as_dict(self, memoize):
+        dict = super(Advisory, self)._as_dict(memoize)
+        dict.update({'advisory': self.advisory_text })
+        return dict
 
  
 class AdvisorySet(GenericArray):
@@ -76,34 +84,24 @@ class SportsMetadata(BaseMetadata):
         'fixture-key': 'fixtureKey',
     }
 
-    def __init__(self, **kwargs):
-        super(SportsMetadata, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.catalog_refs = CatalogRefs(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'catalogRef')
-            )
-            self.sports_titles = SportsTitles(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-title')
-            )
-            self.advisory = AdvisorySet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'advisory')
-            )
-            self.feature_names = FeatureNames(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'feature-name')
-            )
-
-    def as_dict(self):
-        dict = super(SportsMetadata, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'catalogRef': ('catalog_refs', CatalogRefs, MANY),
+        NEWSMLG2_NS+'sports-title': ('sports_titles', SportsTitles, MANY),
+        NEWSMLG2_NS+'advisory': ('advisory', AdvisorySet, MANY),
+        NEWSMLG2_NS+'feature-name': ('feature_names', FeatureNames, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(SportsMetadata, self)._as_dict(memoize)
         if self.catalog_refs:
-            self.dict.update({'catalogRefs': self.catalog_refs.as_dict() })
+            dict.update({'catalogRefs': self.catalog_refs.as_dict(memoize) })
         if self.sports_titles:
-            self.dict.update({'sportsTitles': self.sports_titles.as_dict() })
+            dict.update({'sportsTitles': self.sports_titles.as_dict(memoize) })
         if self.advisory:
-            self.dict.update({'advisory': self.advisory.as_dict() })
+            dict.update({'advisory': self.advisory.as_dict(memoize) })
         if self.feature_names:
-            self.dict.update({'featureNames': self.feature_names.as_dict() })
-        return self.dict
+            dict.update({'featureNames': self.feature_names.as_dict(memoize) })
+        return dict
 
 
 class SportsMetadataSet(GenericArray):
@@ -1,9 +1,8 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, GenericArray, BaseObject
+from .core import NEWSMLG2_NS, MANY, GenericArray, BaseObject
 from .base_metadata import BaseMetadata, CommonAttributes
 from .entities import Players, Teams
 
@@ -23,27 +22,23 @@ class Standing(CommonAttributes):
     standing_metadata = None
     teams = None
     players = None
+    # as_dict always outputs teams and players
+    _empty = False
     attributes = {
         # A displayable label describing this standing.
         'content-label': 'contentLabel'
     }
 
-    def __init__(self, **kwargs):
-        super(Standing, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.teams = Teams(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'team')
-            )
-            self.players = Standings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'players')
-            )
-
-    def as_dict(self):
-        super(Standing, self).as_dict()
-        self.dict.update({'teams': self.teams.as_dict() })
-        self.dict.update({'players': self.players.as_dict() })
-        return self.dict
+    children = {
+        NEWSMLG2_NS+'team': ('teams', Teams, MANY),
+        NEWSMLG2_NS+'players': ('players', 'Standings', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Standing, self)._as_dict(memoize)
+        dict.update({'teams': self.teams.as_dict(memoize) })
+        dict.update({'players': self.players.as_dict(memoize) })
+        return dict
 
 
 class Standings(GenericArray):
@@ -1,9 +1,9 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
 
-from .core import NEWSMLG2_NS, BaseObject, GenericArray
+from .backends import is_element
+from .core import NEWSMLG2_NS, ONE, MANY, BaseObject, GenericArray
 from .base_metadata import CommonAttributes, CoverageAttributes, BaseMetadata
 from .newsmlg2 import Names
 
@@ -32,45 +32,32 @@ class Statistic(CommonAttributes, CoverageAttributes):
         'content-label': 'contentLabel'
     }
 
-    def __init__(self, **kwargs):
-        super(Statistic, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            from .entities import Groups, Teams, Players, Associates
-            self.statistic_metadata = StatisticMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'statistic-metadata')
-            )
-            self.groups = Groups(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-property')
-            )
-            self.teams = Teams(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'team')
-            )
-            self.players = Players(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'player')
-            )
-            self.associates = Associates(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'associates')
-            )
-            self.status_changes = StatusChanges(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'status-change')
-            )
+    children = {
+        NEWSMLG2_NS+'statistic-metadata': ('statistic_metadata', StatisticMetadata, ONE),
+        NEWSMLG2_NS+'sports-property': ('groups', '.entities.Groups', MANY),
+        NEWSMLG2_NS+'team': ('teams', '.entities.Teams', MANY),
+        NEWSMLG2_NS+'player': ('players', '.entities.Players', MANY),
+        NEWSMLG2_NS+'associates': ('associates', '.entities.Associates', MANY),
+        NEWSMLG2_NS+'status-change': ('status_changes', 'StatusChanges', MANY),
+    }
+    # built on first use by SportsContent(lazy=True)
+    lazy_children = ('groups', 'teams', 'players', 'associates', 'status_changes')
  
-    def as_dict(self):
-        super(Statistic, self).as_dict()
+    def _as_dict(self, memoize):
+        dict = super(Statistic, self)._as_dict(memoize)
         if self.statistic_metadata:
-            self.dict.update({ 'statisticMetadata': self.statistic_metadata.as_dict() })
+            dict.update({ 'statisticMetadata': self.statistic_metadata.as_dict(memoize) })
         if self.groups:
-            self.dict.update({ 'groups': self.groups.as_dict() })
+            dict.update({ 'groups': self.groups.as_dict(memoize) })
         if self.teams:
-            self.dict.update({ 'teams': self.teams.as_dict() })
+            dict.update({ 'teams': self.teams.as_dict(memoize) })
         if self.players:
-            self.dict.update({ 'players': self.players.as_dict() })
+            dict.update({ 'players': self.players.as_dict(memoize) })
         if self.associates:
-            self.dict.update({ 'associates': self.associates.as_dict() })
+            dict.update({ 'associates': self.associates.as_dict(memoize) })
         if self.status_changes:
-            self.dict.update({ 'statusChanges': self.status_changes.as_dict() })
-        return self.dict
+            dict.update({ 'statusChanges': self.status_changes.as_dict(memoize) })
+        return dict
 
 
 class Statistics(GenericArray):
@@ -89,29 +76,21 @@ class BaseStats(CommonAttributes):
     sports_properties = None
     stats = None
 
-    def __init__(self, **kwargs):
-        super(BaseStats, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.ratings = Ratings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'rating')
-            )
-            self.sports_properties = Ratings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-property')
-            )
-            self.stats = GenericStats(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'stats')
-            )
-
-    def as_dict(self):
-        super(BaseStats, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'rating': ('ratings', 'Ratings', MANY),
+        NEWSMLG2_NS+'sports-property': ('sports_properties', 'Ratings', MANY),
+        NEWSMLG2_NS+'stats': ('stats', 'GenericStats', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(BaseStats, self)._as_dict(memoize)
         if self.ratings:
-            self.dict.update({ 'ratings': self.ratings.as_dict() })
+            dict.update({ 'ratings': self.ratings.as_dict(memoize) })
         if self.sports_properties:
-            self.dict.update({ 'sportsProperties': self.sports_properties.as_dict() })
+            dict.update({ 'sportsProperties': self.sports_properties.as_dict(memoize) })
         if self.stats:
-            self.dict.update({ 'stats': self.stats.as_dict() })
-        return self.dict
+            dict.update({ 'stats': self.stats.as_dict(memoize) })
+        return dict
         
 
 class GenericStatAttributes(BaseObject):
@@ -145,24 +124,18 @@ class GenericStat(GenericStatAttributes, CoverageAttributes):
     names = None
     stats = None
 
-    def __init__(self, **kwargs):
-        super(GenericStat, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.names = Names(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'name')
-            )
-            self.stats = GenericStats(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'stat')
-            )
-
-    def as_dict(self):
-        super(GenericStat, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'name': ('names', Names, MANY),
+        NEWSMLG2_NS+'stat': ('stats', 'GenericStats', MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(GenericStat, self)._as_dict(memoize)
         if self.names:
-            self.dict.update({ 'names': self.names.as_dict() })
+            dict.update({ 'names': self.names.as_dict(memoize) })
         if self.stats:
-            self.dict.update({ 'stats': self.stats.as_dict() })
-        return self.dict
+            dict.update({ 'stats': self.stats.as_dict(memoize) })
+        return dict
 
 
 class GenericStats(GenericArray):
@@ -252,24 +225,18 @@ class Base2Stats(BaseStats):
         'points': 'integer'
     }
 
-    def __init__(self, **kwargs):
-        super(Base2Stats, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.outcome_totals = OutcomeTotals(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'outcome-total')
-            )
-            self.outcome_results = OutcomeResults(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'outcome-result')
-            )
-
-    def as_dict(self):
-        super(Base2Stats, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'outcome-total': ('outcome_totals', OutcomeTotals, MANY),
+        NEWSMLG2_NS+'outcome-result': ('outcome_results', OutcomeResults, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Base2Stats, self)._as_dict(memoize)
         if self.outcome_totals:
-            self.dict.update({ 'outcomeTotals': self.outcome_totals.as_dict() })
+            dict.update({ 'outcomeTotals': self.outcome_totals.as_dict(memoize) })
         if self.outcome_results:
-            self.dict.update({ 'outcomeResults': self.outcome_results.as_dict() })
-        return self.dict
+            dict.update({ 'outcomeResults': self.outcome_results.as_dict(memoize) })
+        return dict
 
 
 class PenaltyStats(CommonAttributes):
@@ -383,30 +350,21 @@ class Base3Stats(Base2Stats, CoverageAttributes, StatAttributes):
     awards = None
     ranks = None
 
-    def __init__(self, **kwargs):
-        super(Base3Stats, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.penalty_stats_set = PenaltyStatsSet(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'penalty-stats')
-            )
-            from .sports_events import Awards
-            self.awards = Awards(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'award')
-            )
-            self.ranks = Ranks(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'rank')
-            )
-
-    def as_dict(self):
-        super(Base3Stats, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'penalty-stats': ('penalty_stats_set', PenaltyStatsSet, MANY),
+        NEWSMLG2_NS+'award': ('awards', '.sports_events.Awards', MANY),
+        NEWSMLG2_NS+'rank': ('ranks', Ranks, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Base3Stats, self)._as_dict(memoize)
         if self.penalty_stats_set:
-            self.dict.update({ 'penaltyStats': self.penalty_stats_set.as_dict() })
+            dict.update({ 'penaltyStats': self.penalty_stats_set.as_dict(memoize) })
         if self.awards:
-            self.dict.update({ 'awards': self.awards.as_dict() })
+            dict.update({ 'awards': self.awards.as_dict(memoize) })
         if self.ranks:
-            self.dict.update({ 'ranks': self.ranks.as_dict() })
-        return self.dict
+            dict.update({ 'ranks': self.ranks.as_dict(memoize) })
+        return dict
 
 
 
@@ -428,24 +386,18 @@ class BaseGenericEntityStats(Base3Stats):
         'events-played': 'integer'
     }
     
-    def __init__(self, **kwargs):
-        super(BaseGenericEntityStats, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.sub_scores = SubScores(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sub-score')
-            )
-            self.event_records = EventRecords(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'event-record')
-            )
-
-    def as_dict(self):
-        super(BaseGenericEntityStats, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'sub-score': ('sub_scores', SubScores, MANY),
+        NEWSMLG2_NS+'event-record': ('event_records', EventRecords, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(BaseGenericEntityStats, self)._as_dict(memoize)
         if self.sub_scores:
-            self.dict.update({'subScores': self.sub_scores.as_dict()})
+            dict.update({'subScores': self.sub_scores.as_dict(memoize)})
         if self.event_records:
-            self.dict.update({'eventRecords': self.event_records.as_dict() })
-        return self.dict
+            dict.update({'eventRecords': self.event_records.as_dict(memoize) })
+        return dict
 
 
 class BaseTeamStats(BaseGenericEntityStats):
@@ -508,7 +460,7 @@ class PlayerStats(BasePlayerStats):
     def __init__(self, **kwargs):
         super(PlayerStats, self).__init__(**kwargs)
         xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             pass
 
     """
@@ -528,9 +480,9 @@ class PlayerStats(BasePlayerStats):
                 </xs:choice>
 
     """
-    def as_dict(self):
-        super(PlayerStats, self).as_dict()
-        return self.dict
+    def _as_dict(self, memoize):
+        dict = super(PlayerStats, self)._as_dict(memoize)
+        return dict
 
 
 class PlayerStatsSet(GenericArray):
@@ -573,12 +525,15 @@ class StatusChanges(GenericArray):
 
 
 class WageringStats(BaseObject):
+    # TODO
+    _empty = False
+
     def __init__(self, **kwargs):
-        if type(xmlelement) == etree.Element:
+        if is_element(xmlelement):
             # TODO
             pass
 
-    def as_dict(self):
+    def _as_dict(self, memoize):
         # TODO
         return None
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+
+"""
+Columnar export of player and team stats.
+
+stats_table() turns the stats of every player (or team) in a document
+into columns, one row per player and period:
+
+    {
+        'event': ['vendevent:l.nhl.com-2014-e.30227', ...],
+        'team': ['l.nhl.com-t.3', ...],
+        'id': ['l.nhl.com-p.5', ...],
+        'period': [None, 'vendperiod:1', ...],
+        'spstat:score': array('q', [1, 0, ...]),
+        'spct:offense/spstat:points': array('q', [1, 0, ...]),
+        'spstat:time-played-total': ['16:41', '12:15', ...],
+        ...
+    }
+
+Rows come from the player-stats (or team-stats) elements: their stat
+attributes, named after the attribute, and their generic stats, named
+after the stat-type, prefixed with the class of the stat if it has one,
+and their sub-scores. Nested stats take the attributes they don't set
+from the stats around them. The period of a row is the
+temporal-unit-value that applies, or the period-value of a sub-score,
+None for stats covering the whole event.
+
+Each column is typed once: from 'attribute_types' or the value-type of
+its stats where they say, or else from the values themselves. Integer
+columns are array('q'), decimal columns array('d'), with NaN for
+missing values (integer columns with missing values, or values too big
+for 64 bits, become decimal). A value-type that isn't a number, such
+as xs:string, makes a column of strings.
+Other columns are lists of strings, with None for missing values.
+With numpy=True, every column is a NumPy array instead.
+"""
+
+import array
+
+from .actions import Actions
+from .base_metadata import CommonAttributes, CoverageAttributes
+from .entities import Team, Player
+from .sports_events import SportsEvent
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# columns identifying each row, by entity
+KEY_COLUMNS = {
+    'player': ('event', 'team', 'id', 'period'),
+    'team': ('event', 'id', 'period'),
+}
+
+# value-types (without their 'xs:' prefix) read as integers or decimals
+INTEGER_TYPES = frozenset((
+    'integer', 'int', 'long', 'short', 'byte', 'nonNegativeInteger',
+    'positiveInteger', 'nonPositiveInteger', 'negativeInteger',
+    'unsignedLong', 'unsignedInt', 'unsignedShort', 'unsignedByte',
+))
+DECIMAL_TYPES = frozenset(('decimal', 'float', 'double'))
+# range of the values of integer columns
+INT64_MIN = -2 ** 63
+INT64_MAX = 2 ** 63 - 1
+
+# attributes of player-stats and team-stats that aren't stats; the
+# coverage ones also apply to the generic stats inside them
+COVERAGE_ATTRIBUTES = frozenset(CoverageAttributes.get_attributes())
+NOT_STATS = COVERAGE_ATTRIBUTES | frozenset(CommonAttributes.get_attributes())
+
+_stat_attributes = {}
+
+
+def stats_table(sports_content, entity='player', numpy=False):
+    """
+    Return the stats of every player, or team with entity='team', in
+    `sports_content` as a dict of columns. See the module docstring.
+    """
+    if entity not in KEY_COLUMNS:
+        raise Exception(
+            "Unknown entity '" + str(entity) + "', use one of: " +
+            ', '.join(KEY_COLUMNS)
+        )
+    if numpy and np is None:
+        raise Exception("stats_table(numpy=True) needs NumPy to be installed.")
+    entity_class = Player if entity == 'player' else Team
+    stats_attribute = 'player_stats_set' if entity == 'player' else 'team_stats_set'
+
+    # raw values by row key, then by column
+    rows = {}
+    # declared type of the columns that have one
+    column_types = {}
+    for owner in _iter_objects(sports_content, entity_class):
+        stats_set = getattr(owner, stats_attribute, None)
+        if not stats_set:
+            continue
+        key = _row_key(owner, entity)
+        for entity_stats in stats_set.array_contents:
+            coverage = {
+                name: value for name, value in entity_stats.attr_values.items()
+                if name in COVERAGE_ATTRIBUTES and value
+            }
+            period = coverage.get('temporal-unit-value')
+            for xml_attribute, value, property_type in _attribute_stats(entity_stats):
+                # the first value found for a row and column is kept
+                rows.setdefault(key + (period,), {}).setdefault(xml_attribute, value)
+                if property_type:
+                    column_types.setdefault(xml_attribute, property_type)
+            for stat_attributes in _generic_stats(entity_stats.stats, coverage):
+                stat_type = stat_attributes.get('stat-type')
+                if not stat_type:
+                    continue
+                column = stat_type
+                if stat_attributes.get('class'):
+                    column = stat_attributes['class'] + '/' + stat_type
+                rows.setdefault(
+                    key + (stat_attributes.get('temporal-unit-value'),), {}
+                ).setdefault(column, stat_attributes.get('value'))
+                if stat_attributes.get('value-type'):
+                    column_types.setdefault(column, stat_attributes['value-type'])
+            # sub-scores give the score of each period-value
+            sub_scores = getattr(entity_stats, 'sub_scores', None)
+            if sub_scores:
+                for sub_score in sub_scores.array_contents:
+                    period_value = sub_score.attr_values.get('period-value')
+                    if not period_value:
+                        continue
+                    row = rows.setdefault(key + (period_value,), {})
+                    for xml_attribute, value in sub_score.attr_values.items():
+                        if xml_attribute != 'period-value':
+                            row.setdefault(xml_attribute, value)
+
+    columns = {}
+    for position, name in enumerate(KEY_COLUMNS[entity]):
+        columns[name] = [row_key[position] for row_key in rows]
+        if numpy:
+            columns[name] = np.array(columns[name], dtype=object)
+    stat_columns = {}
+    for row in rows.values():
+        for column in row:
+            stat_columns.setdefault(column, None)
+    for column in stat_columns:
+        columns[column] = _typed_column(
+            [row.get(column) for row in rows.values()],
+            column_types.get(column), numpy
+        )
+    return columns
+
+
+def _iter_objects(value, object_class):
+    """
+    Yield every object of `object_class` inside `value`, in document order.
+    Objects of that class and actions aren't looked into.
+    """
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, object_class):
+            yield node
+            continue
+        if isinstance(node, Actions):
+            continue
+        children = list(node._children())
+        children.reverse()
+        stack.extend(children)
+
+
+def _row_key(owner, entity):
+    event_key = None
+    team_id = None
+    node = owner._parent
+    while node is not None:
+        if team_id is None and isinstance(node, Team):
+            team_id = node.attr_values.get('id')
+        if isinstance(node, SportsEvent):
+            if node.event_metadata is not None:
+                event_key = node.event_metadata.attr_values.get('key')
+            break
+        node = node._parent
+    if entity == 'player':
+        return (event_key, team_id, owner.attr_values.get('id'))
+    return (event_key, owner.attr_values.get('id'))
+
+
+def _attribute_stats(entity_stats):
+    """
+    Yield (xml attribute, value, property type) for each stat attribute
+    set on `entity_stats`.
+    """
+    cls = type(entity_stats)
+    if cls not in _stat_attributes:
+        _stat_attributes[cls] = {
+            xml_attribute: property_type
+            for xml_attribute, json_property, property_type in cls._attribute_table
+            if xml_attribute not in NOT_STATS
+        }
+    stat_attributes = _stat_attributes[cls]
+    for xml_attribute, value in entity_stats.attr_values.items():
+        if xml_attribute in stat_attributes:
+            yield xml_attribute, value, stat_attributes[xml_attribute]
+
+
+def _generic_stats(generic_stats, inherited):
+    """
+    Yield the attributes of each stat in `generic_stats` and below, with
+    the attributes they don't set taken from the stats around them.
+    """
+    if not generic_stats:
+        return
+    for generic_stat in generic_stats.array_contents:
+        stat_attributes = dict(inherited)
+        stat_attributes.update(
+            (name, value) for name, value in generic_stat.attr_values.items() if value
+        )
+        if 'value' in generic_stat.attr_values:
+            yield stat_attributes
+        for nested in _generic_stats(generic_stat.stats, stat_attributes):
+            yield nested
+
+
+def _typed_column(values, declared_type, use_numpy):
+    # '' means no value
+    values = [value if value != '' else None for value in values]
+    present = [value for value in values if value is not None]
+    kind = None
+    if declared_type:
+        declared_type = declared_type.rpartition(':')[2]
+        if declared_type in INTEGER_TYPES:
+            kind = int
+        elif declared_type in DECIMAL_TYPES:
+            kind = float
+        else:
+            # such as xs:string, where "07" isn't the number 7
+            kind = str
+    converted = None
+    if kind is not str:
+        for candidate in ((kind,) if kind else (int, float)):
+            try:
+                converted = [candidate(value) for value in present]
+            except (TypeError, ValueError):
+                continue
+            kind = candidate
+            break
+        else:
+            kind = str
+    if kind is str:
+        if use_numpy:
+            return np.array(values, dtype=object)
+        return values
+    if kind is int and len(present) < len(values):
+        # no integer value stands for a missing value
+        kind = float
+    elif kind is int and any(
+        value < INT64_MIN or value > INT64_MAX for value in converted
+    ):
+        # too big for array('q')
+        kind = float
+    converted = iter(converted)
+    values = [
+        kind(next(converted)) if value is not None else float('nan')
+        for value in values
+    ]
+    if use_numpy:
+        return np.array(values, dtype=np.int64 if kind is int else np.float64)
+    return array.array('q' if kind is int else 'd', values)
@@ -1,8 +1,7 @@
 #!/usr/bin/env python
 
-import xml.etree.ElementTree as etree
 import json
-from .core import NEWSMLG2_NS, GenericArray, BaseObject
+from .core import NEWSMLG2_NS, ONE, MANY, GenericArray, BaseObject
 from .base_metadata import CommonAttributes, Base2Metadata
 from .sports_events import SportsEvents
 from .standings import Standings
@@ -79,34 +78,24 @@ class TournamentDivision(CommonAttributes):
     tournament_parts = None
     sports_events = None
 
-    def __init__(self, **kwargs):
-        super(TournamentDivision, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.tournament_division_metadata = TournamentDivisionMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'tournament-division-metadata')
-            )
-            self.standings = Standings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'standing')
-            )
-            self.tournament_parts = TournamentParts(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'tournament-part')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-
-    def as_dict(self):
-        super(TournamentDivision, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'tournament-division-metadata': ('tournament_division_metadata', TournamentDivisionMetadata, ONE),
+        NEWSMLG2_NS+'standing': ('standings', Standings, MANY),
+        NEWSMLG2_NS+'tournament-part': ('tournament_parts', 'TournamentParts', MANY),
+        NEWSMLG2_NS+'sports-event': ('sports_events', SportsEvents, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(TournamentDivision, self)._as_dict(memoize)
         if self.tournament_division_metadata:
-            self.dict.update({'tournamentDivisionMetadata': self.tournament_division_metadata.as_dict() })
+            dict.update({'tournamentDivisionMetadata': self.tournament_division_metadata.as_dict(memoize) })
         if self.standings:
-            self.dict.update({'standings': self.standings.as_dict() })
+            dict.update({'standings': self.standings.as_dict(memoize) })
         if self.tournament_parts:
-            self.dict.update({'tournamentParts': self.tournament_parts.as_dict() })
+            dict.update({'tournamentParts': self.tournament_parts.as_dict(memoize) })
         if self.sports_events:
-            self.dict.update({'sportsEvents': self.sports_events.as_dict() })
-        return self.dict
+            dict.update({'sportsEvents': self.sports_events.as_dict(memoize) })
+        return dict
 
 
 class TournamentPartMetadata(BaseTournamentMetadata):
@@ -140,34 +129,24 @@ class TournamentPart(CommonAttributes):
         'part-index': 'partIndex'
     }
 
-    def __init__(self, **kwargs):
-        super(TournamentPart, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.tournament_part_metadata = TournamentPartMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'tournament-part-metadata')
-            )
-            self.standings = Standings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'standings')
-            )
-            self.tournament_parts = TournamentParts(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'tournament-part')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-
-    def as_dict(self):
-        super(TournamentPart, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'tournament-part-metadata': ('tournament_part_metadata', TournamentPartMetadata, ONE),
+        NEWSMLG2_NS+'standings': ('standings', Standings, MANY),
+        NEWSMLG2_NS+'tournament-part': ('tournament_parts', 'TournamentParts', MANY),
+        NEWSMLG2_NS+'sports-event': ('sports_events', SportsEvents, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(TournamentPart, self)._as_dict(memoize)
         if self.tournament_part_metadata:
-            self.dict.update({'tournamentPartMetadata': self.tournament_part_metadata.as_dict() })
+            dict.update({'tournamentPartMetadata': self.tournament_part_metadata.as_dict(memoize) })
         if self.standings:
-            self.dict.update({'standings': self.standings.as_dict() })
+            dict.update({'standings': self.standings.as_dict(memoize) })
         if self.tournament_parts:
-            self.dict.update({'tournamentParts': self.tournament_parts.as_dict() })
+            dict.update({'tournamentParts': self.tournament_parts.as_dict(memoize) })
         if self.sports_events:
-            self.dict.update({'sportsEvents': self.sports_events.as_dict() })
-        return self.dict
+            dict.update({'sportsEvents': self.sports_events.as_dict(memoize) })
+        return dict
 
 
 class TournamentParts(GenericArray):
@@ -192,39 +171,27 @@ class Tournament(CommonAttributes):
     tournament_parts = None
     sports_events = None
 
-    def __init__(self, **kwargs):
-        super(Tournament, self).__init__(**kwargs)
-        xmlelement = kwargs.get('xmlelement')
-        if type(xmlelement) == etree.Element:
-            self.tournament_metadata = TournamentMetadata(
-                xmlelement = xmlelement.find(NEWSMLG2_NS+'tournament-metadata')
-            )
-            self.standings = Standings(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'standing')
-            )
-            self.tournament_divisions = TournamentDivisions(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'tournament-division')
-            )
-            self.tournament_parts = TournamentParts(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'tournament-part')
-            )
-            self.sports_events = SportsEvents(
-                xmlarray = xmlelement.findall(NEWSMLG2_NS+'sports-event')
-            )
-
-    def as_dict(self):
-        super(Tournament, self).as_dict()
+    children = {
+        NEWSMLG2_NS+'tournament-metadata': ('tournament_metadata', TournamentMetadata, ONE),
+        NEWSMLG2_NS+'standing': ('standings', Standings, MANY),
+        NEWSMLG2_NS+'tournament-division': ('tournament_divisions', TournamentDivisions, MANY),
+        NEWSMLG2_NS+'tournament-part': ('tournament_parts', TournamentParts, MANY),
+        NEWSMLG2_NS+'sports-event': ('sports_events', SportsEvents, MANY),
+    }
+
+    def _as_dict(self, memoize):
+        dict = super(Tournament, self)._as_dict(memoize)
         if self.tournament_metadata:
-            self.dict.update({'tournamentMetadata': self.tournament_metadata.as_dict() })
+            dict.update({'tournamentMetadata': self.tournament_metadata.as_dict(memoize) })
         if self.standings:
-            self.dict.update({'standings': self.standings.as_dict() })
+            dict.update({'standings': self.standings.as_dict(memoize) })
         if self.tournament_divisions:
-            self.dict.update({'tournamentDivisions': self.tournament_divisions.as_dict() })
+            dict.update({'tournamentDivisions': self.tournament_divisions.as_dict(memoize) })
         if self.tournament_parts:
-            self.dict.update({'tournamentParts': self.tournament_parts.as_dict() })
+            dict.update({'tournamentParts': self.tournament_parts.as_dict(memoize) })
         if self.sports_events:
-            self.dict.update({'sportsEvents': self.sports_events.as_dict() })
-        return self.dict
+            dict.update({'sportsEvents': self.sports_events.as_dict(memoize) })
+        return dict
 
 
 class Tournaments(GenericArray):
@@ -0,0 +1,23 @@
+#!/usr/bin/env python
+
+"""
+Handing work to a pool of worker processes.
+"""
+
+import collections
+
+
+def map_in_order(executor, function, items, max_pending, *args):
+    """
+    Yield function(item, *args) for each of `items`, in order, run by
+    `executor`. Only `max_pending` calls are in flight at once, so
+    `items` can be a generator that is never held in memory, and results
+    that haven't been read yet don't pile up.
+    """
+    pending = collections.deque()
+    for item in items:
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+        pending.append(executor.submit(function, item, *args))
+    while pending:
+        yield pending.popleft().result()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+
+"""
+Regression benchmark for as_dict on deeply nested documents.
+
+Times as_dict() on each file and counts how many times as_dict() is
+entered for every object. Each object should be serialised exactly
+once per export; a higher count means some truthiness check or guard
+is serialising subtrees again, which costs O(depth^2).
+
+Exits with status 1 if any object is serialised more than once.
+
+    $ python benchmarks/bench_as_dict.py
+"""
+
+import argparse
+import collections
+import os
+import sys
+import timeit
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML import SportsMLParser
+from SportsML.core import BaseObject
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+DEFAULT_FILES = ('tournament-cl-g2.xml', 'curling_worlds_tournament.xml')
+
+
+def all_subclasses(cls):
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from all_subclasses(subclass)
+
+
+def count_as_dict_calls(sports_content):
+    """
+    Run as_dict() once on `sports_content` and return a Counter of how
+    many times as_dict() was entered for each object (super() calls
+    within one object's as_dict are not counted).
+    """
+    counts = collections.Counter()
+    originals = {}
+
+    def make_wrapper(function):
+        def wrapper(self, *args, **kwargs):
+            # only count the entry point, not calls made through super()
+            if type(self).as_dict is wrapper:
+                counts[id(self)] += 1
+            return function(self, *args, **kwargs)
+        return wrapper
+
+    classes = set(all_subclasses(BaseObject)) | {BaseObject}
+    for cls in classes:
+        if 'as_dict' in vars(cls):
+            originals[cls] = vars(cls)['as_dict']
+    try:
+        for cls, function in originals.items():
+            cls.as_dict = make_wrapper(function)
+        # classes inheriting as_dict need their own entry-point wrapper
+        for cls in classes - set(originals):
+            cls.as_dict = make_wrapper(cls.as_dict)
+        sports_content.as_dict()
+    finally:
+        for cls in classes:
+            if cls in originals:
+                cls.as_dict = originals[cls]
+            else:
+                del cls.as_dict
+    return counts
+
+
+def run(filenames, number):
+    failed = False
+    for filename in filenames:
+        sports_content = SportsMLParser(filename).getSportsContent()
+        elapsed = min(timeit.repeat(sports_content.as_dict, number=number, repeat=3)) / number
+        counts = count_as_dict_calls(sports_content)
+        worst = max(counts.values())
+        print('%-32s as_dict %8.2f ms  objects %6d  calls %7d  max calls/object %d' % (
+            os.path.basename(filename), elapsed * 1000,
+            len(counts), sum(counts.values()), worst
+        ))
+        if worst > 1:
+            failed = True
+    return failed
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='as_dict regression benchmark')
+    parser.add_argument('filenames', nargs='*', help='files to benchmark (default: nested tournament samples)')
+    parser.add_argument('--number', type=int, default=5, help='as_dict calls per timing run')
+    args = parser.parse_args()
+    filenames = args.filenames or [
+        os.path.join(EXAMPLES_DIR, filename) for filename in DEFAULT_FILES
+    ]
+    sys.exit(1 if run(filenames, args.number) else 0)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""
+Parse throughput of each available XML backend over examples/xml.
+
+For every backend, reports the best time to parse the whole corpus into
+element trees only, and into SportsContent objects (what SportsMLParser
+does), as MB/s of XML read.
+
+    $ python benchmarks/bench_backends.py
+    $ python benchmarks/bench_backends.py --backend lxml
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML import SportsMLParser
+from SportsML.backends import available_backends, get_backend
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--backend', action='append', choices=available_backends(),
+        help='backend to time, can be repeated (default: all available)')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='timing runs per backend, the best one is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    files = sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.xml')))
+    megabytes = sum(os.path.getsize(filename) for filename in files) / 1e6
+    print('%d files, %.2f MB' % (len(files), megabytes))
+    print('%-8s %14s %14s' % ('backend', 'tree MB/s', 'objects MB/s'))
+    for name in args.backend or available_backends():
+        backend = get_backend(name)
+        tree_time = min(timeit.repeat(
+            lambda: [backend.parse(filename) for filename in files],
+            number=1, repeat=args.repeat
+        ))
+        objects_time = min(timeit.repeat(
+            lambda: [SportsMLParser(filename, backend=name) for filename in files],
+            number=1, repeat=args.repeat
+        ))
+        print('%-8s %14.2f %14.2f' % (
+            name, megabytes / tree_time, megabytes / objects_time
+        ))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
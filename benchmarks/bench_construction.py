@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+
+"""
+Micro-benchmark: per-object construction and as_dict cost for the
+classes that dominate play-by-play and stats documents.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_construction.py
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import xml.etree.ElementTree as etree
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML.actions import Action, Participant
+from SportsML.statistics import GenericStat
+
+SAMPLES = (
+    (Action, """<action xmlns="http://iptc.org/std/nar/2006-10-01/"
+        class="spactionclass:play" id="p.1" type="spichaction:shot"
+        period-value="1" period-time-elapsed="00:32" team-idref="t.3"
+        result="spichresult:saved" shot-type="spichshot:wrist"/>"""),
+    (Participant, """<participant xmlns="http://iptc.org/std/nar/2006-10-01/"
+        idref="l.nhl.com-p.8468685" team-idref="l.nhl.com-t.3"
+        role="spichrole:shooter"/>"""),
+    (GenericStat, """<stat xmlns="http://iptc.org/std/nar/2006-10-01/"
+        stat-type="spstat:events-played" value="9"/>"""),
+)
+
+
+def run(number, repeat):
+    for object_class, xml in SAMPLES:
+        xmlelement = etree.fromstring(xml)
+        construct = min(timeit.repeat(
+            lambda: object_class(xmlelement = xmlelement),
+            number=number, repeat=repeat
+        )) / number
+        instance = object_class(xmlelement = xmlelement)
+        as_dict = min(timeit.repeat(
+            instance.as_dict, number=number, repeat=repeat
+        )) / number
+        print('%-12s construct %7.2f us   as_dict %7.2f us' % (
+            object_class.__name__, construct * 1e6, as_dict * 1e6
+        ))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Per-object construction micro-benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs (best is reported)')
+    args = parser.parse_args()
+    run(args.number, args.repeat)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""
+Benchmark for building SportsContent objects from parsed XML.
+
+Each file in examples/xml is read into an ElementTree once; only the
+construction of the SportsML objects from that tree is timed, so the
+numbers reflect the cost of walking the tree and dispatching children.
+
+    $ python benchmarks/bench_parse.py
+    $ python benchmarks/bench_parse.py --repeat 10 examples/xml/soccer-*.xml
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+import xml.etree.ElementTree as etree
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML.core import NEWSMLG2_NS
+from SportsML.sports_content import SportsContent
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+
+
+def sports_content_element(filename):
+    root = etree.parse(filename).getroot()
+    if root.tag == NEWSMLG2_NS+'sports-content':
+        return root
+    return root.find('.//'+NEWSMLG2_NS+'sports-content')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('files', nargs='*',
+        help='XML files to build (default: every file in examples/xml)')
+    parser.add_argument('--number', type=int, default=5,
+        help='builds per timing run (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='timing runs per file, the best one is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.xml')))
+    total = 0.0
+    for filename in files:
+        xmlelement = sports_content_element(filename)
+        best = min(timeit.repeat(
+            lambda: SportsContent(xmlelement = xmlelement),
+            number=args.number, repeat=args.repeat
+        )) / args.number
+        total += best
+        print('%-45s %8.2f ms' % (os.path.basename(filename), best * 1000))
+    print('%-45s %8.2f ms' % ('total', total * 1000))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
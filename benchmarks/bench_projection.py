@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""
+Projected against full parses of the *-generic.xml box scores.
+
+For each file, reports the best time to parse it fully and with each
+projection, both with SportsMLParser (the XML is parsed, pruned, then
+built) and streaming with iter_events(), and how many objects each
+builds.
+
+    $ python benchmarks/bench_projection.py
+    $ python benchmarks/bench_projection.py examples/xml/soccer-match-g2-generic.xml
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML import SportsMLParser
+from SportsML.projection import Projection
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+PROJECTIONS = (
+    ('full', None),
+    ('scores', Projection(['sports-event/event-metadata', 'sports-event/team/team-stats'])),
+    ('actions', Projection(['sports-event/actions'])),
+    ('rosters', Projection([
+        'sports-event/team/team-metadata', 'sports-event/team/player/player-metadata'
+    ])),
+)
+
+
+def count_objects(value):
+    count = 0
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node._children())
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('files', nargs='*',
+        help='XML files to parse (default: examples/xml/*-generic*.xml)')
+    parser.add_argument('--repeat', type=int, default=5,
+        help='timing runs, the best one is reported (default: %(default)s)')
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*-generic*.xml')))
+    print('%-40s %-8s %10s %10s %9s' % ('file', 'include', 'parse ms', 'stream ms', 'objects'))
+    for filename in files:
+        with open(filename, 'rb') as fp:
+            data = fp.read()
+        for name, projection in PROJECTIONS:
+            parse = min(timeit.repeat(
+                lambda: SportsMLParser.from_bytes(data, include=projection),
+                number=1, repeat=args.repeat
+            ))
+            stream = min(timeit.repeat(
+                lambda: list(SportsMLParser.iter_events(filename, include=projection)),
+                number=1, repeat=args.repeat
+            ))
+            objects = count_objects(
+                SportsMLParser.from_bytes(data, include=projection).getSportsContent()
+            )
+            print('%-40s %-8s %10.2f %10.2f %9d' % (
+                os.path.basename(filename), name, parse * 1000, stream * 1000, objects
+            ))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+#!/usr/bin/env python
+
+"""
+Benchmark suite over examples/xml, with a baseline to compare against.
+
+For every document, parse (XML to SportsContent), as_dict and to_json
+are measured separately: best wall time, peak memory allocated while
+the step runs (tracemalloc, in a separate untimed run) and, for parse,
+the number of objects built. Synthetic documents made by replicating
+the actions of a play-by-play document (--scale) show how costs grow
+with the size of a document.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_suite.py run --output baseline.json
+    $ python benchmarks/bench_suite.py compare baseline.json
+    $ python benchmarks/bench_suite.py compare old.json new.json --threshold 0.1
+
+compare exits with status 1 if any measure is worse than the baseline
+by more than the threshold. Timings depend on the machine, so no
+baseline is kept in the repository: record it on the machine (or CI
+runner) that runs compare, from the code before the change.
+"""
+
+import argparse
+import copy
+import gc
+import glob
+import json
+import os
+import platform
+import sys
+import timeit
+import tracemalloc
+import xml.etree.ElementTree as etree
+
+# import the SportsML package of this checkout, without having to set PYTHONPATH
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from SportsML import SportsMLParser
+from SportsML.backends import available_backends
+from SportsML.core import NEWSMLG2_NS
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+# play-by-play document replicated by --scale
+SCALE_FILE = 'ice-hockey-plays-g2-generic.xml'
+STEPS = ('parse', 'as_dict', 'to_json')
+# measures compared, and the unit they are printed in
+MEASURES = (('time', 1e3, 'ms'), ('peak', 1e-6, 'MB'), ('objects', 1, ''))
+
+
+def count_objects(value):
+    """
+    Return the number of objects in the tree of `value`, `value` included.
+    """
+    count = 0
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node._children())
+    return count
+
+
+def replicate_actions(data, factor):
+    """
+    Return `data`, an XML document, with the actions of each sports-event
+    repeated `factor` times. Copies get new ids and sequence numbers, so
+    that ids stay unique in the document.
+    """
+    root = etree.fromstring(data)
+    for actions in root.iter(NEWSMLG2_NS+'actions'):
+        originals = list(actions)
+        for copy_number in range(1, factor):
+            for action in originals:
+                action = copy.deepcopy(action)
+                for element in action.iter():
+                    for name in ('id', 'sequence-number'):
+                        if element.get(name):
+                            element.set(name, element.get(name) + '-' + str(copy_number))
+                actions.append(action)
+    return etree.tostring(root, encoding='utf-8')
+
+
+def load_documents(filenames, scales):
+    """
+    Return a list of (name, XML as bytes) to benchmark.
+    """
+    documents = []
+    for filename in filenames:
+        with open(filename, 'rb') as fp:
+            documents.append((os.path.basename(filename), fp.read()))
+    if scales:
+        with open(os.path.join(EXAMPLES_DIR, SCALE_FILE), 'rb') as fp:
+            data = fp.read()
+        for factor in scales:
+            documents.append(('%s x%d' % (SCALE_FILE, factor), replicate_actions(data, factor)))
+    return documents
+
+
+def peak_memory(function):
+    """
+    Return the peak memory allocated while `function` runs, in bytes,
+    not counting what was already allocated before.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        function()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def measure(data, backend, repeat):
+    """
+    Return the measures of each step for `data`, an XML document.
+    """
+    sports_content = SportsMLParser.from_bytes(data, backend).getSportsContent()
+    steps = {
+        'parse': lambda: SportsMLParser.from_bytes(data, backend),
+        'as_dict': sports_content.as_dict,
+        'to_json': sports_content.to_json,
+    }
+    result = {'bytes': len(data)}
+    for step in STEPS:
+        result[step] = {
+            'time': min(timeit.repeat(steps[step], number=1, repeat=repeat)),
+            'peak': peak_memory(steps[step]),
+        }
+    result['parse']['objects'] = count_objects(sports_content)
+    return result
+
+
+def run(args):
+    if args.files:
+        filenames = args.files
+    else:
+        filenames = sorted(glob.glob(os.path.join(EXAMPLES_DIR, '*.xml')))
+    results = {
+        'python': platform.python_version(),
+        'backend': args.backend,
+        'repeat': args.repeat,
+        'documents': {},
+    }
+    print('%-45s %9s %9s %9s %9s %9s' % (
+        'document', 'parse ms', 'dict ms', 'json ms', 'peak MB', 'objects'
+    ))
+    for name, data in load_documents(filenames, args.scale):
+        document = measure(data, args.backend, args.repeat)
+        results['documents'][name] = document
+        print('%-45s %9.2f %9.2f %9.2f %9.2f %9d' % (
+            name, document['parse']['time'] * 1e3, document['as_dict']['time'] * 1e3,
+            document['to_json']['time'] * 1e3,
+            max(document[step]['peak'] for step in STEPS) / 1e6,
+            document['parse']['objects'],
+        ))
+    if args.scale:
+        print_growth(results['documents'], args.scale)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(results, fp, indent=2, sort_keys=True)
+            fp.write('\n')
+    return results
+
+
+def print_growth(documents, scales):
+    """
+    Print the cost of each scaled-up document relative to the original,
+    next to how much larger it is.
+    """
+    base = documents.get(SCALE_FILE)
+    if base is None:
+        return
+    print('\ngrowth relative to %s' % SCALE_FILE)
+    print('%-8s %9s %9s %9s %9s %9s' % ('scale', 'size', 'parse', 'as_dict', 'to_json', 'peak'))
+    for factor in scales:
+        document = documents['%s x%d' % (SCALE_FILE, factor)]
+        print('%-8s %8.2fx %8.2fx %8.2fx %8.2fx %8.2fx' % (
+            'x%d' % factor, document['bytes'] / base['bytes'],
+            *[document[step]['time'] / base[step]['time'] for step in STEPS],
+            max(document[step]['peak'] for step in STEPS) /
+            max(base[step]['peak'] for step in STEPS),
+        ))
+
+
+def compare(args):
+    with open(args.baseline) as fp:
+        baseline = json.load(fp)
+    if args.current:
+        with open(args.current) as fp:
+            current = json.load(fp)
+    else:
+        # run again whatever the baseline measured
+        scales = sorted(
+            int(name.rpartition(' x')[2]) for name in baseline['documents']
+            if name.startswith(SCALE_FILE + ' x')
+        )
+        files = [
+            os.path.join(EXAMPLES_DIR, name) for name in baseline['documents']
+            if ' x' not in name
+        ]
+        args.files, args.scale = files, scales
+        args.backend = baseline['backend']
+        args.output = None
+        current = run(args)
+        print()
+
+    regressions = 0
+    for name, old in sorted(baseline['documents'].items()):
+        new = current['documents'].get(name)
+        if new is None:
+            print('%-45s missing from the current results' % name)
+            continue
+        for step in STEPS:
+            for measure_name, factor, unit in MEASURES:
+                if measure_name not in old[step]:
+                    continue
+                before, after = old[step][measure_name], new[step][measure_name]
+                # differences of a fraction of a millisecond are noise
+                if measure_name == 'time' and after - before < args.min_time / 1e3:
+                    continue
+                if after > before * (1 + args.threshold):
+                    regressions += 1
+                    print('REGRESSION %-45s %-8s %-8s %10.2f%s -> %10.2f%s (%+.0f%%)' % (
+                        name, step, measure_name, before * factor, unit,
+                        after * factor, unit,
+                        (after / before - 1) * 100 if before else float('inf'),
+                    ))
+    print('%d regression(s) above %.0f%% against %s' % (
+        regressions, args.threshold * 100, args.baseline
+    ))
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = subparsers.add_parser('run', help='measure and print the results')
+    run_parser.add_argument('files', nargs='*',
+        help='XML files to measure (default: every file in examples/xml)')
+    run_parser.add_argument('--output', '-o',
+        help='also save the results as JSON to this file, e.g. a new baseline')
+    run_parser.add_argument('--scale', type=int, nargs='*', default=[2, 5, 10],
+        help='replicate the actions of ' + SCALE_FILE +
+             ' this many times (default: %(default)s)')
+
+    compare_parser = subparsers.add_parser('compare',
+        help='compare results with a baseline, exit status 1 on regressions')
+    compare_parser.add_argument('baseline', help='results saved by run --output')
+    compare_parser.add_argument('current', nargs='?',
+        help='results to compare (default: run the baseline documents again)')
+    compare_parser.add_argument('--threshold', type=float, default=0.25,
+        help='relative increase flagged as a regression (default: %(default)s)')
+    compare_parser.add_argument('--min-time', type=float, default=1.0,
+        help='time increases below this many ms are ignored (default: %(default)s)')
+
+    for subparser in (run_parser, compare_parser):
+        subparser.add_argument('--repeat', type=int, default=3,
+            help='timing runs per step, the best one is kept (default: %(default)s)')
+    run_parser.add_argument('--backend', default='etree', choices=available_backends(),
+        help='XML backend (default: %(default)s)')
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+        return 0
+    return compare(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -29,9 +29,19 @@ SportsML/SportsJS Python library - unit tests
 
 """
 
+import collections
+import os
 import unittest
+from unittest import mock
 import SportsML
 
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples', 'xml')
+
+
+def example_file(name):
+    return os.path.join(EXAMPLES_DIR, name)
+
+
 class TestStringMethods(unittest.TestCase):
 
     def test_parse_from_string(self):
@@ -75,5 +85,733 @@ class TestStringMethods(unittest.TestCase):
     ]
 }""")
 
+
+class TestParserInputs(unittest.TestCase):
+
+    def test_explicit_constructors(self):
+        filename = example_file('soccer-match-g2-generic.xml')
+        expected = SportsML.SportsMLParser(filename).getSportsContent().as_dict()
+        with open(filename, 'rb') as fp:
+            data = fp.read()
+        with open(filename, 'rb') as fp:
+            from_file = SportsML.SportsMLParser.from_file(fp)
+        for parser in (
+            SportsML.SportsMLParser.from_path(filename),
+            SportsML.SportsMLParser.from_bytes(data),
+            SportsML.SportsMLParser.from_bytes(memoryview(data)),
+            from_file,
+            SportsML.SportsMLParser.from_mmap(filename),
+        ):
+            self.assertEqual(parser.getSportsContent().as_dict(), expected)
+
+    def test_invalid_document(self):
+        with self.assertRaisesRegex(Exception, "doesn't seem to be a valid"):
+            SportsML.SportsMLParser.from_bytes(b'<html/>')
+
+
+class TestAttributeTables(unittest.TestCase):
+
+    def test_attribute_tables_merge_mro(self):
+        from SportsML.actions import Participant
+        attributes = Participant.get_attributes()
+        # own attributes first, then the base attribute groups in MRO order
+        self.assertEqual(
+            list(attributes)[:6],
+            ['idref', 'team-idref', 'role', 'id', 'class', 'style']
+        )
+        self.assertEqual(attributes['team-idref'], 'teamIdref')
+        self.assertEqual(attributes['score_credit'], 'scoreCredit')
+        self.assertIsInstance(Participant._attribute_table, tuple)
+
+    def test_only_set_attributes_are_stored(self):
+        import xml.etree.ElementTree as etree
+        from SportsML.statistics import GenericStat
+        stat = GenericStat(xmlelement = etree.fromstring(
+            '<stat xmlns="http://iptc.org/std/nar/2006-10-01/" '
+            'value="9" stat-type="spstat:events-played" undeclared="x"/>'
+        ))
+        self.assertEqual(stat.attr_values, {
+            'value': '9', 'stat-type': 'spstat:events-played'
+        })
+        # output keeps the declaration order
+        self.assertEqual(list(stat.as_dict()), ['statType', 'value'])
+
+    def test_children_tables_match_find_and_findall(self):
+        import xml.etree.ElementTree as etree
+        from SportsML.sports_events import SportsEvent
+        sports_event = SportsEvent(xmlelement = etree.fromstring(
+            '<sports-event xmlns="http://iptc.org/std/nar/2006-10-01/">'
+            '<team id="t1"/>'
+            '<event-metadata key="first"/>'
+            '<team id="t2"/>'
+            '<event-metadata key="second"/>'
+            '</sports-event>'
+        ))
+        # a single child comes from the first match, like find()
+        self.assertEqual(sports_event.event_metadata.attr_values, {'key': 'first'})
+        # repeated children keep document order, like findall()
+        self.assertEqual(
+            [team.attr_values['id'] for team in sports_event.teams.array_contents],
+            ['t1', 't2']
+        )
+        # children that are absent still get an empty object
+        self.assertFalse(sports_event.players)
+        self.assertIs(sports_event.players._parent, sports_event)
+
+
+class TestAsDict(unittest.TestCase):
+
+    def test_as_dict_serialises_each_object_once(self):
+        from SportsML.core import BaseObject
+        counts = collections.Counter()
+        original_as_dict = BaseObject.as_dict
+
+        def counting_as_dict(obj, *args):
+            counts[id(obj)] += 1
+            return original_as_dict(obj, *args)
+
+        for name in ('tournament-cl-g2.xml', 'curling_worlds_tournament.xml'):
+            sports_content = SportsML.SportsMLParser(
+                example_file(name)
+            ).getSportsContent()
+            counts.clear()
+            with mock.patch.object(BaseObject, 'as_dict', counting_as_dict):
+                sports_content.as_dict()
+            self.assertEqual(max(counts.values()), 1, name)
+
+    def test_truth_value_does_not_serialise(self):
+        from SportsML.core import BaseObject
+        sports_content = SportsML.SportsMLParser(
+            example_file('curling_worlds_tournament.xml')
+        ).getSportsContent()
+        tournament = sports_content.tournaments.array_contents[0]
+        with mock.patch.object(BaseObject, 'as_dict', side_effect=AssertionError):
+            self.assertTrue(tournament)
+            # no tournament-metadata element in this document
+            self.assertFalse(tournament.tournament_metadata)
+
+    def test_as_dict_is_fresh_by_default(self):
+        sports_content = SportsML.SportsMLParser(
+            example_file('tournament-cl-g2.xml')
+        ).getSportsContent()
+        first = sports_content.as_dict()
+        self.assertEqual(first, sports_content.as_dict())
+        self.assertIsNot(first, sports_content.as_dict())
+        self.assertNotIn('dict', vars(sports_content))
+
+    def test_memoized_as_dict_is_invalidated_by_setters(self):
+        from SportsML.entities import Teams
+        sports_content = SportsML.SportsMLParser(
+            example_file('soccer-match-g2-generic.xml')
+        ).getSportsContent()
+        sports_event = sports_content.sports_events.array_contents[0]
+        cached = sports_content.as_dict(memoize=True)
+        self.assertIs(cached, sports_content.as_dict(memoize=True))
+        self.assertIn('teams', cached['sportsEvents'][0])
+
+        sports_event.set_teams(Teams())
+        updated = sports_content.as_dict(memoize=True)
+        self.assertIsNot(cached, updated)
+        self.assertNotIn('teams', updated['sportsEvents'][0])
+        self.assertEqual(updated, sports_content.as_dict())
+
+
+class TestIdIndex(unittest.TestCase):
+
+    def test_participants_resolve_to_players(self):
+        sports_content = SportsML.SportsMLParser(
+            example_file('ice-hockey-plays-g2-generic.xml')
+        ).getSportsContent()
+        sports_event = sports_content.sports_events.array_contents[0]
+        players = {
+            player.attr_values['id']: player
+            for team in sports_event.teams.array_contents
+            for player in team.players.array_contents
+        }
+        action = next(
+            action for action in sports_event.actions.array_contents
+            if action.participants
+        )
+        participant = action.participants.array_contents[0]
+        self.assertIs(participant.resolve(), players[participant.attr_values['idref']])
+        self.assertEqual(
+            action.participants_resolved(),
+            [players.get(p.attr_values['idref']) for p in action.participants.array_contents]
+        )
+        self.assertIs(
+            participant.resolve_team(),
+            sports_content.get_by_id(participant.attr_values['team-idref'])
+        )
+
+    def test_index_matches_tree_walk_and_follows_setters(self):
+        from SportsML.tournaments import Tournaments
+        sports_content = SportsML.SportsMLParser(
+            example_file('tournament-cl-g2.xml')
+        ).getSportsContent()
+        self.assertEqual(sports_content._id_index, sports_content._build_id_index())
+        tournament = sports_content.tournaments.array_contents[0]
+        key = tournament.tournament_metadata.attr_values['key']
+        # metadata keys resolve to the object owning the metadata
+        self.assertIs(sports_content.get_by_id(key), tournament)
+        sports_content.set_tournaments(Tournaments())
+        self.assertIsNone(sports_content.get_by_id(key))
+
+    def test_duplicate_ids_follow_the_children_tables(self):
+        from SportsML.entities import Team
+        data = (
+            b'<sports-content xmlns="http://iptc.org/std/nar/2006-10-01/">'
+            b'<sports-event><player id="dup"/><team id="dup"/></sports-event>'
+            b'</sports-content>'
+        )
+        # a sports-event's teams come before its players, whatever the
+        # order of the XML, with or without lazy building
+        for lazy in (False, True):
+            sports_content = SportsML.SportsMLParser.from_bytes(
+                data, lazy=lazy
+            ).getSportsContent()
+            self.assertIsInstance(sports_content.get_by_id('dup'), Team)
+
+
+class TestDiff(unittest.TestCase):
+
+    def test_diff_addresses_changes_by_id(self):
+        with open(example_file('ice-hockey-plays-g2-generic.xml'), 'rb') as fp:
+            data = fp.read()
+        new = SportsML.SportsMLParser.from_bytes(data).getSportsContent()
+        # an earlier version of the feed, without its last action
+        start = data.rindex(b'<action ')
+        old = SportsML.SportsMLParser.from_bytes(
+            data[:start] + data[data.index(b'</actions>'):]
+        ).getSportsContent()
+        last_action = new.sports_events.array_contents[0].actions.array_contents[-1]
+        changes = old.diff(new)
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0]['op'], 'add')
+        self.assertTrue(changes[0]['path'].startswith('/sportsEvents/@key='))
+        self.assertTrue(changes[0]['path'].endswith(
+            '/actions/@id=' + last_action.attr_values['id']
+        ))
+        self.assertEqual(changes[0]['value'], last_action.as_dict())
+        self.assertEqual(
+            new.diff(SportsML.SportsMLParser.from_bytes(data).getSportsContent()), []
+        )
+
+    def test_diff_follows_setters(self):
+        from SportsML.tournaments import Tournaments
+        old = SportsML.SportsMLParser(example_file('tournament-cl-g2.xml')).getSportsContent()
+        new = SportsML.SportsMLParser(example_file('tournament-cl-g2.xml')).getSportsContent()
+        self.assertEqual(old.diff(new), [])
+        new.set_tournaments(Tournaments())
+        self.assertEqual(
+            old.diff(new), [{'op': 'remove', 'path': '/tournaments'}]
+        )
+
+
+class TestLiveSession(unittest.TestCase):
+
+    def test_update_builds_only_new_actions(self):
+        with open(example_file('ice-hockey-plays-g2-generic.xml'), 'rb') as fp:
+            data = fp.read()
+        start = data.rindex(b'<action ')
+        earlier = data[:start] + data[data.index(b'</actions>'):]
+        session = SportsML.LiveSession()
+        first = session.update(earlier)
+        first_event = first.sports_events.array_contents[0]
+        sports_content = session.update(data)
+        sports_event = sports_content.sports_events.array_contents[0]
+        self.assertEqual(session.stats['actions_built'], 1)
+        self.assertEqual(session.stats['teams_built'], 0)
+        self.assertIs(
+            sports_event.actions.array_contents[0], first_event.actions.array_contents[0]
+        )
+        self.assertIs(
+            sports_event.teams.array_contents[0], first_event.teams.array_contents[0]
+        )
+        self.assertEqual(
+            sports_content.to_json(),
+            SportsML.SportsMLParser.from_bytes(data).getSportsContent().to_json()
+        )
+        # the reused objects now belong to the new revision: the previous
+        # SportsContent must not be used any more
+        root = first_event.actions.array_contents[0]
+        while root._parent is not None:
+            root = root._parent
+        self.assertIs(root, sports_content)
+
+    def test_changed_players_are_rebuilt(self):
+        with open(example_file('ice-hockey-match-g2-generic.xml'), 'rb') as fp:
+            data = fp.read()
+        value = data.index(b'value="', data.index(b'<player ')) + len(b'value="')
+        changed = data[:value] + b'9' + data[value:]
+        session = SportsML.LiveSession()
+        session.update(data)
+        sports_content = session.update(changed)
+        self.assertEqual(session.stats['teams_built'], 1)
+        self.assertEqual(session.stats['players_built'], 1)
+        self.assertEqual(
+            sports_content.as_dict(),
+            SportsML.SportsMLParser.from_bytes(changed).getSportsContent().as_dict()
+        )
+
+
+class TestWriteJSON(unittest.TestCase):
+
+    def test_write_json_matches_to_json(self):
+        import io
+        import json
+        sports_content = SportsML.SportsMLParser(
+            example_file('ice-hockey-plays-g2-generic.xml')
+        ).getSportsContent()
+        pretty = io.StringIO()
+        sports_content.write_json(pretty, compact=False)
+        self.assertEqual(pretty.getvalue(), sports_content.to_json())
+        compact = io.BytesIO()
+        sports_content.write_json(compact)
+        self.assertEqual(
+            compact.getvalue().decode('utf-8'),
+            json.dumps(sports_content.as_dict(), separators=(',', ':'))
+        )
+
+
+class TestWriteXML(unittest.TestCase):
+
+    def test_write_xml_round_trips_every_example(self):
+        import io
+        for filename in sorted(os.listdir(EXAMPLES_DIR)):
+            with self.subTest(filename=filename):
+                sports_content = SportsML.SportsMLParser(
+                    example_file(filename)
+                ).getSportsContent()
+                output = io.BytesIO()
+                sports_content.write_xml(output)
+                self.assertEqual(
+                    SportsML.SportsMLParser.from_bytes(
+                        output.getvalue()
+                    ).getSportsContent().to_json(),
+                    sports_content.to_json()
+                )
+
+
+class TestFromJSON(unittest.TestCase):
+
+    def test_from_json_builds_the_same_objects(self):
+        import json
+        sports_content = SportsML.SportsMLParser(
+            example_file('ice-hockey-plays-g2-generic.xml')
+        ).getSportsContent()
+        output = sports_content.to_json()
+        loaded = SportsML.SportsContent.from_json(output)
+        self.assertEqual(loaded.to_json(), output)
+        self.assertEqual(
+            SportsML.SportsContent.from_dict(json.loads(output)).as_dict(),
+            sports_content.as_dict()
+        )
+        sports_event = loaded.sports_events.array_contents[0]
+        self.assertIsInstance(sports_event, SportsML.sports_events.SportsEvent)
+        action = sports_event.actions.array_contents[0]
+        self.assertIs(loaded.get_by_id(action.attr_values['id']), action)
+        self.assertEqual(loaded._id_index, loaded._build_id_index())
+
+
+class TestStatsTable(unittest.TestCase):
+
+    def test_stats_table_has_typed_columns(self):
+        import array
+        sports_content = SportsML.SportsMLParser(
+            example_file('ice-hockey-match-g2-generic.xml')
+        ).getSportsContent()
+        table = sports_content.stats_table()
+        self.assertEqual(len({len(column) for column in table.values()}), 1)
+        self.assertEqual(
+            list(table)[:4], ['event', 'team', 'id', 'period']
+        )
+        # one row per player and period
+        self.assertEqual(
+            len(set(zip(table['team'], table['id'], table['period']))),
+            len(table['id'])
+        )
+        self.assertIsInstance(table['spstat:score'], array.array)
+        self.assertIsInstance(table['spstat:time-played-total'], list)
+        teams = sports_content.stats_table(entity='team')
+        self.assertEqual(teams['spstat:score'], array.array('q', [1, 3]))
+        with self.assertRaises(Exception):
+            sports_content.stats_table(entity='official')
+
+    def test_stats_table_column_types(self):
+        import array
+        sports_content = SportsML.SportsMLParser("""<?xml version="1.0"?>
+        <sports-content xmlns="http://iptc.org/std/nar/2006-10-01/">
+          <sports-event>
+            <event-metadata key="e.1"/>
+            <team id="t.1">
+              <player id="p.1">
+                <player-stats>
+                  <stats>
+                    <stat stat-type="vendstat:shirt" value="07" value-type="xs:string"/>
+                    <stat stat-type="vendstat:big" value="99999999999999999999"/>
+                    <stat stat-type="vendstat:small" value="4"/>
+                  </stats>
+                </player-stats>
+              </player>
+            </team>
+          </sports-event>
+        </sports-content>
+        """).getSportsContent()
+        table = sports_content.stats_table()
+        self.assertEqual(table['vendstat:shirt'], ['07'])
+        self.assertEqual(table['vendstat:big'], array.array('d', [1e20]))
+        self.assertEqual(table['vendstat:small'], array.array('q', [4]))
+
+    def test_aggregate_over_documents(self):
+        import array
+        from SportsML.aggregate import aggregate
+        filename = example_file('ice-hockey-match-g2-generic.xml')
+        sports_content = SportsML.SportsMLParser(filename).getSportsContent()
+        table = sports_content.stats_table(entity='team')
+        totals = aggregate([filename], entity='team', by='id')
+        self.assertEqual(totals['keys']['id'], ['l.nhl.com-t.10', 'l.nhl.com-t.8'])
+        self.assertEqual(list(totals['games']), [1, 1])
+        self.assertEqual(list(totals['sum']['spstat:score']), [1.0, 3.0])
+        self.assertEqual(list(totals['per_game']['spstat:score']), [1.0, 3.0])
+        # the same event twice, such as two revisions of a match, is
+        # counted once: only the last revision's stats are used
+        for documents in ([filename, filename], [sports_content, table]):
+            self.assertEqual(aggregate(documents, entity='team', workers=2, chunk_size=1), totals)
+        revised = dict(table)
+        revised['spstat:score'] = array.array('q', [2, 3])
+        self.assertEqual(
+            list(aggregate([table, revised], entity='team')['sum']['spstat:score']), [2.0, 3.0]
+        )
+        # without an event key, each document is an event of its own
+        keyless = dict(table, event=[None] * len(table['event']))
+        self.assertEqual(list(aggregate([keyless, keyless], entity='team')['games']), [2, 2])
+
+    def test_aggregate_players_counts_periods_once(self):
+        import array
+        from SportsML.aggregate import aggregate
+        sports_content = SportsML.SportsMLParser(
+            example_file('ice-hockey-match-g2-generic.xml')
+        ).getSportsContent()
+        saves = 'spct:defense/spichstat:saves'
+        totals = aggregate([sports_content], by='id')
+        position = totals['keys']['id'].index('l.nhl.com-p.8473541')
+        # the whole-game row, not added to the rows of the periods
+        self.assertEqual(totals['sum'][saves][position], 27.0)
+        self.assertEqual(totals['games'][position], 1)
+        periods = aggregate([sports_content], by=('id', 'period'))
+        self.assertEqual(
+            [
+                (period, periods['sum'][saves][position])
+                for position, (player_id, period)
+                in enumerate(zip(periods['keys']['id'], periods['keys']['period']))
+                if player_id == 'l.nhl.com-p.8473541'
+            ],
+            [('vendperiod:1', 6.0), ('vendperiod:2', 16.0), ('vendperiod:3', 5.0), (None, 27.0)]
+        )
+        # players with stats for some periods only
+        table = sports_content.stats_table()
+        periods_only = {
+            column: [value for value, period in zip(values, table['period']) if period]
+            for column, values in table.items()
+        }
+        periods_only[saves] = array.array(table[saves].typecode, periods_only[saves])
+        totals = aggregate([periods_only], by='id')
+        position = totals['keys']['id'].index('l.nhl.com-p.8473541')
+        self.assertEqual(totals['sum'][saves][position], 27.0)
+
+
+class TestLazyChildren(unittest.TestCase):
+
+    def test_lazy_children_are_built_on_first_read(self):
+        filename = example_file('ice-hockey-plays-g2-generic.xml')
+        eager = SportsML.SportsMLParser(filename).getSportsContent()
+        lazy = SportsML.SportsMLParser(filename, lazy=True).getSportsContent()
+        event = lazy.sports_events.array_contents[0]
+        self.assertNotIn('actions', vars(event))
+        self.assertEqual(
+            event.event_metadata.as_dict(),
+            eager.sports_events.array_contents[0].event_metadata.as_dict()
+        )
+        self.assertIs(event.actions._parent, event)
+        self.assertIn('actions', vars(event))
+        self.assertEqual(lazy.as_dict(), eager.as_dict())
+        lazy = SportsML.SportsMLParser.from_path(filename, lazy=True).getSportsContent()
+        self.assertEqual(lazy.diff(eager), [])
+        self.assertEqual(lazy.get_by_id('p.1').as_dict(), eager.get_by_id('p.1').as_dict())
+
+
+class TestPeek(unittest.TestCase):
+
+    def test_peek_reads_the_header(self):
+        filename = example_file('ice-hockey-plays-classic-generic.xml')
+        sports_content = SportsML.SportsMLParser(filename).getSportsContent()
+        header = SportsML.SportsMLParser.peek(filename)
+        self.assertEqual(header.doc_id, 'xt.nhl.30227-EVS-20150513T225654-0400-FIN-FC0')
+        self.assertEqual(header.fixture_key, 'spfixt:action-summary')
+        self.assertEqual(header.event_key, 'vendevent:l.nhl.com-2014-e.30227')
+        self.assertEqual(header.as_dict(), {
+            'sportsMetadata': sports_content.sports_metadatas.array_contents[0].as_dict(),
+            'eventMetadata': sports_content.sports_events.array_contents[0].event_metadata.as_dict(),
+        })
+        with open(filename, 'rb') as fp:
+            # only the beginning of the document is needed
+            data = fp.read(20000)
+        self.assertEqual(SportsML.SportsMLParser.peek(data).as_dict(), header.as_dict())
+        # no sports-event: reading stops at the first standing
+        header = SportsML.SportsMLParser.peek(example_file('soccer-standings-classic-specific.xml'))
+        self.assertEqual(header.fixture_key, 'spfixt:standings')
+        self.assertIsNone(header.event_metadata)
+        with self.assertRaisesRegex(Exception, "doesn't seem to be a valid"):
+            SportsML.SportsMLParser.peek(b'<html/>')
+
+
+class TestEnvelope(unittest.TestCase):
+
+    def test_envelope_guid_and_version(self):
+        filename = example_file('ice-hockey-plays-g2-generic.xml')
+        guid = 'urn:newsml:sportsml.org:20160502:xt.nhl.30227-EVS-20150513T225654-0400-FIN-FC0'
+        parser = SportsML.SportsMLParser(filename)
+        self.assertEqual((parser.guid, parser.version), (guid, '1'))
+        header = SportsML.SportsMLParser.peek(filename)
+        self.assertEqual((header.guid, header.version), (guid, '1'))
+        push_parser = SportsML.SportsMLPushParser()
+        with open(filename, 'rb') as fp:
+            push_parser.feed(fp.read(1000))
+        self.assertEqual((push_parser.guid, push_parser.version), (guid, '1'))
+        parser = SportsML.SportsMLParser(example_file('ice-hockey-plays-classic-generic.xml'))
+        self.assertIsNone(parser.guid)
+
+    def test_streaming_skips_the_envelope(self):
+        data = (
+            b'<newsItem xmlns="http://iptc.org/std/nar/2006-10-01/" guid="urn:x" version="3">'
+            b'<contentMeta><action id="envelope"/></contentMeta>'
+            b'<contentSet>'
+            b'<inlineXML><nitf><action id="text"/></nitf></inlineXML>'
+            b'<inlineXML><sports-content><sports-event><actions>'
+            b'<action id="a1"/><action id="a2"/>'
+            b'</actions></sports-event></sports-content></inlineXML>'
+            b'</contentSet></newsItem>'
+        )
+        parser = SportsML.SportsMLPushParser(objects=('action',))
+        actions = []
+        for start in range(0, len(data), 7):
+            actions.extend(parser.feed(data[start:start + 7]))
+        actions.extend(parser.close())
+        self.assertEqual(
+            [action.attr_values['id'] for action in actions], ['a1', 'a2']
+        )
+        self.assertEqual(parser.version, '3')
+
+
+class TestProjection(unittest.TestCase):
+
+    def test_include_builds_only_the_paths(self):
+        filename = example_file('ice-hockey-match-g2-generic.xml')
+        full = SportsML.SportsMLParser(filename).getSportsContent()
+        include = ['sports-event/team/team-stats']
+        projected = SportsML.SportsMLParser(filename, include=include).getSportsContent()
+        self.assertFalse(projected.sports_metadatas)
+        event = projected.sports_events.array_contents[0]
+        self.assertFalse(event.event_metadata)
+        for team, full_team in zip(
+            event.teams.array_contents,
+            full.sports_events.array_contents[0].teams.array_contents
+        ):
+            self.assertEqual(team.attr_values, full_team.attr_values)
+            self.assertEqual(team.team_stats_set.as_dict(), full_team.team_stats_set.as_dict())
+            self.assertFalse(team.players)
+            self.assertFalse(team.team_metadata)
+        streamed = [
+            sports_event.as_dict()
+            for sports_event in SportsML.SportsMLParser.iter_events(filename, include=include)
+        ]
+        self.assertEqual(streamed, projected.sports_events.as_dict())
+        # a shorter path takes everything below it
+        from SportsML.projection import Projection
+        self.assertEqual(
+            Projection(['sports-event/team/team-stats', 'sports-event']).plan,
+            Projection(['sports-event']).plan
+        )
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def test_counts_objects_and_restores_methods(self):
+        from SportsML import instrumentation
+        from SportsML.actions import Action
+        filename = example_file('ice-hockey-plays-g2-generic.xml')
+        expected = SportsML.SportsMLParser(filename).getSportsContent().as_dict()
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            self.assertTrue(instrumentation.is_enabled())
+            sports_content = SportsML.SportsMLParser(filename).getSportsContent()
+            self.assertEqual(sports_content.as_dict(), expected)
+        finally:
+            instrumentation.disable()
+        counters = instrumentation.snapshot()
+        actions = counters['SportsML.actions.Action']
+        self.assertEqual(
+            actions['built'], len(sports_content.sports_events.array_contents[0].actions.array_contents)
+        )
+        self.assertEqual(actions['as_dict_calls'], actions['built'])
+        self.assertLessEqual(actions['init_self_time'], actions['init_time'])
+        self.assertEqual(counters['SportsML.sports_content.SportsContent']['built'], 1)
+        self.assertNotIn('__init__', vars(Action))
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot(), {})
+
+    def test_counts_classes_defined_later(self):
+        import xml.etree.ElementTree as etree
+        from SportsML import instrumentation
+        from SportsML.actions import Action
+        instrumentation.reset()
+        instrumentation.enable()
+        try:
+            class KeyAction(Action):
+                pass
+
+            KeyAction(xmlelement = etree.fromstring(
+                '<action xmlns="http://iptc.org/std/nar/2006-10-01/" id="a1"/>'
+            )).as_dict()
+        finally:
+            instrumentation.disable()
+        counters = instrumentation.snapshot()
+        name = __name__ + '.' + KeyAction.__qualname__
+        self.assertEqual(counters[name]['built'], 1)
+        self.assertEqual(counters[name]['as_dict_calls'], 1)
+        self.assertNotIn('SportsML.actions.Action', counters)
+        self.assertNotIn('__init__', vars(KeyAction))
+        instrumentation.reset()
+
+
+class TestInterning(unittest.TestCase):
+
+    def test_documents_share_repeated_values(self):
+        from SportsML import interning
+        filename = example_file('ice-hockey-match-g2-generic.xml')
+        expected = SportsML.SportsMLParser(filename).getSportsContent().as_dict()
+        interning.enable()
+        try:
+            first, second = [
+                SportsML.SportsMLParser(filename).getSportsContent() for copy in range(2)
+            ]
+            stats = interning.stats()
+            # the table is emptied whenever it outgrows its maximum size
+            interning.enable(max_size=100)
+            SportsML.SportsMLParser(filename)
+            bounded_stats = interning.stats()
+        finally:
+            interning.disable()
+        self.assertEqual(first.as_dict(), expected)
+        self.assertEqual(second.as_dict(), expected)
+        first_status = first.sports_events.array_contents[0].event_metadata.attr_values['event-status']
+        second_status = second.sports_events.array_contents[0].event_metadata.attr_values['event-status']
+        self.assertIs(first_status, second_status)
+        self.assertGreater(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['resets'], 0)
+        self.assertGreater(bounded_stats['resets'], 0)
+        self.assertLessEqual(bounded_stats['size'], 100)
+        self.assertIsNone(interning.stats())
+
+
+class TestStreaming(unittest.TestCase):
+
+    def test_iter_events_matches_full_parse(self):
+        filename = example_file('tournament-cl-g2.xml')
+        full = SportsML.SportsMLParser(filename).getSportsContent()
+        expected = []
+
+        def collect(parts):
+            for part in parts.array_contents:
+                expected.extend(part.sports_events.as_dict())
+                collect(part.tournament_parts)
+
+        for tournament in full.tournaments.array_contents:
+            collect(tournament.tournament_parts)
+        streamed = [
+            event.as_dict()
+            for event in SportsML.SportsMLParser.iter_events(filename)
+        ]
+        self.assertEqual(streamed, expected)
+
+    def test_iter_actions_matches_full_parse(self):
+        filename = example_file('ice-hockey-plays-g2-generic.xml')
+        full = SportsML.SportsMLParser(filename).getSportsContent()
+        event = full.sports_events.array_contents[0]
+        streamed = [
+            action.as_dict()
+            for action in SportsML.SportsMLParser.iter_actions(filename)
+        ]
+        self.assertEqual(streamed, event.actions.as_dict())
+
+    def test_push_parser_emits_objects_as_they_complete(self):
+        filename = example_file('ice-hockey-plays-g2-generic.xml')
+        full = SportsML.SportsMLParser(filename).getSportsContent()
+        event = full.sports_events.array_contents[0]
+        with open(filename, 'rb') as fp:
+            data = fp.read()
+        parser = SportsML.SportsMLPushParser()
+        emitted = []
+        for start in range(0, len(data), 1000):
+            emitted.append(parser.feed(data[start:start + 1000]))
+        emitted.append(parser.close())
+        # actions come out while the document is still being fed
+        self.assertTrue(any(emitted[:len(emitted) // 2]))
+        objects = [obj for chunk in emitted for obj in chunk]
+        self.assertEqual(
+            [obj.as_dict() for obj in objects[:-1]], event.actions.as_dict()
+        )
+        self.assertEqual(objects[-1].as_dict(), event.as_dict())
+        filename = example_file('soccer-standings-g2-specific.xml')
+        with open(filename, 'rb') as fp:
+            parser = SportsML.SportsMLPushParser(objects=('standing',))
+            standings = parser.feed(fp.read()) + parser.close()
+        self.assertEqual(
+            [standing.as_dict() for standing in standings],
+            SportsML.SportsMLParser(filename).getSportsContent().standings.as_dict()
+        )
+
+    def test_push_parser_names_the_incomplete_subtree(self):
+        with open(example_file('ice-hockey-plays-g2-generic.xml'), 'rb') as fp:
+            data = fp.read()
+        parser = SportsML.SportsMLPushParser()
+        parser.feed(data[:len(data) // 2])
+        with self.assertRaisesRegex(
+            Exception, r"end of the sports-event\[vendevent:l.nhl.com-2014-e.30227\]"
+        ):
+            parser.close()
+
+    def test_push_parser_reports_malformed_documents(self):
+        with open(example_file('ice-hockey-plays-g2-generic.xml'), 'rb') as fp:
+            data = fp.read()
+        for backend in SportsML.backends.available_backends():
+            parser = SportsML.SportsMLPushParser(backend=backend)
+            # a syntax error, not a document cut short
+            with self.assertRaises(SyntaxError, msg=backend):
+                parser.feed(data[:500] + b'<<garbage')
+                parser.close()
+
+
+
+class TestBackends(unittest.TestCase):
+
+    @unittest.skipUnless(
+        'lxml' in SportsML.backends.available_backends(), 'lxml is not installed'
+    )
+    def test_lxml_backend_gives_the_same_objects(self):
+        for name in ('soccer-match-g2-generic.xml', 'tournament-cl-g2.xml'):
+            filename = example_file(name)
+            self.assertEqual(
+                SportsML.SportsMLParser(filename, backend='lxml').getSportsContent().as_dict(),
+                SportsML.SportsMLParser(filename).getSportsContent().as_dict(),
+                name
+            )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(Exception):
+            SportsML.SportsMLParser(example_file('golf-tour.xml'), backend='sax')
+
+
 if __name__ == '__main__':
     unittest.main()
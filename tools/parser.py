@@ -1,14 +1,218 @@
 #!/usr/bin/env python
 
+"""
+Convert SportsML XML to SportsJS JSON.
+
+    $ tools/parser.py examples/xml/golf-tour.xml
+    $ tools/parser.py batch --output-dir out/ examples/xml
+    $ tools/parser.py batch --ndjson all.ndjson 'feeds/2019-*/*.xml'
+"""
+
 import argparse
+import concurrent.futures
+import glob
+import io
+import os
+import sys
+import time
+
 from SportsML import SportsMLParser
+from SportsML.backends import BACKENDS
+from SportsML.workers import map_in_order
 
-if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Load SportsML instance file')
+
+def convert_file(source, destination, backend, compact):
+    """
+    Convert `source` and write it to the file `destination`, or return
+    its compact JSON when `destination` is None.
+    """
+    sports_content = SportsMLParser.from_path(
+        source, backend=backend
+    ).getSportsContent()
+    if destination is None:
+        output = io.StringIO()
+        sports_content.write_json(output, compact=True)
+        return output.getvalue()
+    os.makedirs(os.path.dirname(destination) or '.', exist_ok=True)
+    with open(destination, 'w', encoding='utf-8') as fp:
+        sports_content.write_json(fp, compact=compact)
+        fp.write('\n')
+    return None
+
+
+def convert_chunk(tasks, backend, compact):
+    """
+    Convert every (source, destination) pair in `tasks`. Runs in a
+    worker process. A failing file doesn't stop the others: each result
+    is (source, size, json or None, error message or None).
+    """
+    results = []
+    for source, destination in tasks:
+        try:
+            size = os.path.getsize(source)
+            results.append(
+                (source, size, convert_file(source, destination, backend, compact), None)
+            )
+        except Exception as e:
+            results.append((source, 0, None, '%s: %s' % (type(e).__name__, e)))
+    return results
+
+
+def find_sources(paths):
+    """
+    Yield (XML file, path to write its JSON to, relative to the output
+    directory) for each file, directory (searched recursively for .xml
+    files) or glob pattern in `paths`. Files keep their path relative to
+    the directory, or to the part of the pattern before its first
+    wildcard.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, dirnames, filenames in os.walk(path):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.endswith('.xml'):
+                        source = os.path.join(directory, filename)
+                        yield source, os.path.relpath(source, path)
+        elif glob.has_magic(path):
+            base = glob_base(path)
+            for source in sorted(glob.glob(path)):
+                yield source, os.path.relpath(source, base)
+        else:
+            yield path, os.path.basename(path)
+
+
+def glob_base(pattern):
+    """
+    Return the directory `pattern` starts with, up to the first
+    component with a wildcard.
+    """
+    base = []
+    for component in os.path.dirname(pattern).split(os.sep):
+        if glob.has_magic(component):
+            break
+        base.append(component)
+    return os.sep.join(base) or os.curdir
+
+
+def chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def batch(args):
+    if args.ndjson == '-':
+        ndjson = sys.stdout
+    elif args.ndjson:
+        ndjson = open(args.ndjson, 'w', encoding='utf-8')
+    else:
+        ndjson = None
+
+    # output file: source written to it, to stop before a file is overwritten
+    destinations = {}
+    collision = []
+
+    def tasks():
+        for source, relative_path in find_sources(args.paths):
+            if ndjson:
+                yield source, None
+                continue
+            destination = os.path.normpath(os.path.join(
+                args.output_dir, os.path.splitext(relative_path)[0] + '.json'
+            ))
+            if destination in destinations:
+                collision.append((destinations[destination], source, destination))
+                return
+            destinations[destination] = source
+            yield source, destination
+
+    workers = args.workers or os.cpu_count() or 1
+    converted = failed = total_size = 0
+    start = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        results = map_in_order(
+            executor, convert_chunk, chunks(tasks(), args.chunk_size),
+            4 * workers, args.backend, args.compact
+        )
+        for chunk_results in results:
+            for source, size, output, error in chunk_results:
+                if error:
+                    failed += 1
+                    sys.stderr.write('%s: %s\n' % (source, error))
+                    continue
+                converted += 1
+                total_size += size
+                if ndjson:
+                    ndjson.write(output)
+                    ndjson.write('\n')
+    if ndjson and ndjson is not sys.stdout:
+        ndjson.close()
+
+    elapsed = time.perf_counter() - start
+    sys.stderr.write(
+        '%d files converted, %d failed, %.2f MB in %.2f s: '
+        '%.1f files/s, %.2f MB/s\n' % (
+            converted, failed, total_size / 1e6, elapsed,
+            converted / elapsed, total_size / 1e6 / elapsed
+        )
+    )
+    if collision:
+        sys.stderr.write(
+            'Stopped: %s and %s would both be written to %s\n' % collision[0]
+        )
+        return 1
+    return 1 if failed else 0
+
+
+def batch_main(argv):
+    parser = argparse.ArgumentParser(
+        prog='parser.py batch',
+        description='Convert many SportsML instance files in parallel'
+    )
+    parser.add_argument('paths', nargs='+',
+        help='files, directories (searched for .xml files) or glob patterns')
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument('--output-dir',
+        help='write one .json file per input file into this directory')
+    output.add_argument('--ndjson',
+        help="write one compact JSON document per line to this file ('-' for stdout)")
+    parser.add_argument('--workers', type=int, default=None,
+        help='worker processes (default: one per CPU)')
+    parser.add_argument('--chunk-size', type=int, default=16,
+        help='files handed to a worker at a time (default: %(default)s)')
+    parser.add_argument('--backend', choices=BACKENDS,
+        help='XML backend to parse with (default: etree)')
+    parser.add_argument('--compact', action='store_true',
+        help='write compact JSON instead of pretty-printing it')
+    return batch(parser.parse_args(argv))
+
+
+def main(argv):
+    if argv and argv[0] == 'batch':
+        return batch_main(argv[1:])
+
+    parser = argparse.ArgumentParser(description='Load SportsML instance file',
+        epilog="Use 'parser.py batch --help' to convert many files at once.")
     parser.add_argument('filename', help='file to be loaded')
-    args = parser.parse_args()
+    parser.add_argument('--backend', choices=BACKENDS,
+        help='XML backend to parse with (default: etree)')
+    parser.add_argument('--compact', action='store_true',
+        help='write compact JSON instead of pretty-printing it')
+    args = parser.parse_args(argv)
 
-    parser = SportsMLParser(args.filename)
+    parser = SportsMLParser(args.filename, backend=args.backend)
 
     sports_content = parser.getSportsContent()
-    print(sports_content.to_json())
+    sports_content.write_json(sys.stdout, compact=args.compact)
+    sys.stdout.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))